@@ -35,6 +35,7 @@ setup(
         "fakeredis",
         "pytz",
         "pyotp",
+        "jwcrypto",
     ],
     package_data={
         "spaceone": [
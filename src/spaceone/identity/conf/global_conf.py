@@ -55,10 +55,32 @@ IDENTITY = {
         "token_max_timeout": 604800,  # 7 days
         "refresh_timeout": 10800,  # 3 hours
         "admin_refresh_max_timeout": 2419200,  # 28 days
+        "access_snapshot_timeout": 3600,  # 1 hour (0: disabled)
+        "compact_projects": False,  # public_projects flag + private projects only
+        "signing_algorithm": "RS256",  # RS256 | ES256 | EdDSA
+        "domain_signing_algorithms": {},  # {domain_id: algorithm}
+        # ES256 and EdDSA require every service to verify them (upgrade them first)
+        "allow_non_rs256_signing": False,
     },
     "mfa": {"verify_code_timeout": 300},
     "max_issue_attempts": 10,
     "issue_block_time": 300,
+    "last_accessed_at": {"flush_interval": 10},  # seconds (0: write immediately)
+    "domain_key_pool": {"size": 0},  # pre-generated key pairs (0: disabled)
+    "role_binding_cache": {"local_ttl": 5},  # seconds (0: shared cache only)
+    "account_sync": {
+        "lazy_sync": False,  # skip last_synced_at of unchanged resources
+        "secret_push_workers": 4,  # concurrent Secret service calls per sync job
+        "secret_data_hash_max_age": 86400,  # seconds a pushed secret hash is trusted
+    },
+    "password_cipher": {
+        "executor": None,  # None (inline) | THREAD | PROCESS
+        "max_workers": 2,
+        "max_queue_size": 16,
+        "fail_fast": False,
+        "timeout": 30,
+        "stats_log_interval": 60,  # seconds (0: disabled)
+    },
 }
 
 # Handler Settings
@@ -151,3 +173,6 @@ IDENTITY_BASE_URL = ""
 # Expiring App Check Days Settings
 EXPIRING_APP_CHECK_HOUR = 0
 EXPIRING_APP_CHECK_DAYS = []
+
+# Workspace User Count Reconcile Settings
+WORKSPACE_USER_COUNT_RECONCILE_HOUR = 15
@@ -27,3 +27,7 @@ class ERROR_UPDATE_PASSWORD_REQUIRED(ERROR_INVALID_ARGUMENT):
 
 class ERROR_LOGIN_BLOCKED(ERROR_AUTHENTICATE_FAILURE):
     _message = "Login is blocked. Please try again later."
+
+
+class ERROR_PASSWORD_CIPHER_BUSY(ERROR_UNAVAILAVBLE):
+    _message = "Too many password requests are in progress. Please try again later."
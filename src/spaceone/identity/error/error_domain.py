@@ -7,3 +7,7 @@ class ERROR_DOMAIN_STATE(ERROR_INVALID_ARGUMENT):
 
 class ERROR_DOMAIN_ADMIN_ROLE_IS_NOT_DEFINED(ERROR_UNKNOWN):
     _message = "Domain admin role is not defined."
+
+
+class ERROR_SIGNING_ALGORITHM_NOT_ALLOWED(ERROR_INVALID_ARGUMENT):
+    _message = "Signing algorithm is not allowed until all services can verify it. (algorithm = {algorithm}, domain_id = {domain_id})"
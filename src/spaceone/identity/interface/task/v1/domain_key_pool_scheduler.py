@@ -0,0 +1,53 @@
+import logging
+from datetime import datetime
+
+from spaceone.core.error import ERROR_CONFIGURATION
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.locator import Locator
+from spaceone.core.scheduler import IntervalScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DomainKeyPoolScheduler(IntervalScheduler):
+    def __init__(self, queue, interval):
+        super().__init__(queue, interval)
+        self.locator = Locator()
+        self._init_config()
+
+    def _init_config(self):
+        self._token = config.get_global("TOKEN")
+        if self._token is None:
+            raise ERROR_CONFIGURATION(key="TOKEN")
+
+        identity_conf = config.get_global("IDENTITY") or {}
+        self._pool_size = identity_conf.get("domain_key_pool", {}).get("size", 0)
+
+    def create_task(self) -> list:
+        tasks = []
+        tasks.extend(self._create_domain_key_pool_task())
+        return tasks
+
+    def _create_domain_key_pool_task(self):
+        if self._pool_size > 0:
+            stp = {
+                "name": "domain_key_pool_schedule",
+                "version": "v1",
+                "executionEngine": "BaseWorker",
+                "stages": [
+                    {
+                        "locator": "SERVICE",
+                        "name": "DomainService",
+                        "metadata": {"token": self._token},
+                        "method": "fill_domain_key_pool",
+                        "params": {"params": {}},
+                    }
+                ],
+            }
+            print(
+                f"{utils.datetime_to_iso8601(datetime.utcnow())} [INFO] [create_task] fill_domain_key_pool => START"
+            )
+            return [stp]
+        else:
+            return []
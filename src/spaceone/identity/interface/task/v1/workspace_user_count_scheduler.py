@@ -0,0 +1,60 @@
+import logging
+from datetime import datetime
+
+from spaceone.core.error import ERROR_CONFIGURATION
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.locator import Locator
+from spaceone.core.scheduler import HourlyScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WorkspaceUserCountScheduler(HourlyScheduler):
+    def __init__(self, queue, interval, minute=":45"):
+        super().__init__(queue, interval, minute)
+        self.locator = Locator()
+        self._init_config()
+
+    def _init_config(self):
+        self._token = config.get_global("TOKEN")
+        if self._token is None:
+            raise ERROR_CONFIGURATION(key="TOKEN")
+        self._reconcile_hour = config.get_global(
+            "WORKSPACE_USER_COUNT_RECONCILE_HOUR", 15
+        )
+
+    def create_task(self) -> list:
+        tasks = []
+        tasks.extend(self._create_reconcile_task())
+        return tasks
+
+    def _create_reconcile_task(self):
+        current_hour = datetime.utcnow().hour
+        if current_hour == self._reconcile_hour:
+            stp = {
+                "name": "workspace_user_count_schedule",
+                "version": "v1",
+                "executionEngine": "BaseWorker",
+                "stages": [
+                    {
+                        "locator": "SERVICE",
+                        "name": "JobService",
+                        "metadata": {"token": self._token},
+                        "method": "reconcile_workspace_user_count",
+                        "params": {"params": {}},
+                    }
+                ],
+            }
+            print(
+                f"{utils.datetime_to_iso8601(datetime.utcnow())} [INFO] [create_task] reconcile_workspace_user_count => START"
+            )
+            return [stp]
+        else:
+            print(
+                f"{utils.datetime_to_iso8601(datetime.utcnow())} [INFO] [create_task] reconcile_workspace_user_count => SKIP"
+            )
+            print(
+                f"{utils.datetime_to_iso8601(datetime.utcnow())} [INFO] [create_task] reconcile_workspace_user_count_by: {self._reconcile_hour} hour (UTC)"
+            )
+            return []
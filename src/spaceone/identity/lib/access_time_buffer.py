@@ -0,0 +1,112 @@
+import atexit
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Type
+
+from pymongo import UpdateOne
+from spaceone.core import config
+from spaceone.core.model.mongo_model import MongoModel
+
+__all__ = ["AccessTimeBuffer"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AccessTimeBuffer:
+    """Coalesces last_accessed_at updates and writes them in periodic batches.
+
+    Timestamps are kept per document in memory and flushed with one bulk_write per
+    model every IDENTITY.last_accessed_at.flush_interval seconds, and at process exit.
+    A flush_interval of 0 writes every access immediately.
+    """
+
+    _lock = threading.Lock()
+    _buffer = {}
+    _flush_thread = None
+    _stop_event = threading.Event()
+
+    @classmethod
+    def record(
+        cls, model: Type[MongoModel], accessed_at: datetime = None, **conditions
+    ) -> None:
+        accessed_at = accessed_at or datetime.utcnow()
+        flush_interval = cls._get_flush_interval()
+
+        if flush_interval <= 0:
+            cls._write(model, {tuple(sorted(conditions.items())): accessed_at})
+            return
+
+        key = (model, tuple(sorted(conditions.items())))
+
+        with cls._lock:
+            if key not in cls._buffer or cls._buffer[key] < accessed_at:
+                cls._buffer[key] = accessed_at
+
+            if cls._flush_thread is None:
+                cls._start_flush_thread(flush_interval)
+
+    @classmethod
+    def flush(cls) -> None:
+        with cls._lock:
+            buffer, cls._buffer = cls._buffer, {}
+
+        updates_by_model = {}
+        for (model, conditions), accessed_at in buffer.items():
+            updates_by_model.setdefault(model, {})[conditions] = accessed_at
+
+        for model, updates in updates_by_model.items():
+            try:
+                cls._write(model, updates)
+            except Exception as e:
+                _LOGGER.error(
+                    f"[flush] Failed to write last_accessed_at ({model.__name__}): {e}",
+                    exc_info=True,
+                )
+
+    @classmethod
+    def stop(cls) -> None:
+        cls._stop_event.set()
+        cls.flush()
+
+    @staticmethod
+    def _write(model: Type[MongoModel], updates: dict) -> None:
+        operations = [
+            UpdateOne(dict(conditions), {"$max": {"last_accessed_at": accessed_at}})
+            for conditions, accessed_at in updates.items()
+        ]
+
+        if operations:
+            model._get_collection().bulk_write(operations, ordered=False)
+            _LOGGER.debug(
+                f"[_write] Update last_accessed_at ({model.__name__}): {len(operations)}"
+            )
+
+    @classmethod
+    def _start_flush_thread(cls, flush_interval: int) -> None:
+        def _run():
+            while not cls._stop_event.wait(flush_interval):
+                cls.flush()
+
+        cls._flush_thread = threading.Thread(
+            target=_run, name="AccessTimeBufferFlush", daemon=True
+        )
+        cls._flush_thread.start()
+        atexit.register(cls.stop)
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        cls._lock = threading.Lock()
+        cls._buffer = {}
+        cls._flush_thread = None
+        cls._stop_event = threading.Event()
+
+    @staticmethod
+    def _get_flush_interval() -> int:
+        identity_conf = config.get_global("IDENTITY") or {}
+        return identity_conf.get("last_accessed_at", {}).get("flush_interval", 10)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=AccessTimeBuffer._reset_after_fork)
@@ -1,15 +1,172 @@
 # -*- coding: utf-8 -*-
 
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Tuple
+
 import bcrypt
+from spaceone.core import config
+
+from spaceone.identity.error.error_authentication import ERROR_PASSWORD_CIPHER_BUSY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _hashpw(password: bytes) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt())
+
+
+def _checkpw(password: bytes, hashed: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed)
 
 
 class PasswordCipher:
+    _lock = threading.Lock()
+    _executor = None
+    _semaphore = None
+    _stats_thread = None
+    _stop_event = threading.Event()
+    _stats = {
+        "in_flight": 0,
+        "max_in_flight": 0,
+        "completed": 0,
+        "rejected": 0,
+    }
+
     @staticmethod
     def __encoder(password: str) -> str:
         return str(password).encode("utf-8")
 
     def hashpw(self, password: str) -> bytes:
-        return bcrypt.hashpw(self.__encoder(password), bcrypt.gensalt())
+        return self._run(_hashpw, self.__encoder(password))
 
     def checkpw(self, password, hashed) -> bool:
-        return bcrypt.checkpw(self.__encoder(password), hashed)
+        return self._run(_checkpw, self.__encoder(password), hashed)
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        conf = cls._get_conf()
+        with cls._lock:
+            stats = dict(cls._stats)
+
+        stats["max_workers"] = conf["max_workers"]
+        stats["queue_depth"] = max(0, stats["in_flight"] - conf["max_workers"])
+        return stats
+
+    @classmethod
+    def shutdown(cls) -> None:
+        with cls._lock:
+            executor, cls._executor, cls._semaphore = cls._executor, None, None
+            cls._stop_event.set()
+            cls._stats_thread = None
+
+        if executor:
+            executor.shutdown(wait=True)
+
+    @classmethod
+    def _run(cls, func, *args):
+        conf = cls._get_conf()
+        if conf["executor"] is None:
+            return func(*args)
+
+        executor, semaphore = cls._get_executor(conf)
+
+        if conf["fail_fast"]:
+            acquired = semaphore.acquire(blocking=False)
+        else:
+            acquired = semaphore.acquire(timeout=conf["timeout"])
+
+        if not acquired:
+            with cls._lock:
+                cls._stats["rejected"] += 1
+
+            _LOGGER.warning(
+                f"[PasswordCipher] executor is saturated: {cls.get_stats()}"
+            )
+            raise ERROR_PASSWORD_CIPHER_BUSY()
+
+        with cls._lock:
+            cls._stats["in_flight"] += 1
+            cls._stats["max_in_flight"] = max(
+                cls._stats["max_in_flight"], cls._stats["in_flight"]
+            )
+
+        def _release(_future):
+            semaphore.release()
+            with cls._lock:
+                cls._stats["in_flight"] -= 1
+                cls._stats["completed"] += 1
+
+        try:
+            future = executor.submit(func, *args)
+        except Exception:
+            _release(None)
+            raise
+
+        future.add_done_callback(_release)
+
+        try:
+            return future.result(timeout=conf["timeout"])
+        except FutureTimeoutError:
+            raise ERROR_PASSWORD_CIPHER_BUSY()
+
+    @classmethod
+    def _get_executor(
+        cls, conf: dict
+    ) -> Tuple[Executor, threading.BoundedSemaphore]:
+        with cls._lock:
+            if cls._executor is None:
+                max_workers = conf["max_workers"]
+                if conf["executor"] == "PROCESS":
+                    cls._executor = ProcessPoolExecutor(
+                        max_workers=max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=max_workers, thread_name_prefix="PasswordCipher"
+                    )
+
+                cls._semaphore = threading.BoundedSemaphore(
+                    max_workers + conf["max_queue_size"]
+                )
+
+                if conf["stats_log_interval"] > 0 and cls._stats_thread is None:
+                    cls._start_stats_thread(conf["stats_log_interval"])
+
+            return cls._executor, cls._semaphore
+
+    @classmethod
+    def _start_stats_thread(cls, interval: int) -> None:
+        # Executor stats are logged whenever they change, so queue depth and
+        # rejections can be followed in the service logs.
+        stop_event = cls._stop_event = threading.Event()
+
+        def _run():
+            last_stats = None
+            while not stop_event.wait(interval):
+                stats = cls.get_stats()
+                if stats != last_stats:
+                    _LOGGER.info(f"[PasswordCipher] executor stats: {stats}")
+                    last_stats = stats
+
+        cls._stats_thread = threading.Thread(
+            target=_run, name="PasswordCipherStats", daemon=True
+        )
+        cls._stats_thread.start()
+
+    @staticmethod
+    def _get_conf() -> dict:
+        identity_conf = config.get_global("IDENTITY") or {}
+        cipher_conf = identity_conf.get("password_cipher", {})
+        return {
+            "executor": cipher_conf.get("executor"),
+            "max_workers": cipher_conf.get("max_workers", 2),
+            "max_queue_size": cipher_conf.get("max_queue_size", 16),
+            "fail_fast": cipher_conf.get("fail_fast", False),
+            "timeout": cipher_conf.get("timeout", 30),
+            "stats_log_interval": cipher_conf.get("stats_log_interval", 60),
+        }
@@ -0,0 +1,93 @@
+import argparse
+import logging
+from typing import List
+
+from spaceone.core import config, model
+from spaceone.core.logger import set_logger
+
+from spaceone.identity.manager.domain_manager import DomainManager
+from spaceone.identity.manager.domain_secret_manager import DomainSecretManager
+
+__all__ = ["rotate_domain_secrets"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def rotate_domain_secrets(
+    domain_ids: List[str] = None, force: bool = False, dry_run: bool = False
+) -> dict:
+    """Rotates the secrets of domains that do not use their configured algorithm.
+
+    With force, every selected domain is rotated. Tokens issued before a rotation stay
+    valid in identity until they expire, see DomainSecretManager.rotate_domain_secret.
+    """
+
+    domain_mgr = DomainManager()
+    domain_secret_mgr = DomainSecretManager()
+    results = {"rotated": [], "skipped": [], "failed": []}
+
+    conditions = {}
+    if domain_ids:
+        conditions["domain_id"] = domain_ids
+
+    for domain_vo in domain_mgr.filter_domains(**conditions):
+        domain_id = domain_vo.domain_id
+        try:
+            domain_secret_vo = domain_secret_mgr.get_domain_secret(domain_id)
+            algorithm = domain_secret_mgr.get_signing_algorithm(domain_id)
+            if not force and domain_secret_vo.algorithm == algorithm:
+                results["skipped"].append(domain_id)
+                continue
+
+            if not dry_run:
+                domain_secret_mgr.rotate_domain_secret(domain_vo)
+
+            results["rotated"].append(domain_id)
+        except Exception as e:
+            _LOGGER.error(
+                f"[rotate_domain_secrets] Rotation Failure ({domain_id}): {e}",
+                exc_info=True,
+            )
+            results["failed"].append(domain_id)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rotate domain secrets to the configured signing algorithm"
+    )
+    parser.add_argument("-c", "--config-file", help="Path of config file")
+    parser.add_argument(
+        "-d",
+        "--domain-id",
+        action="append",
+        dest="domain_ids",
+        help="Domain to rotate (repeatable, default: all domains)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rotate even if the domain already uses the configured algorithm",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Print changes without applying them"
+    )
+    args = parser.parse_args()
+
+    config.init_conf(package="spaceone.identity")
+    config.set_service_config()
+
+    if args.config_file:
+        config.set_file_conf(args.config_file)
+
+    set_logger()
+    model.init_all(create_index=False)
+
+    results = rotate_domain_secrets(args.domain_ids, args.force, args.dry_run)
+    for result_type, domain_ids in results.items():
+        print(f"{result_type}: {len(domain_ids)} {domain_ids}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import argparse
+import logging
+from typing import List, Type
+
+from spaceone.core import config, model
+from spaceone.core.logger import set_logger
+from spaceone.core.model.mongo_model import MongoModel
+
+__all__ = ["migrate_indexes"]
+
+_LOGGER = logging.getLogger(__name__)
+
+# 85: IndexOptionsConflict, 86: IndexKeySpecsConflict
+_INDEX_CONFLICT_CODES = [85, 86]
+
+
+def migrate_indexes(
+    models: List[Type[MongoModel]] = None, dry_run: bool = False
+) -> dict:
+    """Builds the declared indexes of each model and drops its superseded indexes.
+
+    Declared indexes are built in the background. Indexes listed in the model's
+    meta["superseded_indexes"] are dropped only after every declared index exists,
+    so queries are never left without an index during the migration.
+    """
+
+    results = {}
+    for model_cls in models or MongoModel.__subclasses__():
+        results[model_cls.__name__] = _migrate_model_indexes(model_cls, dry_run)
+
+    return results
+
+
+def _migrate_model_indexes(model_cls: Type[MongoModel], dry_run: bool) -> dict:
+    result = {"created": [], "dropped": [], "failed": []}
+    collection = model_cls._get_collection()
+    existing_indexes = collection.index_information()
+
+    for index in model_cls._meta.get("indexes", []):
+        index_name = _get_index_name(model_cls, index)
+        if index_name in existing_indexes:
+            continue
+
+        if dry_run:
+            result["created"].append(index_name)
+            continue
+
+        try:
+            model_cls.create_index(index, background=True)
+            result["created"].append(index_name)
+        except Exception as e:
+            if getattr(e, "code", None) not in _INDEX_CONFLICT_CODES:
+                _LOGGER.error(
+                    f"[migrate_indexes] Index Creation Failure ({model_cls.__name__}: "
+                    f"{index_name}): {e}"
+                )
+                result["failed"].append(index_name)
+
+    if result["failed"]:
+        _LOGGER.warning(
+            f"[migrate_indexes] Skip dropping superseded indexes ({model_cls.__name__})"
+        )
+        return result
+
+    for index_name in model_cls._meta.get("superseded_indexes", []):
+        if index_name not in existing_indexes:
+            continue
+
+        if not dry_run:
+            collection.drop_index(index_name)
+
+        result["dropped"].append(index_name)
+
+    _LOGGER.debug(f"[migrate_indexes] {model_cls.__name__}: {result}")
+    return result
+
+
+def _get_index_name(model_cls: Type[MongoModel], index) -> str:
+    index_spec = model_cls._build_index_spec(index)
+    if "name" in index_spec:
+        return index_spec["name"]
+
+    return "_".join(f"{field}_{direction}" for field, direction in index_spec["fields"])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build declared indexes and drop superseded indexes"
+    )
+    parser.add_argument("-c", "--config-file", help="Path of config file")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Print changes without applying them"
+    )
+    args = parser.parse_args()
+
+    config.init_conf(package="spaceone.identity")
+    config.set_service_config()
+
+    if args.config_file:
+        config.set_file_conf(args.config_file)
+
+    set_logger()
+    model.init_all(create_index=False)
+
+    for model_name, result in migrate_indexes(dry_run=args.dry_run).items():
+        if any(result.values()):
+            print(f"{model_name}: {result}")
+
+
+if __name__ == "__main__":
+    main()
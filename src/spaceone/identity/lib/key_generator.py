@@ -1,15 +1,38 @@
+import json
 import logging
+import threading
 import time
+from collections import OrderedDict
+from typing import Tuple
 
-from spaceone.core.auth.jwt.jwt_util import JWTUtil
+from jwcrypto import jwk
+from jwcrypto import jwt as jwcrypto_jwt
 from spaceone.core import utils
+from spaceone.core.auth.jwt import JWTAuthenticator
+from spaceone.core.error import ERROR_AUTHENTICATE_FAILURE, ERROR_INVALID_PARAMETER
 
 from spaceone.identity.error import ERROR_GENERATE_KEY_FAILURE
 
 _LOGGER = logging.getLogger(__name__)
 
+SIGNING_ALGORITHMS = {
+    "RS256": {"kty": "RSA", "size": 2048},
+    "ES256": {"kty": "EC", "crv": "P-256"},
+    "EdDSA": {"kty": "OKP", "crv": "Ed25519"},
+}
+
+_DEFAULT_ALGORITHM_BY_KEY_TYPE = {
+    "RSA": "RS256",
+    "EC": "ES256",
+    "OKP": "EdDSA",
+}
+
 
 class KeyGenerator:
+    _signing_key_cache = OrderedDict()
+    _signing_key_cache_lock = threading.Lock()
+    _signing_key_cache_size = 256
+
     def __init__(
         self,
         prv_jwk: dict,
@@ -42,6 +65,7 @@ class KeyGenerator:
         permissions: list = None,
         users_group: list = None,
         projects: list = None,
+        public_projects: bool = False,
         injected_params: dict = None,
         identity_base_url: str = None,
     ) -> str:
@@ -73,6 +97,9 @@ class KeyGenerator:
         if projects and len(projects) > 0:
             payload["projects"] = projects
 
+        if public_projects:
+            payload["public_projects"] = True
+
         if users_group and len(users_group) > 0:
             payload["user_groups"] = users_group
 
@@ -83,9 +110,92 @@ class KeyGenerator:
             payload["identity_base_url"] = identity_base_url
 
         if token_type == "REFRESH_TOKEN":
-            return JWTUtil.encode(payload, self.refresh_prv_jwk)
+            return self._encode(payload, self.refresh_prv_jwk)
         else:
-            return JWTUtil.encode(payload, self.prv_jwk)
+            return self._encode(payload, self.prv_jwk)
+
+    @classmethod
+    def evict_signing_keys(cls, domain_id: str) -> None:
+        with cls._signing_key_cache_lock:
+            for cache_key in list(cls._signing_key_cache.keys()):
+                if cache_key[0] == domain_id:
+                    del cls._signing_key_cache[cache_key]
+
+    @staticmethod
+    def generate_jwk(algorithm: str = "RS256") -> Tuple[dict, dict]:
+        if algorithm not in SIGNING_ALGORITHMS:
+            raise ERROR_INVALID_PARAMETER(
+                key="signing_algorithm",
+                reason=f"Supported algorithms: {list(SIGNING_ALGORITHMS.keys())}",
+            )
+
+        key = jwk.JWK.generate(**SIGNING_ALGORITHMS[algorithm])
+        private_jwk = json.loads(key.export_private())
+        public_jwk = json.loads(key.export_public())
+
+        private_jwk["alg"] = algorithm
+        public_jwk["alg"] = algorithm
+        private_jwk["kid"] = public_jwk["kid"] = key.thumbprint()
+
+        return private_jwk, public_jwk
+
+    @staticmethod
+    def get_algorithm(jwk_info: dict) -> str:
+        if algorithm := jwk_info.get("alg"):
+            return algorithm
+
+        return _DEFAULT_ALGORITHM_BY_KEY_TYPE.get(jwk_info.get("kty"), "RS256")
+
+    @staticmethod
+    def get_key_id(jwk_info: dict) -> str:
+        # Keys generated before key ids were added are identified by thumbprint
+        if key_id := jwk_info.get("kid"):
+            return key_id
+
+        return jwk.JWK(**jwk_info).thumbprint()
+
+    @classmethod
+    def verify_token(cls, token: str, public_jwk: dict) -> dict:
+        algorithm = cls.get_algorithm(public_jwk)
+        if algorithm == "RS256":
+            return JWTAuthenticator(public_jwk).validate(token)
+
+        try:
+            jwt_obj = jwcrypto_jwt.JWT(
+                jwt=token, key=jwk.JWK(**public_jwk), algs=[algorithm]
+            )
+            return json.loads(jwt_obj.claims)
+        except Exception:
+            raise ERROR_AUTHENTICATE_FAILURE(message="Token is invalid or expired.")
+
+    def _encode(self, payload: dict, private_jwk: dict) -> str:
+        algorithm = self.get_algorithm(private_jwk)
+        signing_key = self._get_signing_key(private_jwk)
+        header = {
+            "alg": algorithm,
+            "kid": private_jwk.get("kid") or signing_key.thumbprint(),
+        }
+        jwt_obj = jwcrypto_jwt.JWT(claims=payload, header=header)
+        jwt_obj.make_signed_token(signing_key)
+        return jwt_obj.serialize()
+
+    def _get_signing_key(self, private_jwk: dict) -> jwk.JWK:
+        cache_key = (self.domain_id, utils.dict_to_hash(private_jwk))
+
+        with self._signing_key_cache_lock:
+            signing_key = self._signing_key_cache.get(cache_key)
+            if signing_key is not None:
+                self._signing_key_cache.move_to_end(cache_key)
+                return signing_key
+
+        signing_key = jwk.JWK(**private_jwk)
+
+        with self._signing_key_cache_lock:
+            self._signing_key_cache[cache_key] = signing_key
+            if len(self._signing_key_cache) > self._signing_key_cache_size:
+                self._signing_key_cache.popitem(last=False)
+
+        return signing_key
 
     @staticmethod
     def _print_key(payload: dict):
@@ -102,6 +212,7 @@ class KeyGenerator:
             f'iat: {payload.get("iat")}, '
             f'jti: {payload.get("jti")}, '
             f'projects: {payload.get("projects")},'
+            f'public_projects: {payload.get("public_projects")},'
             f'user_groups: {payload.get("user_groups")},'
             f'permissions: {payload.get("permissions")},'
             f'injected_params: {payload.get("injected_params")},'
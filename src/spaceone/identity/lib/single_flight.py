@@ -0,0 +1,162 @@
+import copy
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from spaceone.core import cache
+
+__all__ = ["cacheable"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Flight:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coordinates cache loaders so that each cache key is loaded once per process.
+
+    The first caller on a cache miss runs the loader and stores the result, while
+    concurrent callers for the same key wait for it instead of querying the database.
+    If early_refresh is set, a hit within early_refresh seconds of expiry reloads the
+    key in the background and the current value is returned meanwhile.
+    """
+
+    wait_timeout = 10
+    max_refresh_keys = 10000
+
+    _lock = threading.Lock()
+    _flights = {}
+    _refresh_at = OrderedDict()
+    _refresh_executor = None
+
+    @classmethod
+    def load(cls, cache_key: str, loader, expire: int, early_refresh: int, alias: str):
+        with cls._lock:
+            flight = cls._flights.get(cache_key)
+            is_leader = flight is None
+            if is_leader:
+                flight = cls._flights[cache_key] = _Flight()
+
+        if not is_leader:
+            if not flight.event.wait(cls.wait_timeout):
+                _LOGGER.warning(f"[SingleFlight] wait timeout, load directly: {cache_key}")
+                return loader()
+
+            if flight.error:
+                raise flight.error
+
+            return copy.deepcopy(flight.result)
+
+        try:
+            flight.result = loader()
+            cache.set(cache_key, flight.result, expire=expire, alias=alias)
+            cls._set_refresh_at(cache_key, expire, early_refresh)
+
+            # flight.result is shared with followers, so each caller gets its own copy
+            return copy.deepcopy(flight.result)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with cls._lock:
+                cls._flights.pop(cache_key, None)
+            flight.event.set()
+
+    @classmethod
+    def refresh_if_needed(
+        cls, cache_key: str, loader, expire: int, early_refresh: int, alias: str
+    ) -> None:
+        with cls._lock:
+            refresh_at = cls._refresh_at.get(cache_key)
+            if refresh_at is None or time.monotonic() < refresh_at:
+                return
+
+            if cache_key in cls._flights:
+                return
+
+            del cls._refresh_at[cache_key]
+            executor = cls._get_refresh_executor()
+
+        executor.submit(cls._refresh, cache_key, loader, expire, early_refresh, alias)
+
+    @classmethod
+    def _refresh(
+        cls, cache_key: str, loader, expire: int, early_refresh: int, alias: str
+    ) -> None:
+        try:
+            cls.load(cache_key, loader, expire, early_refresh, alias)
+            _LOGGER.debug(f"[SingleFlight] refreshed cache: {cache_key}")
+        except Exception as e:
+            _LOGGER.warning(f"[SingleFlight] failed to refresh cache ({cache_key}): {e}")
+
+    @classmethod
+    def _set_refresh_at(cls, cache_key: str, expire: int, early_refresh: int) -> None:
+        if not (early_refresh and expire and expire > early_refresh):
+            return
+
+        with cls._lock:
+            cls._refresh_at[cache_key] = time.monotonic() + expire - early_refresh
+            cls._refresh_at.move_to_end(cache_key)
+            if len(cls._refresh_at) > cls.max_refresh_keys:
+                cls._refresh_at.popitem(last=False)
+
+    @classmethod
+    def _get_refresh_executor(cls) -> ThreadPoolExecutor:
+        if cls._refresh_executor is None:
+            cls._refresh_executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="SingleFlightRefresh"
+            )
+
+        return cls._refresh_executor
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        cls._lock = threading.Lock()
+        cls._flights = {}
+        cls._refresh_at = OrderedDict()
+        cls._refresh_executor = None
+
+
+def cacheable(key=None, expire=None, early_refresh=None, alias="default"):
+    """cache.cacheable with single-flight loading and optional early refresh.
+
+    Cache keys and stored values are the same as cache.cacheable, so invalidation with
+    cache.delete or cache.delete_pattern works unchanged.
+    """
+
+    def wrapper(func):
+        def wrapped_func(*args, **kwargs):
+            if not cache.is_set(alias):
+                return func(*args, **kwargs)
+
+            args_dict = cache._change_args_to_dict(func, args)
+            args_dict.update(kwargs)
+            cache_key = cache._make_cache_key(key, args_dict)
+            loader = partial(func, *args, **kwargs)
+
+            data = cache.get(cache_key, alias=alias)
+            if data is not None:
+                if early_refresh:
+                    SingleFlight.refresh_if_needed(
+                        cache_key, loader, expire, early_refresh, alias
+                    )
+                return data
+
+            return SingleFlight.load(cache_key, loader, expire, early_refresh, alias)
+
+        return wrapped_func
+
+    return wrapper
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=SingleFlight._reset_after_fork)
@@ -0,0 +1,142 @@
+import logging
+from datetime import datetime, timedelta
+from typing import List, Union
+
+from mongoengine import QuerySet
+from spaceone.core import config
+from spaceone.core.manager import BaseManager
+
+from spaceone.identity.model.token.database import (
+    AccessSnapshot,
+    AccessSnapshotGeneration,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Generation key for invalidations that are not scoped to a workspace
+_DOMAIN_SCOPE = "*"
+
+
+class AccessSnapshotManager(BaseManager):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.access_snapshot_model = AccessSnapshot
+        self.generation_model = AccessSnapshotGeneration
+
+        identity_conf = config.get_global("IDENTITY") or {}
+        token_conf = identity_conf.get("token", {})
+        self.CONST_ACCESS_SNAPSHOT_TIMEOUT = token_conf.get(
+            "access_snapshot_timeout", 3600
+        )
+
+    def is_enabled(self) -> bool:
+        return self.CONST_ACCESS_SNAPSHOT_TIMEOUT > 0
+
+    def get_access_snapshot(
+        self, user_id: str, domain_id: str, workspace_id: str = None
+    ) -> Union[AccessSnapshot, None]:
+        if not self.is_enabled():
+            return None
+
+        return self.access_snapshot_model.filter(
+            user_id=user_id,
+            domain_id=domain_id,
+            workspace_id=workspace_id,
+            expired_at__gt=datetime.utcnow(),
+        ).first()
+
+    def get_generation(self, domain_id: str, workspace_id: str = None) -> dict:
+        """Read the invalidation generations that guard a snapshot.
+
+        Call this before reading the data the snapshot is computed from and pass
+        the result to save_access_snapshot().
+        """
+        if not self.is_enabled():
+            return {}
+
+        scopes = self._get_generation_scopes(workspace_id)
+        generation = {scope: 0 for scope in scopes}
+        for generation_vo in self.generation_model.filter(
+            domain_id=domain_id, workspace_id__in=scopes
+        ):
+            generation[generation_vo.workspace_id] = generation_vo.generation
+
+        return generation
+
+    def save_access_snapshot(self, params: dict, generation: dict) -> None:
+        if not self.is_enabled():
+            return
+
+        domain_id = params["domain_id"]
+        workspace_id = params.get("workspace_id")
+
+        # Skip the save if an invalidation happened since the generation was read.
+        if self.get_generation(domain_id, workspace_id) != generation:
+            _LOGGER.debug(
+                f"[save_access_snapshot] Snapshot was invalidated during the grant: "
+                f"{params['user_id']} ({domain_id}, {workspace_id})"
+            )
+            return
+
+        now = datetime.utcnow()
+        update_params = {
+            f"set__{key}": value
+            for key, value in params.items()
+            if key not in ["user_id", "domain_id", "workspace_id"]
+        }
+        update_params["set__created_at"] = now
+        update_params["set__expired_at"] = now + timedelta(
+            seconds=self.CONST_ACCESS_SNAPSHOT_TIMEOUT
+        )
+
+        try:
+            self.access_snapshot_model.objects(
+                user_id=params["user_id"],
+                domain_id=domain_id,
+                workspace_id=workspace_id,
+            ).update_one(upsert=True, **update_params)
+        except Exception as e:
+            # A concurrent grant may have created the same snapshot.
+            _LOGGER.warning(f"[save_access_snapshot] Failed to save snapshot: {e}")
+            return
+
+        # An invalidation bumps the generation before it deletes snapshots, so one
+        # that started before this write either removes it or is detected here.
+        if self.get_generation(domain_id, workspace_id) != generation:
+            self.access_snapshot_model.filter(
+                user_id=params["user_id"],
+                domain_id=domain_id,
+                workspace_id=workspace_id,
+                created_at=now,
+            ).delete()
+
+    def delete_access_snapshots(self, **conditions) -> None:
+        _LOGGER.debug(f"[delete_access_snapshots] Invalidate snapshots: {conditions}")
+        self._increase_generations(conditions)
+        self.filter_access_snapshots(**conditions).delete()
+
+    def filter_access_snapshots(self, **conditions) -> QuerySet:
+        return self.access_snapshot_model.filter(**conditions)
+
+    def _increase_generations(self, conditions: dict) -> None:
+        workspace_ids = conditions.get("workspace_id")
+        if workspace_ids and set(conditions.keys()) <= {"domain_id", "workspace_id"}:
+            if not isinstance(workspace_ids, list):
+                workspace_ids = [workspace_ids]
+        else:
+            # Role and user invalidations are not scoped to a workspace.
+            workspace_ids = [_DOMAIN_SCOPE]
+
+        for workspace_id in workspace_ids:
+            self.generation_model.objects(
+                domain_id=conditions["domain_id"], workspace_id=workspace_id
+            ).update_one(
+                upsert=True, inc__generation=1, set__updated_at=datetime.utcnow()
+            )
+
+    @staticmethod
+    def _get_generation_scopes(workspace_id: str = None) -> List[str]:
+        if workspace_id:
+            return [_DOMAIN_SCOPE, workspace_id]
+        else:
+            return [_DOMAIN_SCOPE]
@@ -1,5 +1,5 @@
 import logging
-from typing import Tuple
+from typing import Generator, Tuple
 
 from spaceone.core.manager import BaseManager
 
@@ -55,6 +55,39 @@ class AccountCollectorPluginManager(BaseManager):
 
         return plugin_connector.dispatch("AccountCollector.sync", params)
 
+    def sync_stream(
+        self,
+        endpoint: str,
+        options: dict,
+        secret_data: dict,
+        domain_id: str,
+        schema_id: str = None,
+    ) -> Generator[dict, None, None]:
+        plugin_connector: SpaceConnector = self.locator.get_connector(
+            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
+        )
+
+        params = {
+            "options": options,
+            "secret_data": secret_data,
+            "domain_id": domain_id,
+        }
+        if schema_id:
+            params["schema_id"] = schema_id
+
+        supported_verbs = plugin_connector.client.api_resources.get(
+            "AccountCollector", []
+        )
+
+        # Plugins without sync_stream return all accounts in a single response
+        if "sync_stream" in supported_verbs:
+            yield from plugin_connector.dispatch("AccountCollector.sync_stream", params)
+        else:
+            _LOGGER.debug(
+                f"[sync_stream] sync_stream is not supported, use sync: {endpoint}"
+            )
+            yield plugin_connector.dispatch("AccountCollector.sync", params)
+
     def get_account_collector_plugin_endpoint_by_vo(self, provider_vo: Provider) -> str:
         plugin_info = provider_vo.plugin_info
         endpoint, updated_version = self.get_account_collector_plugin_endpoint(
@@ -2,6 +2,7 @@ import logging
 from typing import Tuple, Union
 
 from mongoengine import QuerySet
+from spaceone.core import cache
 from spaceone.core.manager import BaseManager
 
 from spaceone.identity.model.app.database import App
@@ -33,7 +34,11 @@ class AppManager(BaseManager):
 
         self.transaction.add_rollback(_rollback, app_vo.to_dict())
 
-        return app_vo.update(params)
+        self.delete_app_check_cache(app_vo.domain_id, app_vo.client_id)
+        app_vo = app_vo.update(params)
+        self.delete_app_check_cache(app_vo.domain_id, app_vo.client_id)
+
+        return app_vo
 
     def enable_app(self, app_vo: App) -> App:
         self.update_app_by_vo({"state": "ENABLED"}, app_vo)
@@ -45,9 +50,9 @@ class AppManager(BaseManager):
 
         return app_vo
 
-    @staticmethod
-    def delete_app_by_vo(app_vo: App) -> None:
+    def delete_app_by_vo(self, app_vo: App) -> None:
         app_vo.delete()
+        self.delete_app_check_cache(app_vo.domain_id, app_vo.client_id)
 
     def get_app(
         self,
@@ -73,3 +78,10 @@ class AppManager(BaseManager):
 
     def stat_apps(self, query: dict) -> dict:
         return self.app_model.stat(**query)
+
+    @staticmethod
+    def delete_app_check_cache(domain_id: str, client_id: str = None) -> None:
+        if client_id:
+            cache.delete_pattern(f"identity:app-check:{domain_id}:{client_id}")
+        else:
+            cache.delete_pattern(f"identity:app-check:{domain_id}:*")
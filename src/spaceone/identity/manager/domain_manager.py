@@ -41,16 +41,19 @@ class DomainManager(BaseManager):
     def delete_domain_by_vo(domain_vo: Domain) -> None:
         domain_vo.delete()
         cache.delete_pattern(f"identity:domain-state:{domain_vo.domain_id}")
+        cache.delete_pattern(f"identity:app-check:{domain_vo.domain_id}:*")
 
     def enable_domain(self, domain_vo: Domain) -> Domain:
         self.update_domain_by_vo({"state": "ENABLED"}, domain_vo)
         cache.delete_pattern(f"identity:domain-state:{domain_vo.domain_id}")
+        cache.delete_pattern(f"identity:app-check:{domain_vo.domain_id}:*")
 
         return domain_vo
 
     def disable_domain(self, domain_vo: Domain) -> Domain:
         self.update_domain_by_vo({"state": "DISABLED"}, domain_vo)
         cache.delete_pattern(f"identity:domain-state:{domain_vo.domain_id}")
+        cache.delete_pattern(f"identity:app-check:{domain_vo.domain_id}:*")
 
         return domain_vo
 
@@ -1,18 +1,29 @@
 import logging
-from spaceone.core.auth.jwt import JWTUtil
-from spaceone.core import cache
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple
+
+from spaceone.core import cache, config
 from spaceone.core.manager import *
 from spaceone.core import utils
-from spaceone.identity.model.domain.database import Domain, DomainSecret
+from spaceone.identity.error.error_domain import ERROR_SIGNING_ALGORITHM_NOT_ALLOWED
+from spaceone.identity.lib import single_flight
+from spaceone.identity.lib.key_generator import KeyGenerator
+from spaceone.identity.model.domain.database import Domain, DomainSecret, DomainKey
 from spaceone.identity.manager.domain_manager import DomainManager
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class DomainSecretManager(BaseManager):
+    _key_pool_lock = threading.Lock()
+    _key_pool_thread = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.domain_secret_model = DomainSecret
+        self.domain_key_model = DomainKey
         self.domain_mgr = DomainManager()
 
     def create_domain_secret(self, domain_vo: Domain) -> None:
@@ -23,7 +34,9 @@ class DomainSecretManager(BaseManager):
             vo.delete()
 
         # Generate Domain-secret
-        secret = self._generate_domain_secret(domain_vo)
+        secret = self._generate_domain_secret(
+            domain_vo, self.get_signing_algorithm(domain_vo.domain_id)
+        )
 
         # Generate Domain Key
         secret["domain_key"] = utils.random_string(16)
@@ -31,36 +44,158 @@ class DomainSecretManager(BaseManager):
         domain_secret_vo: DomainSecret = self.domain_secret_model.create(secret)
         self.transaction.add_rollback(_rollback, domain_secret_vo)
 
+    def rotate_domain_secret(self, domain_vo: Domain) -> DomainSecret:
+        """Replaces the key pairs of a domain with the configured signing algorithm.
+
+        New keys are generated before the secret is changed, and the secret is updated
+        in place. The previous public keys are kept for verification until tokens
+        signed by them have expired.
+        """
+
+        def _rollback(old_data: dict):
+            _LOGGER.info(
+                f"[rotate_domain_secret._rollback] Revert domain secret: "
+                f"{old_data['domain_id']}"
+            )
+            domain_secret_vo.update(old_data)
+            self._delete_domain_secret_cache(old_data["domain_id"])
+
+        domain_id = domain_vo.domain_id
+        algorithm = self.get_signing_algorithm(domain_id)
+        domain_secret_vo = self.get_domain_secret(domain_id)
+
+        _LOGGER.debug(
+            f"[rotate_domain_secret] Rotate domain secret: {domain_id} "
+            f"({domain_secret_vo.algorithm} -> {algorithm})"
+        )
+
+        secret = self._generate_domain_secret(domain_vo, algorithm)
+        now = datetime.utcnow()
+
+        old_data = {
+            "algorithm": domain_secret_vo.algorithm,
+            "pub_jwk": domain_secret_vo.pub_jwk,
+            "prv_jwk": domain_secret_vo.prv_jwk,
+            "refresh_pub_jwk": domain_secret_vo.refresh_pub_jwk,
+            "refresh_prv_jwk": domain_secret_vo.refresh_prv_jwk,
+            "previous_pub_jwk": domain_secret_vo.previous_pub_jwk,
+            "previous_refresh_pub_jwk": domain_secret_vo.previous_refresh_pub_jwk,
+            "previous_keys_expired_at": domain_secret_vo.previous_keys_expired_at,
+            "rotated_at": domain_secret_vo.rotated_at,
+            "domain_id": domain_id,
+        }
+
+        domain_secret_vo = domain_secret_vo.update(
+            {
+                "algorithm": algorithm,
+                "pub_jwk": secret["pub_jwk"],
+                "prv_jwk": secret["prv_jwk"],
+                "refresh_pub_jwk": secret["refresh_pub_jwk"],
+                "refresh_prv_jwk": secret["refresh_prv_jwk"],
+                "previous_pub_jwk": old_data["pub_jwk"],
+                "previous_refresh_pub_jwk": old_data["refresh_pub_jwk"],
+                "previous_keys_expired_at": now
+                + timedelta(seconds=self._get_max_token_lifetime()),
+                "rotated_at": now,
+            }
+        )
+        self.transaction.add_rollback(_rollback, old_data)
+        self._delete_domain_secret_cache(domain_id)
+
+        return domain_secret_vo
+
     def delete_domain_secret(self, domain_id: str) -> None:
         domain_secret_vos = self.domain_secret_model.filter(domain_id=domain_id)
         domain_secret_vos.delete()
-        cache.delete(f"identity:public-jwk:{domain_id}")
-        cache.delete(f"identity:private-jwk:{domain_id}")
-        cache.delete(f"identity:refresh-public-jwk:{domain_id}")
-        cache.delete(f"identity:refresh-private-jwk:{domain_id}")
+        self._delete_domain_secret_cache(domain_id)
 
-    @cache.cacheable(key="identity:public-jwk:{domain_id}", expire=600)
+    def get_domain_secret(self, domain_id: str) -> DomainSecret:
+        return self.domain_secret_model.get(domain_id=domain_id)
+
+    def verify_token(self, token: str, domain_id: str, refresh: bool = False) -> dict:
+        if refresh:
+            public_jwk = self.get_domain_refresh_public_key(domain_id)
+        else:
+            public_jwk = self.get_domain_public_key(domain_id)
+
+        try:
+            return KeyGenerator.verify_token(token, public_jwk)
+        except Exception:
+            # Tokens issued before the last rotation are valid until they expire
+            previous_keys = self.get_domain_previous_public_keys(domain_id)
+            previous_jwk = previous_keys.get(
+                "refresh_pub_jwk" if refresh else "pub_jwk"
+            )
+            if previous_jwk and previous_keys["expired_at"] > time.time():
+                return KeyGenerator.verify_token(token, previous_jwk)
+
+            raise
+
+    @single_flight.cacheable(
+        key="identity:public-jwk:{domain_id}", expire=600, early_refresh=60
+    )
     def get_domain_public_key(self, domain_id: str) -> dict:
         domain_secret_vo: DomainSecret = self.domain_secret_model.get(
             domain_id=domain_id
         )
         return domain_secret_vo.pub_jwk
 
-    @cache.cacheable(key="identity:private-jwk:{domain_id}", expire=600)
+    def get_domain_public_key_set(self, domain_id: str) -> dict:
+        """Returns the current public key with every key tokens may be signed with.
+
+        The current key stays at the top level for consumers that load a single JWK.
+        "keys" also holds the previous key until tokens signed by it have expired, so
+        consumers can select the verification key by the "kid" of the token header.
+        """
+        pub_jwk = self._with_key_id(self.get_domain_public_key(domain_id))
+        public_keys = [pub_jwk]
+
+        previous_keys = self.get_domain_previous_public_keys(domain_id)
+        if previous_keys.get("pub_jwk") and previous_keys["expired_at"] > time.time():
+            public_keys.append(self._with_key_id(previous_keys["pub_jwk"]))
+
+        return {**pub_jwk, "keys": public_keys}
+
+    @single_flight.cacheable(
+        key="identity:private-jwk:{domain_id}", expire=600, early_refresh=60
+    )
     def get_domain_private_key(self, domain_id: str) -> dict:
         domain_secret_vo: DomainSecret = self.domain_secret_model.get(
             domain_id=domain_id
         )
         return domain_secret_vo.prv_jwk
 
-    @cache.cacheable(key="identity:refresh-public-jwk:{domain_id}", expire=600)
+    @single_flight.cacheable(
+        key="identity:previous-public-jwk:{domain_id}", expire=600, early_refresh=60
+    )
+    def get_domain_previous_public_keys(self, domain_id: str) -> dict:
+        domain_secret_vo: DomainSecret = self.domain_secret_model.get(
+            domain_id=domain_id
+        )
+
+        if domain_secret_vo.previous_keys_expired_at is None:
+            return {}
+
+        return {
+            "pub_jwk": domain_secret_vo.previous_pub_jwk,
+            "refresh_pub_jwk": domain_secret_vo.previous_refresh_pub_jwk,
+            "expired_at": domain_secret_vo.previous_keys_expired_at.replace(
+                tzinfo=timezone.utc
+            ).timestamp(),
+        }
+
+    @single_flight.cacheable(
+        key="identity:refresh-public-jwk:{domain_id}", expire=600, early_refresh=60
+    )
     def get_domain_refresh_public_key(self, domain_id: str) -> dict:
         domain_secret_vo: DomainSecret = self.domain_secret_model.get(
             domain_id=domain_id
         )
         return domain_secret_vo.refresh_pub_jwk
 
-    @cache.cacheable(key="identity:refresh-private-jwk:{domain_id}", expire=600)
+    @single_flight.cacheable(
+        key="identity:refresh-private-jwk:{domain_id}", expire=600, early_refresh=60
+    )
     def get_domain_refresh_private_key(self, domain_id: str) -> dict:
         domain_secret_vo: DomainSecret = self.domain_secret_model.get(
             domain_id=domain_id
@@ -68,10 +203,76 @@ class DomainSecretManager(BaseManager):
         return domain_secret_vo.refresh_prv_jwk
 
     @staticmethod
-    def _generate_domain_secret(domain_vo: Domain) -> dict:
-        private_jwk, public_jwk = JWTUtil.generate_jwk()
-        refresh_private_jwk, refresh_public_jwk = JWTUtil.generate_jwk()
+    def get_signing_algorithm(domain_id: str = None) -> str:
+        identity_conf = config.get_global("IDENTITY") or {}
+        token_conf = identity_conf.get("token", {})
+        domain_algorithms = token_conf.get("domain_signing_algorithms", {})
+
+        if domain_id in domain_algorithms:
+            algorithm = domain_algorithms[domain_id]
+        else:
+            algorithm = token_conf.get("signing_algorithm", "RS256")
+
+        # Other services verify tokens with RS256 only until they are upgraded.
+        if algorithm != "RS256" and not token_conf.get(
+            "allow_non_rs256_signing", False
+        ):
+            raise ERROR_SIGNING_ALGORITHM_NOT_ALLOWED(
+                algorithm=algorithm, domain_id=domain_id
+            )
+
+        return algorithm
+
+    @classmethod
+    def get_signing_algorithms(cls) -> List[str]:
+        identity_conf = config.get_global("IDENTITY") or {}
+        token_conf = identity_conf.get("token", {})
+        domain_ids = [None] + list(token_conf.get("domain_signing_algorithms", {}))
+
+        algorithms = []
+        for domain_id in domain_ids:
+            try:
+                algorithm = cls.get_signing_algorithm(domain_id)
+            except ERROR_SIGNING_ALGORITHM_NOT_ALLOWED:
+                continue
+
+            if algorithm not in algorithms:
+                algorithms.append(algorithm)
+
+        return algorithms
+
+    def fill_domain_key_pool(self) -> int:
+        pool_size = self._get_key_pool_size()
+        generated_count = 0
+
+        for algorithm in self.get_signing_algorithms():
+            while (
+                self.domain_key_model.filter(algorithm=algorithm).count() < pool_size
+            ):
+                private_jwk, public_jwk = KeyGenerator.generate_jwk(algorithm)
+                self.domain_key_model.create(
+                    {
+                        "algorithm": algorithm,
+                        "pub_jwk": public_jwk,
+                        "prv_jwk": private_jwk,
+                    }
+                )
+                generated_count += 1
+
+        if generated_count > 0:
+            _LOGGER.debug(
+                f"[fill_domain_key_pool] Generated domain keys: {generated_count}"
+            )
+
+        return generated_count
+
+    def _generate_domain_secret(self, domain_vo: Domain, algorithm: str) -> dict:
+        private_jwk, public_jwk = self._get_key_pair(algorithm)
+        refresh_private_jwk, refresh_public_jwk = self._get_key_pair(algorithm)
+        self._fill_domain_key_pool_in_background()
+
         data = {
+            "algorithm": algorithm,
             "pub_jwk": public_jwk,
             "prv_jwk": private_jwk,
             "refresh_pub_jwk": refresh_public_jwk,
@@ -80,3 +281,68 @@ class DomainSecretManager(BaseManager):
             "domain": domain_vo,
         }
         return data
+
+    def _get_key_pair(self, algorithm: str) -> Tuple[dict, dict]:
+        if self._get_key_pool_size() > 0:
+            domain_key_vo = (
+                self.domain_key_model.filter(algorithm=algorithm)
+                .order_by("created_at")
+                .modify(remove=True)
+            )
+
+            if domain_key_vo:
+                return domain_key_vo.prv_jwk, domain_key_vo.pub_jwk
+
+            _LOGGER.debug("[_get_key_pair] Domain key pool is empty => generate key")
+
+        return KeyGenerator.generate_jwk(algorithm)
+
+    def _fill_domain_key_pool_in_background(self) -> None:
+        if self._get_key_pool_size() == 0:
+            return
+
+        with self._key_pool_lock:
+            if self._key_pool_thread and self._key_pool_thread.is_alive():
+                return
+
+            def _run():
+                try:
+                    DomainSecretManager().fill_domain_key_pool()
+                except Exception as e:
+                    _LOGGER.error(
+                        f"[_fill_domain_key_pool_in_background] {e}", exc_info=True
+                    )
+
+            thread = threading.Thread(target=_run, name="DomainKeyPool", daemon=True)
+            thread.start()
+            DomainSecretManager._key_pool_thread = thread
+
+    @staticmethod
+    def _delete_domain_secret_cache(domain_id: str) -> None:
+        cache.delete(
+            f"identity:public-jwk:{domain_id}",
+            f"identity:private-jwk:{domain_id}",
+            f"identity:refresh-public-jwk:{domain_id}",
+            f"identity:refresh-private-jwk:{domain_id}",
+            f"identity:previous-public-jwk:{domain_id}",
+        )
+        KeyGenerator.evict_signing_keys(domain_id)
+
+    @staticmethod
+    def _with_key_id(public_jwk: dict) -> dict:
+        return {**public_jwk, "kid": KeyGenerator.get_key_id(public_jwk)}
+
+    @staticmethod
+    def _get_max_token_lifetime() -> int:
+        identity_conf = config.get_global("IDENTITY") or {}
+        token_conf = identity_conf.get("token", {})
+        return max(
+            token_conf.get("token_max_timeout", 604800),
+            token_conf.get("refresh_timeout", 10800),
+            token_conf.get("admin_refresh_max_timeout", 2419200),
+        )
+
+    @staticmethod
+    def _get_key_pool_size() -> int:
+        identity_conf = config.get_global("IDENTITY") or {}
+        return identity_conf.get("domain_key_pool", {}).get("size", 0)
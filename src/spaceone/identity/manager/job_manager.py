@@ -101,6 +101,11 @@ class JobManager(BaseManager):
 
         queue.put("identity_q", utils.dump_json(task))
 
+    @staticmethod
+    def update_metrics(job_vo: Job, metrics: dict) -> None:
+        _LOGGER.debug(f"[update_metrics] job metrics ({job_vo.job_id}): {metrics}")
+        job_vo.update({"metrics": metrics})
+
     @staticmethod
     def change_in_progress_status(job_vo: Job) -> None:
         _LOGGER.debug(f"[change_in_progress_status] start job: {job_vo.job_id}")
@@ -1,10 +1,13 @@
 import logging
-from typing import Tuple, List
+from typing import Tuple, List, Union
 from mongoengine import QuerySet
+from pymongo import UpdateOne
 from spaceone.core import cache
 from spaceone.core.manager import BaseManager
 
 from spaceone.identity.error.error_project_group import *
+from spaceone.identity.lib import single_flight
+from spaceone.identity.manager.access_snapshot_manager import AccessSnapshotManager
 from spaceone.identity.manager.project_manager import ProjectManager
 from spaceone.identity.model.project.database import Project
 from spaceone.identity.model.project_group.database import ProjectGroup
@@ -25,9 +28,15 @@ class ProjectGroupManager(BaseManager):
             )
             vo.delete()
 
+        params["ancestors"] = self._get_ancestors_of_child(
+            params["domain_id"], params["workspace_id"], params.get("parent_group_id")
+        )
+
         project_group_vo = self.project_group_model.create(params)
         self.transaction.add_rollback(_rollback, project_group_vo)
 
+        self._invalidate_access_info(project_group_vo)
+
         return project_group_vo
 
     def update_project_group_by_vo(
@@ -41,7 +50,69 @@ class ProjectGroupManager(BaseManager):
 
         self.transaction.add_rollback(_rollback, project_group_vo.to_dict())
 
-        return project_group_vo.update(params)
+        project_group_vo = project_group_vo.update(params)
+        self._invalidate_access_info(project_group_vo)
+
+        return project_group_vo
+
+    def change_parent_group_by_vo(
+        self, parent_group_id: Union[str, None], project_group_vo: ProjectGroup
+    ) -> ProjectGroup:
+        domain_id = project_group_vo.domain_id
+        workspace_id = project_group_vo.workspace_id
+        project_group_id = project_group_vo.project_group_id
+
+        if project_group_vo.ancestors is None:
+            self.rebuild_project_group_ancestors(domain_id, workspace_id)
+            project_group_vo.reload()
+
+        old_ancestors = project_group_vo.ancestors or []
+        new_ancestors = self._get_ancestors_of_child(
+            domain_id, workspace_id, parent_group_id
+        )
+
+        if project_group_id in new_ancestors:
+            raise ERROR_NOT_ALLOWED_TO_CHANGE_PARENT_GROUP_TO_SUB_PROJECT_GROUP(
+                project_group_id=parent_group_id
+            )
+
+        descendants = {}
+        for child_vo in self._filter_descendants(domain_id, project_group_id):
+            child_ancestors = child_vo.ancestors or []
+            descendants[child_vo.project_group_id] = (
+                child_ancestors,
+                new_ancestors + child_ancestors[len(old_ancestors) :],
+            )
+
+        project_group_vo = self.update_project_group_by_vo(
+            {"parent_group_id": parent_group_id, "ancestors": new_ancestors},
+            project_group_vo,
+        )
+
+        if descendants:
+
+            def _rollback(old_descendants: dict):
+                _LOGGER.info(
+                    f"[change_parent_group_by_vo._rollback] Revert ancestors of descendants: {project_group_id}"
+                )
+                self._update_ancestors(
+                    domain_id,
+                    {
+                        child_id: old_value
+                        for child_id, (old_value, _) in old_descendants.items()
+                    },
+                )
+
+            self._update_ancestors(
+                domain_id,
+                {
+                    child_id: new_value
+                    for child_id, (_, new_value) in descendants.items()
+                },
+            )
+            self.transaction.add_rollback(_rollback, descendants)
+
+        return project_group_vo
 
     def delete_project_group_by_vo(self, project_group_vo: ProjectGroup) -> None:
         project_mgr = ProjectManager()
@@ -52,7 +123,8 @@ class ProjectGroupManager(BaseManager):
             raise ERROR_RELATED_PROJECT_EXIST(project_id=project_vo.project_id)
 
         child_vos = self.filter_project_groups(
-            parent_group_id=project_group_vo.project_group_id
+            parent_group_id=project_group_vo.project_group_id,
+            domain_id=project_group_vo.domain_id,
         )
         for child_vo in child_vos:
             raise ERROR_RELATED_PROJECT_GROUP_EXIST(
@@ -60,6 +132,7 @@ class ProjectGroupManager(BaseManager):
             )
 
         project_group_vo.delete()
+        self._invalidate_access_info(project_group_vo)
 
     def get_project_group(
         self,
@@ -90,26 +163,108 @@ class ProjectGroupManager(BaseManager):
     def stat_project_groups(self, query: dict) -> dict:
         return self.project_group_model.stat(**query)
 
-    @cache.cacheable(
-        key="identity:project-group:{domain_id}:{project_group_id}",
+    def get_child_project_group_ids(
+        self, domain_id: str, project_group_id: str
+    ) -> List[str]:
+        project_group_vo = self.filter_project_groups(
+            project_group_id=project_group_id, domain_id=domain_id
+        ).first()
+
+        if project_group_vo and project_group_vo.ancestors is None:
+            self.rebuild_project_group_ancestors(
+                domain_id, project_group_vo.workspace_id
+            )
+
+        return self._filter_descendants(domain_id, project_group_id).distinct(
+            "project_group_id"
+        )
+
+    def rebuild_project_group_ancestors(self, domain_id: str, workspace_id: str) -> None:
+        _LOGGER.debug(
+            f"[rebuild_project_group_ancestors] Rebuild project group hierarchy: {workspace_id}"
+        )
+        project_group_vos = self.filter_project_groups(
+            domain_id=domain_id, workspace_id=workspace_id
+        ).only("project_group_id", "parent_group_id")
+
+        parent_map = {
+            project_group_vo.project_group_id: project_group_vo.parent_group_id
+            for project_group_vo in project_group_vos
+        }
+
+        ancestors_map = {}
+        for project_group_id in parent_map.keys():
+            ancestors = []
+            parent_group_id = parent_map[project_group_id]
+            while parent_group_id in parent_map and parent_group_id not in ancestors:
+                ancestors.insert(0, parent_group_id)
+                parent_group_id = parent_map[parent_group_id]
+
+            ancestors_map[project_group_id] = ancestors
+
+        self._update_ancestors(domain_id, ancestors_map)
+
+    @single_flight.cacheable(
+        key="identity:project-group:{domain_id}:{project_group_id}:{exclude_public}",
         expire=180,
+        early_refresh=30,
     )
     def get_projects_in_project_groups(
         self,
         domain_id: str,
-        project_group_id: list,
+        project_group_id: str,
+        exclude_public: bool = False,
     ) -> List[str]:
-        project_vos = self.project_model.filter(
-            domain_id=domain_id, project_group_id=project_group_id
+        project_group_ids = self.get_child_project_group_ids(
+            domain_id, project_group_id
         )
-        projects = [project_vo.project_id for project_vo in project_vos]
+        project_group_ids.append(project_group_id)
 
-        child_project_groups = self.project_group_model.filter(
-            domain_id=domain_id, parent_group_id=project_group_id
+        query = {"domain_id": domain_id, "project_group_id": project_group_ids}
+        if exclude_public:
+            query["project_type__ne"] = "PUBLIC"
+
+        return self.project_model.filter(**query).distinct("project_id")
+
+    @staticmethod
+    def _invalidate_access_info(project_group_vo: ProjectGroup) -> None:
+        cache.delete_pattern(f"identity:project-group:{project_group_vo.domain_id}:*")
+        cache.delete_pattern(f"identity:app-check:{project_group_vo.domain_id}:*")
+        access_snapshot_mgr = AccessSnapshotManager()
+        access_snapshot_mgr.delete_access_snapshots(
+            domain_id=project_group_vo.domain_id,
+            workspace_id=project_group_vo.workspace_id,
+        )
+
+    def _filter_descendants(self, domain_id: str, project_group_id: str) -> QuerySet:
+        return self.project_group_model.filter(
+            domain_id=domain_id, ancestors=project_group_id
         )
-        for child_project_group in child_project_groups:
-            parent_group_id = child_project_group.project_group_id
-            projects.extend(
-                self.get_projects_in_project_groups(domain_id, parent_group_id)
+
+    def _get_ancestors_of_child(
+        self, domain_id: str, workspace_id: str, parent_group_id: Union[str, None]
+    ) -> List[str]:
+        if parent_group_id is None:
+            return []
+
+        parent_vo = self.get_project_group(parent_group_id, domain_id, workspace_id)
+        if parent_vo.ancestors is None:
+            self.rebuild_project_group_ancestors(domain_id, workspace_id)
+            parent_vo.reload()
+
+        return parent_vo.ancestors + [parent_group_id]
+
+    def _update_ancestors(self, domain_id: str, ancestors_map: dict) -> None:
+        if not ancestors_map:
+            return
+
+        operations = [
+            UpdateOne(
+                {"domain_id": domain_id, "project_group_id": project_group_id},
+                {"$set": {"ancestors": ancestors}},
             )
-        return list(set(projects))
+            for project_group_id, ancestors in ancestors_map.items()
+        ]
+        self.project_group_model._get_collection().bulk_write(
+            operations, ordered=False
+        )
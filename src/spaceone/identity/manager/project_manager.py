@@ -6,6 +6,7 @@ from spaceone.core import cache
 from spaceone.core.manager import BaseManager
 
 from spaceone.identity.model.project.database import Project
+from spaceone.identity.manager.access_snapshot_manager import AccessSnapshotManager
 from spaceone.identity.error.error_project import *
 from spaceone.identity.manager.service_account_manager import ServiceAccountManager
 
@@ -27,6 +28,8 @@ class ProjectManager(BaseManager):
         project_vo = self.project_model.create(params)
         self.transaction.add_rollback(_rollback, project_vo)
 
+        self._invalidate_access_info(project_vo.domain_id, project_vo.workspace_id)
+
         return project_vo
 
     def update_project_by_vo(self, params: dict, project_vo: Project) -> Project:
@@ -38,7 +41,10 @@ class ProjectManager(BaseManager):
 
         self.transaction.add_rollback(_rollback, project_vo.to_dict())
 
-        return project_vo.update(params)
+        project_vo = project_vo.update(params)
+        self._invalidate_access_info(project_vo.domain_id, project_vo.workspace_id)
+
+        return project_vo
 
     @staticmethod
     def delete_project_by_vo(project_vo: Project) -> None:
@@ -52,6 +58,9 @@ class ProjectManager(BaseManager):
             )
 
         project_vo.delete()
+        ProjectManager._invalidate_access_info(
+            project_vo.domain_id, project_vo.workspace_id
+        )
 
     def get_project(
         self,
@@ -81,3 +90,12 @@ class ProjectManager(BaseManager):
 
     def stat_projects(self, query: dict) -> dict:
         return self.project_model.stat(**query)
+
+    @staticmethod
+    def _invalidate_access_info(domain_id: str, workspace_id: str) -> None:
+        cache.delete_pattern(f"identity:project-group:{domain_id}:*")
+        cache.delete_pattern(f"identity:app-check:{domain_id}:*")
+        access_snapshot_mgr = AccessSnapshotManager()
+        access_snapshot_mgr.delete_access_snapshots(
+            domain_id=domain_id, workspace_id=workspace_id
+        )
@@ -1,16 +1,32 @@
 import logging
-from typing import Tuple
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Dict, List, Tuple, Union
 
 from mongoengine import QuerySet
 
+from spaceone.core import cache, config, utils
+from spaceone.core.error import ERROR_DB_QUERY
 from spaceone.core.manager import BaseManager
+from spaceone.identity.lib import single_flight
+from spaceone.identity.manager.access_snapshot_manager import AccessSnapshotManager
 from spaceone.identity.manager.user_group_manager import UserGroupManager
+from spaceone.identity.manager.workspace_manager import WorkspaceManager
 from spaceone.identity.model.role_binding.database import RoleBinding
+from spaceone.identity.model.user.database import User
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class RoleBindingManager(BaseManager):
+    local_cache_max_keys = 10000
+
+    _local_cache = OrderedDict()
+    _local_cache_lock = threading.Lock()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.role_binding_model = RoleBinding
@@ -19,12 +35,54 @@ class RoleBindingManager(BaseManager):
         def _rollback(vo: RoleBinding):
             _LOGGER.info(f"[create_role_binding._rollback]: {vo.role_binding_id}")
             vo.delete()
+            self._update_workspace_user_counts([vo], -1)
+            self._invalidate_user_access([vo])
 
         role_binding_vo = self.role_binding_model.create(params)
         self.transaction.add_rollback(_rollback, role_binding_vo)
 
+        self._update_workspace_user_counts([role_binding_vo], 1)
+        self._invalidate_user_access([role_binding_vo])
+
         return role_binding_vo
 
+    def create_role_bindings(
+        self, params_list: List[dict], update_user_count: bool = True
+    ) -> List[RoleBinding]:
+        def _rollback(vos: List[RoleBinding]):
+            _LOGGER.info(f"[create_role_bindings._rollback]: {len(vos)} role bindings")
+            self.role_binding_model.filter(
+                role_binding_id=[vo.role_binding_id for vo in vos]
+            ).delete()
+            if update_user_count:
+                self._update_workspace_user_counts(vos, -1)
+            self._invalidate_user_access(vos)
+
+        if not params_list:
+            return []
+
+        created_at = datetime.utcnow()
+        role_binding_vos = [
+            self.role_binding_model(
+                role_binding_id=utils.generate_id("rb"), created_at=created_at, **params
+            )
+            for params in params_list
+        ]
+
+        try:
+            role_binding_vos = self.role_binding_model.objects.insert(role_binding_vos)
+        except Exception as e:
+            raise ERROR_DB_QUERY(reason=e)
+
+        self.transaction.add_rollback(_rollback, role_binding_vos)
+
+        if update_user_count:
+            self._update_workspace_user_counts(role_binding_vos, 1)
+
+        self._invalidate_user_access(role_binding_vos)
+
+        return role_binding_vos
+
     def update_role_binding_by_vo(
         self, params: dict, role_binding_vo: RoleBinding
     ) -> RoleBinding:
@@ -34,10 +92,73 @@ class RoleBindingManager(BaseManager):
                 f"{old_data['role_binding_id']}"
             )
             role_binding_vo.update(old_data)
+            self._invalidate_user_access([role_binding_vo])
 
         self.transaction.add_rollback(_rollback, role_binding_vo.to_dict())
 
-        return role_binding_vo.update(params)
+        role_binding_vo = role_binding_vo.update(params)
+        self._invalidate_user_access([role_binding_vo])
+
+        return role_binding_vo
+
+    def update_workspace_group_user_role(
+        self,
+        role_id: str,
+        role_type: str,
+        user_id: str,
+        workspace_group_id: str,
+        domain_id: str,
+    ) -> int:
+        conditions = {
+            "user_id": user_id,
+            "workspace_group_id": workspace_group_id,
+            "domain_id": domain_id,
+        }
+
+        def _rollback(old_roles: List[dict]):
+            _LOGGER.info(
+                f"[update_workspace_group_user_role._rollback] Revert role: "
+                f"{user_id} ({workspace_group_id})"
+            )
+            for old_role in old_roles:
+                self.role_binding_model.filter(
+                    role_binding_id=old_role["role_binding_ids"], domain_id=domain_id
+                ).update(
+                    role_id=old_role["_id"]["role_id"],
+                    role_type=old_role["_id"]["role_type"],
+                )
+            self._delete_user_access(domain_id, [user_id])
+
+        # Previous roles are grouped so that the rollback is one update per role
+        old_roles = list(
+            self.role_binding_model.objects.aggregate(
+                [
+                    {"$match": self.role_binding_model.filter(**conditions)._query},
+                    {
+                        "$group": {
+                            "_id": {"role_id": "$role_id", "role_type": "$role_type"},
+                            "role_binding_ids": {"$push": "$role_binding_id"},
+                        }
+                    },
+                ]
+            )
+        )
+
+        if not old_roles:
+            return 0
+
+        self.transaction.add_rollback(_rollback, old_roles)
+
+        updated_count = self.role_binding_model.filter(**conditions).update(
+            role_id=role_id, role_type=role_type
+        )
+        self._delete_user_access(domain_id, [user_id])
+
+        _LOGGER.debug(
+            f"[update_workspace_group_user_role] Update role bindings: {updated_count}"
+        )
+
+        return updated_count
 
     def delete_role_binding_by_vo(
         self,
@@ -46,20 +167,36 @@ class RoleBindingManager(BaseManager):
         _LOGGER.debug(
             f"[delete_role_binding_by_vo] Delete role binding info: {role_binding_vo.to_dict()}"
         )
-        role_binding_vo.delete()
+        self.delete_role_bindings([role_binding_vo])
 
-        if role_binding_vo.workspace_id:
-            # Delete user from user groups
-            user_group_mgr = UserGroupManager()
-            user_group_vos = user_group_mgr.filter_user_groups(
-                users=role_binding_vo.user_id, domain_id=role_binding_vo.domain_id
-            )
-            for user_group_vo in user_group_vos:
-                users = user_group_vo.users
-                users.remove(role_binding_vo.user_id)
-                user_group_mgr.update_user_group_by_vo(
-                    {"users": users}, user_group_vo=user_group_vo
-                )
+    def delete_role_bindings(
+        self,
+        role_binding_vos: Union[QuerySet, List[RoleBinding]],
+        update_user_count: bool = True,
+    ) -> None:
+        role_binding_vos = list(role_binding_vos)
+        if not role_binding_vos:
+            return
+
+        _LOGGER.debug(
+            f"[delete_role_bindings] Delete role bindings: {len(role_binding_vos)}"
+        )
+
+        self.role_binding_model.filter(
+            role_binding_id=[rb_vo.role_binding_id for rb_vo in role_binding_vos]
+        ).delete()
+
+        if update_user_count:
+            self._update_workspace_user_counts(role_binding_vos, -1)
+
+        self._invalidate_user_access(role_binding_vos)
+
+        # Delete users from user groups
+        user_group_mgr = UserGroupManager()
+        for domain_id, user_ids in self._group_user_ids_by_domain(
+            [rb_vo for rb_vo in role_binding_vos if rb_vo.workspace_id]
+        ).items():
+            user_group_mgr.remove_users_from_user_groups(user_ids, domain_id)
 
     def get_role_binding(
         self, role_binding_id: str, domain_id: str, workspace_id: str = None
@@ -77,8 +214,239 @@ class RoleBindingManager(BaseManager):
     def filter_role_bindings(self, **conditions) -> QuerySet:
         return self.role_binding_model.filter(**conditions)
 
+    def get_user_role_bindings(
+        self, user_id: str, domain_id: str, use_local_cache: bool = True
+    ) -> List[dict]:
+        # Role bindings of a user are kept in process for a few seconds on top of the
+        # shared cache, which is invalidated whenever the user's bindings change.
+        # The local copy is only cleared in the process that made the change, so
+        # anything persisted from the result must set use_local_cache=False.
+        cache_key = f"identity:user-role-bindings:{domain_id}:{user_id}"
+        local_ttl = self._get_local_ttl() if use_local_cache else 0
+
+        if local_ttl > 0:
+            with self._local_cache_lock:
+                cached = self._local_cache.get(cache_key)
+
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
+        rb_infos = self._get_user_role_bindings(user_id, domain_id)
+
+        if local_ttl > 0:
+            with self._local_cache_lock:
+                self._local_cache[cache_key] = (time.monotonic() + local_ttl, rb_infos)
+                self._local_cache.move_to_end(cache_key)
+                if len(self._local_cache) > self.local_cache_max_keys:
+                    self._local_cache.popitem(last=False)
+
+        return rb_infos
+
+    @classmethod
+    def delete_user_role_bindings_cache(cls, domain_id: str, user_ids: List[str]):
+        cache_keys = [
+            f"identity:user-role-bindings:{domain_id}:{user_id}" for user_id in user_ids
+        ]
+
+        if cache_keys:
+            with cls._local_cache_lock:
+                for cache_key in cache_keys:
+                    cls._local_cache.pop(cache_key, None)
+
+            cache.delete(*cache_keys)
+
     def list_role_bindings(self, query: dict) -> Tuple[QuerySet, int]:
         return self.role_binding_model.query(**query)
 
     def stat_role_bindings(self, query: dict) -> dict:
         return self.role_binding_model.stat(**query)
+
+    def is_last_domain_admin(self, user_id: str, domain_id: str) -> bool:
+        # Only DOMAIN_ADMIN role bindings are joined to ENABLED users. The user is
+        # sorted first and at most one other admin is read, so the check does not
+        # depend on the number of users in the domain.
+        pipeline = [
+            {"$match": {"domain_id": domain_id, "role_type": "DOMAIN_ADMIN"}},
+            {"$group": {"_id": "$user_id"}},
+            {
+                "$lookup": {
+                    "from": User._get_collection_name(),
+                    "let": {"user_id": "$_id"},
+                    "pipeline": [
+                        {"$match": {"domain_id": domain_id, "state": "ENABLED"}},
+                        {"$match": {"$expr": {"$eq": ["$user_id", "$$user_id"]}}},
+                        {"$limit": 1},
+                        {"$project": {"_id": 1}},
+                    ],
+                    "as": "enabled_users",
+                }
+            },
+            {"$match": {"enabled_users": {"$ne": []}}},
+            {"$addFields": {"is_target": {"$eq": ["$_id", user_id]}}},
+            {"$sort": {"is_target": -1, "_id": 1}},
+            {"$limit": 2},
+        ]
+
+        admin_user_ids = [
+            result["_id"]
+            for result in self.role_binding_model.objects.aggregate(pipeline)
+        ]
+
+        return admin_user_ids == [user_id]
+
+    def count_users_by_workspace(
+        self, domain_id: str = None, workspace_ids: List[str] = None
+    ) -> Dict[Tuple[str, str], int]:
+        match = {"workspace_id": {"$nin": [None, "*"]}}
+
+        if domain_id:
+            match["domain_id"] = domain_id
+
+        if workspace_ids is not None:
+            match["workspace_id"]["$in"] = workspace_ids
+
+        pipeline = [
+            {"$match": match},
+            {
+                "$group": {
+                    "_id": {
+                        "domain_id": "$domain_id",
+                        "workspace_id": "$workspace_id",
+                        "user_id": "$user_id",
+                    }
+                }
+            },
+            {
+                "$group": {
+                    "_id": {
+                        "domain_id": "$_id.domain_id",
+                        "workspace_id": "$_id.workspace_id",
+                    },
+                    "user_count": {"$sum": 1},
+                }
+            },
+        ]
+
+        user_counts = {}
+        for result in self.role_binding_model.objects.aggregate(
+            pipeline, allowDiskUse=True
+        ):
+            key = (result["_id"]["domain_id"], result["_id"]["workspace_id"])
+            user_counts[key] = result["user_count"]
+
+        return user_counts
+
+    def refresh_workspace_user_counts(
+        self, workspace_ids: List[str], domain_id: str
+    ) -> int:
+        user_counts = self.count_users_by_workspace(domain_id, workspace_ids)
+
+        workspace_mgr = WorkspaceManager()
+        return workspace_mgr.reconcile_user_counts(
+            user_counts, domain_id=domain_id, workspace_ids=workspace_ids
+        )
+
+    def _update_workspace_user_counts(
+        self, role_binding_vos: List[RoleBinding], amount: int
+    ) -> None:
+        # A user counts once per workspace, so only their first or last role binding
+        # in a workspace changes user_count. Any drift is fixed by
+        # JobService.reconcile_workspace_user_count.
+        user_keys = {
+            (rb_vo.domain_id, rb_vo.workspace_id, rb_vo.user_id)
+            for rb_vo in role_binding_vos
+            if rb_vo.workspace_id and rb_vo.workspace_id != "*"
+        }
+
+        if not user_keys:
+            return
+
+        other_rb_vos = (
+            self.role_binding_model.filter(
+                domain_id=list({key[0] for key in user_keys}),
+                workspace_id=list({key[1] for key in user_keys}),
+                user_id=list({key[2] for key in user_keys}),
+            )
+            .filter(
+                role_binding_id__nin=[
+                    rb_vo.role_binding_id for rb_vo in role_binding_vos
+                ]
+            )
+            .only("domain_id", "workspace_id", "user_id")
+        )
+        user_keys -= {
+            (rb_vo.domain_id, rb_vo.workspace_id, rb_vo.user_id)
+            for rb_vo in other_rb_vos
+        }
+
+        workspace_user_counts = Counter(
+            (domain_id, workspace_id) for domain_id, workspace_id, _ in user_keys
+        )
+
+        workspace_mgr = WorkspaceManager()
+        for (domain_id, workspace_id), count in workspace_user_counts.items():
+            workspace_mgr.increment_user_count(workspace_id, domain_id, amount * count)
+
+    @staticmethod
+    def _group_user_ids_by_domain(
+        role_binding_vos: List[RoleBinding],
+    ) -> Dict[str, List[str]]:
+        user_ids_by_domain = {}
+        for rb_vo in role_binding_vos:
+            user_ids_by_domain.setdefault(rb_vo.domain_id, set()).add(rb_vo.user_id)
+
+        return {
+            domain_id: list(user_ids)
+            for domain_id, user_ids in user_ids_by_domain.items()
+        }
+
+    @single_flight.cacheable(
+        key="identity:user-role-bindings:{domain_id}:{user_id}",
+        expire=300,
+        early_refresh=30,
+    )
+    def _get_user_role_bindings(self, user_id: str, domain_id: str) -> List[dict]:
+        rb_vos = self.role_binding_model.filter(user_id=user_id, domain_id=domain_id)
+        return [
+            {
+                "role_binding_id": rb_vo.role_binding_id,
+                "role_type": rb_vo.role_type,
+                "user_id": rb_vo.user_id,
+                "role_id": rb_vo.role_id,
+                "resource_group": rb_vo.resource_group,
+                "workspace_id": rb_vo.workspace_id,
+                "workspace_group_id": rb_vo.workspace_group_id,
+                "domain_id": rb_vo.domain_id,
+                "created_at": utils.datetime_to_iso8601(rb_vo.created_at),
+            }
+            for rb_vo in rb_vos
+        ]
+
+    @staticmethod
+    def _get_local_ttl() -> int:
+        identity_conf = config.get_global("IDENTITY") or {}
+        return identity_conf.get("role_binding_cache", {}).get("local_ttl", 5)
+
+    @classmethod
+    def _reset_local_cache(cls) -> None:
+        cls._local_cache_lock = threading.Lock()
+        cls._local_cache = OrderedDict()
+
+    @classmethod
+    def _invalidate_user_access(cls, role_binding_vos: List[RoleBinding]) -> None:
+        for domain_id, user_ids in cls._group_user_ids_by_domain(
+            role_binding_vos
+        ).items():
+            cls._delete_user_access(domain_id, user_ids)
+
+    @classmethod
+    def _delete_user_access(cls, domain_id: str, user_ids: List[str]) -> None:
+        access_snapshot_mgr = AccessSnapshotManager()
+        access_snapshot_mgr.delete_access_snapshots(
+            user_id=user_ids, domain_id=domain_id
+        )
+        cls.delete_user_role_bindings_cache(domain_id, user_ids)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=RoleBindingManager._reset_local_cache)
@@ -6,6 +6,7 @@ from spaceone.core import cache, utils
 from spaceone.core.manager import BaseManager
 
 from spaceone.identity.error.error_role import ERROR_ROLE_IN_USED
+from spaceone.identity.manager.access_snapshot_manager import AccessSnapshotManager
 from spaceone.identity.manager.managed_resource_manager import ManagedResourceManager
 from spaceone.identity.manager.role_binding_manager import RoleBindingManager
 from spaceone.identity.model.role.database import Role
@@ -48,7 +49,10 @@ class RoleManager(BaseManager):
 
         self.transaction.add_rollback(_rollback, role_vo.to_dict())
 
-        return role_vo.update(params)
+        role_vo = role_vo.update(params)
+        self._invalidate_access_info(role_vo)
+
+        return role_vo
 
     def enable_role_by_vo(self, role_vo: Role) -> Role:
         self.update_role_by_vo({"state": "ENABLED"}, role_vo)
@@ -71,6 +75,7 @@ class RoleManager(BaseManager):
             )
 
         role_vo.delete()
+        RoleManager._invalidate_access_info(role_vo)
 
     def get_role(self, role_id: str, domain_id: str) -> Role:
         return self.role_model.get(role_id=role_id, domain_id=domain_id)
@@ -85,6 +90,17 @@ class RoleManager(BaseManager):
     def stat_roles(self, query: dict) -> dict:
         return self.role_model.stat(**query)
 
+    @staticmethod
+    def _invalidate_access_info(role_vo: Role) -> None:
+        cache.delete_pattern(
+            f"identity:role-permissions:{role_vo.domain_id}:{role_vo.role_id}"
+        )
+        cache.delete_pattern(f"identity:app-check:{role_vo.domain_id}:*")
+        access_snapshot_mgr = AccessSnapshotManager()
+        access_snapshot_mgr.delete_access_snapshots(
+            role_id=role_vo.role_id, domain_id=role_vo.domain_id
+        )
+
     @cache.cacheable(key="identity:managed-role:{domain_id}:sync", expire=300)
     def _create_managed_role(self, domain_id: str) -> bool:
         managed_resource_mgr = ManagedResourceManager()
@@ -1,6 +1,8 @@
 import logging
-from typing import Tuple, List
+from datetime import datetime
+from typing import Dict, Tuple, List
 from mongoengine import QuerySet
+from pymongo import UpdateOne
 
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
@@ -57,6 +59,26 @@ class ServiceAccountManager(BaseManager):
 
         return service_account_vo.update(params)
 
+    def update_secret_data_hashes(self, secret_data_hashes: Dict[str, str]) -> None:
+        hashed_at = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"service_account_id": service_account_id},
+                {
+                    "$set": {
+                        "secret_data_hash": secret_data_hash,
+                        "secret_data_hashed_at": hashed_at,
+                    }
+                },
+            )
+            for service_account_id, secret_data_hash in secret_data_hashes.items()
+        ]
+
+        if operations:
+            self.service_account_model._get_collection().bulk_write(
+                operations, ordered=False
+            )
+
     @staticmethod
     def delete_service_account_by_vo(service_account_vo: ServiceAccount) -> None:
         service_account_vo.delete()
@@ -0,0 +1,798 @@
+import hashlib
+import json
+import logging
+import secrets
+import sys
+from datetime import datetime
+from typing import Dict, List, Tuple, Type
+
+from mongoengine import QuerySet
+from pymongo import UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError
+from spaceone.core import cache, config, utils
+from spaceone.core.manager import BaseManager
+from spaceone.core.model.mongo_model import MongoModel
+
+from spaceone.identity.conf.global_conf import WORKSPACE_COLORS_NAME
+from spaceone.identity.manager.access_snapshot_manager import AccessSnapshotManager
+from spaceone.identity.manager.project_group_manager import ProjectGroupManager
+from spaceone.identity.model.project.database import Project
+from spaceone.identity.model.project_group.database import ProjectGroup
+from spaceone.identity.model.service_account.database import ServiceAccount
+from spaceone.identity.model.trusted_account.database import TrustedAccount
+from spaceone.identity.model.workspace.database import Workspace
+
+_LOGGER = logging.getLogger(__name__)
+
+RESOURCE_TYPES = ["workspace", "project_group", "project", "service_account"]
+TOUCH_BATCH_SIZE = 1000
+
+
+class ServiceAccountSyncManager(BaseManager):
+    """Reconciles account collector results with managed resources in bulk.
+
+    Managed resources in the scope of the trusted account are loaded once into maps
+    keyed by reference_id (workspaces by name), so matching a result is a dict lookup.
+    Upserts are planned for all results first and applied per collection with
+    bulk_write, one hierarchy level at a time: workspaces, project groups (by depth),
+    projects and service accounts. Created, updated and unchanged counts are kept
+    per resource type in stats.
+
+    Project groups, projects and service accounts store a sync_fingerprint of their
+    collected content, so unchanged resources are not rewritten. They only get a
+    batched last_synced_at touch, which IDENTITY.account_sync.lazy_sync skips.
+
+    sync_results can be called once per chunk of a streamed sync. Resources already
+    synced by an earlier chunk are neither counted nor touched again.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.workspace_model = Workspace
+        self.project_group_model = ProjectGroup
+        self.project_model = Project
+        self.service_account_model = ServiceAccount
+        self.project_group_mgr = ProjectGroupManager()
+        self.stats = {
+            resource_type: {"created": 0, "updated": 0, "unchanged": 0, "failed": 0}
+            for resource_type in RESOURCE_TYPES
+        }
+        self.preload_stats = {}
+        self.synced_at = datetime.utcnow()
+        self._resources = None
+        self._synced_keys = {resource_type: set() for resource_type in RESOURCE_TYPES}
+
+    def get_metrics(self) -> dict:
+        return {"sync": self.stats, "preload": self.preload_stats}
+
+    def sync_results(
+        self,
+        results: List[dict],
+        trusted_account_vo: TrustedAccount,
+        provider: str,
+        sync_options: dict,
+    ) -> List[Tuple[dict, str]]:
+        """Returns (result, service_account_id) of every synced account"""
+
+        domain_id = trusted_account_vo.domain_id
+        trusted_account_id = trusted_account_vo.trusted_account_id
+        resource_group = trusted_account_vo.resource_group
+        synced_at = self.synced_at
+
+        items = []
+        workspace_references = {}
+        single_workspace_id = sync_options.get("single_workspace_id")
+
+        if resource_group == "DOMAIN" and single_workspace_id:
+            self.workspace_model.get(
+                workspace_id=single_workspace_id, domain_id=domain_id
+            )
+
+        self._load_resources(trusted_account_vo, provider)
+
+        for result in results:
+            location = self._get_location(result, resource_group, sync_options)
+
+            item = {"result": result, "location": location}
+
+            if resource_group == "DOMAIN":
+                if single_workspace_id:
+                    item["workspace_id"] = single_workspace_id
+                elif location:
+                    workspace_info, item["location"] = location[0], location[1:]
+                    item["workspace_name"] = workspace_info.get("name")
+                    references = workspace_references.setdefault(
+                        item["workspace_name"], []
+                    )
+                    if workspace_info.get("resource_id") not in references:
+                        references.append(workspace_info.get("resource_id"))
+                else:
+                    _LOGGER.debug(f"[sync_results] location is empty => SKIP")
+                    continue
+            else:
+                item["workspace_id"] = trusted_account_vo.workspace_id
+
+            items.append(item)
+
+        workspace_ids = self._sync_workspaces(
+            domain_id, trusted_account_id, workspace_references, synced_at
+        )
+
+        for item in items:
+            if "workspace_name" in item:
+                item["workspace_id"] = workspace_ids.get(item["workspace_name"])
+
+        items = [item for item in items if item["workspace_id"]]
+
+        project_group_ids = self._sync_project_groups(
+            domain_id, trusted_account_id, items, synced_at
+        )
+        project_ids = self._sync_projects(
+            domain_id, trusted_account_id, items, project_group_ids, synced_at
+        )
+
+        if items:
+            self._invalidate_access_info(domain_id, items)
+
+        service_account_ids = self._sync_service_accounts(
+            domain_id, trusted_account_id, provider, items, project_ids, synced_at
+        )
+
+        synced_accounts = []
+        for item in items:
+            project_id = project_ids.get(
+                (item["workspace_id"], item["result"]["resource_id"])
+            )
+            service_account_id = service_account_ids.get(
+                (project_id, item["result"]["resource_id"])
+            )
+            if service_account_id:
+                synced_accounts.append((item["result"], service_account_id))
+
+        return synced_accounts
+
+    def _sync_workspaces(
+        self,
+        domain_id: str,
+        trusted_account_id: str,
+        workspace_references: Dict[str, List[str]],
+        synced_at: datetime,
+    ) -> Dict[str, str]:
+        if not workspace_references:
+            return {}
+
+        existing_workspaces = self._resources["workspace"]
+
+        creates = {}
+        updates = {}
+        for name, references in workspace_references.items():
+            if workspace := existing_workspaces.get(name):
+                old_references = workspace.get("references") or []
+                new_references = old_references + [
+                    ref for ref in references if ref not in old_references
+                ]
+                changes = self._get_changes(
+                    workspace,
+                    {
+                        "trusted_account_id": trusted_account_id,
+                        "is_managed": True,
+                        "references": new_references,
+                    },
+                )
+                updates[name] = (workspace["workspace_id"], changes)
+            else:
+                creates[name] = {
+                    "name": name,
+                    "tags": self._set_workspace_theme(),
+                    "references": references,
+                    "trusted_account_id": trusted_account_id,
+                    "is_managed": True,
+                    "dormant_ttl": -1,
+                    "service_account_count": 0,
+                    "user_count": 0,
+                    "cost_info": {"day": 0, "month": 0},
+                    "domain_id": domain_id,
+                    "last_synced_at": synced_at,
+                }
+
+        workspace_ids = self._bulk_upsert(
+            "workspace",
+            self.workspace_model,
+            "workspace_id",
+            creates,
+            updates,
+            synced_at,
+        )
+
+        # A reference belongs to one workspace, so drop it from any other workspace
+        operations = [
+            UpdateMany(
+                {
+                    "domain_id": domain_id,
+                    "workspace_id": {"$ne": workspace_ids[name]},
+                    "references": {"$in": references},
+                },
+                {"$pullAll": {"references": references}},
+            )
+            for name, references in workspace_references.items()
+            if name in workspace_ids
+        ]
+        if operations:
+            self.workspace_model._get_collection().bulk_write(operations, ordered=False)
+
+            owners = {
+                ref: workspace_ids[name]
+                for name, references in workspace_references.items()
+                if name in workspace_ids
+                for ref in references
+            }
+            for workspace in existing_workspaces.values():
+                if workspace.get("references"):
+                    workspace["references"] = [
+                        ref
+                        for ref in workspace["references"]
+                        if owners.get(ref, workspace["workspace_id"])
+                        == workspace["workspace_id"]
+                    ]
+
+        return workspace_ids
+
+    def _sync_project_groups(
+        self,
+        domain_id: str,
+        trusted_account_id: str,
+        items: List[dict],
+        synced_at: datetime,
+    ) -> Dict[Tuple[str, str], str]:
+        # Project groups are keyed by (workspace_id, reference_id) and synced by depth
+        # so that parents exist before their children.
+        levels = []
+        for item in items:
+            parent_key = None
+            for depth, location_info in enumerate(item["location"]):
+                key = (item["workspace_id"], location_info["resource_id"])
+                if len(levels) <= depth:
+                    levels.append({})
+
+                levels[depth][key] = {
+                    "name": location_info["name"],
+                    "parent": parent_key,
+                }
+                parent_key = key
+
+            item["project_group"] = parent_key
+
+        project_group_ids = {}
+        ancestors_map = {}
+
+        existing_project_groups = self._resources["project_group"]
+
+        for level in levels:
+            creates = {}
+            updates = {}
+            parent_changes = {}
+            for key, node in level.items():
+                parent_group_id = project_group_ids.get(node["parent"])
+                if node["parent"] and parent_group_id is None:
+                    self.stats["project_group"]["failed"] += 1
+                    continue
+
+                data = {"name": node["name"], "trusted_account_id": trusted_account_id}
+                content = {**data, "parent_group_id": parent_group_id}
+
+                if project_group := existing_project_groups.get(key):
+                    updates[key] = (
+                        project_group["project_group_id"],
+                        self._get_changes(project_group, data, content),
+                    )
+                    ancestors_map[key] = project_group["ancestors"]
+
+                    if (
+                        parent_group_id
+                        and project_group.get("parent_group_id") != parent_group_id
+                    ):
+                        parent_changes[key] = parent_group_id
+                else:
+                    creates[key] = {
+                        **content,
+                        "reference_id": key[1],
+                        "is_managed": True,
+                        "ancestors": (
+                            ancestors_map[node["parent"]] + [parent_group_id]
+                            if parent_group_id
+                            else []
+                        ),
+                        "workspace_id": key[0],
+                        "domain_id": domain_id,
+                        "last_synced_at": synced_at,
+                        "sync_fingerprint": self._make_fingerprint(content),
+                    }
+                    ancestors_map[key] = creates[key]["ancestors"]
+
+            project_group_ids.update(
+                self._bulk_upsert(
+                    "project_group",
+                    self.project_group_model,
+                    "project_group_id",
+                    creates,
+                    updates,
+                    synced_at,
+                )
+            )
+
+            # Moving a project group also rewrites the ancestors of its descendants
+            for key, parent_group_id in parent_changes.items():
+                project_group_vo = self.project_group_mgr.get_project_group(
+                    updates[key][0], domain_id
+                )
+                project_group_vo = self.project_group_mgr.change_parent_group_by_vo(
+                    parent_group_id, project_group_vo
+                )
+                ancestors_map[key] = project_group_vo.ancestors
+                self._reload_ancestors(domain_id, project_group_vo)
+                if not updates[key][1]:
+                    self.stats["project_group"]["unchanged"] -= 1
+                    self.stats["project_group"]["updated"] += 1
+
+        return project_group_ids
+
+    def _sync_projects(
+        self,
+        domain_id: str,
+        trusted_account_id: str,
+        items: List[dict],
+        project_group_ids: Dict[Tuple[str, str], str],
+        synced_at: datetime,
+    ) -> Dict[Tuple[str, str], str]:
+        nodes = {}
+        for item in items:
+            key = (item["workspace_id"], item["result"]["resource_id"])
+            nodes[key] = {
+                "name": item["result"]["name"],
+                "project_group_id": project_group_ids.get(item["project_group"]),
+            }
+
+        existing_projects = self._resources["project"]
+
+        creates = {}
+        updates = {}
+        for key, node in nodes.items():
+            data = {"name": node["name"], "trusted_account_id": trusted_account_id}
+            if node["project_group_id"]:
+                data["project_group_id"] = node["project_group_id"]
+
+            if project := existing_projects.get(key):
+                updates[key] = (
+                    project["project_id"],
+                    self._get_changes(project, data, data),
+                )
+            else:
+                fingerprint = self._make_fingerprint(data)
+                data.update(
+                    {
+                        "project_type": "PRIVATE",
+                        "reference_id": key[1],
+                        "is_managed": True,
+                        "workspace_id": key[0],
+                        "domain_id": domain_id,
+                        "last_synced_at": synced_at,
+                        "sync_fingerprint": fingerprint,
+                    }
+                )
+                creates[key] = data
+
+        return self._bulk_upsert(
+            "project", self.project_model, "project_id", creates, updates, synced_at
+        )
+
+    def _sync_service_accounts(
+        self,
+        domain_id: str,
+        trusted_account_id: str,
+        provider: str,
+        items: List[dict],
+        project_ids: Dict[Tuple[str, str], str],
+        synced_at: datetime,
+    ) -> Dict[Tuple[str, str], str]:
+        nodes = {}
+        for item in items:
+            result = item["result"]
+            project_id = project_ids.get((item["workspace_id"], result["resource_id"]))
+            if project_id is None:
+                self.stats["service_account"]["failed"] += 1
+                continue
+
+            nodes[(project_id, result["resource_id"])] = {
+                "workspace_id": item["workspace_id"],
+                "result": result,
+            }
+
+        if not nodes:
+            return {}
+
+        existing_service_accounts = self._resources["service_account"]
+
+        creates = {}
+        updates = {}
+        for key, node in nodes.items():
+            result = node["result"]
+            data = {"name": result["name"], "trusted_account_id": trusted_account_id}
+            content = {
+                **data,
+                "tags": result.get("tags", {}),
+                "data": result.get("data", {}),
+                "secret_data": self.make_secret_data_hash(result),
+            }
+
+            if service_account := existing_service_accounts.get(key):
+                updates[key] = (
+                    service_account["service_account_id"],
+                    self._get_changes(service_account, data, content),
+                )
+            else:
+                data.update(
+                    {
+                        "state": "ACTIVE",
+                        "data": result.get("data", {}),
+                        "tags": result.get("tags", {}),
+                        "provider": provider,
+                        "reference_id": key[1],
+                        "is_managed": True,
+                        "secret_schema_id": result.get("secret_schema_id"),
+                        "cost_info": {"day": 0, "month": 0},
+                        "project_id": key[0],
+                        "workspace_id": node["workspace_id"],
+                        "domain_id": domain_id,
+                        "last_synced_at": synced_at,
+                        "sync_fingerprint": self._make_fingerprint(content),
+                    }
+                )
+                creates[key] = data
+
+        return self._bulk_upsert(
+            "service_account",
+            self.service_account_model,
+            "service_account_id",
+            creates,
+            updates,
+            synced_at,
+        )
+
+    def _bulk_upsert(
+        self,
+        resource_type: str,
+        model_cls: Type[MongoModel],
+        id_field: str,
+        creates: Dict[tuple, dict],
+        updates: Dict[tuple, Tuple[str, dict]],
+        synced_at: datetime,
+    ) -> Dict[tuple, str]:
+        stats = self.stats[resource_type]
+        resource_map = self._resources[resource_type]
+        synced_keys = self._synced_keys[resource_type]
+        resource_ids = {}
+
+        # Resources that fail to update are still returned since they exist.
+        unchanged_ids = []
+        for key, (resource_id, changes) in updates.items():
+            if not changes:
+                resource_ids[key] = resource_id
+                if key not in synced_keys:
+                    unchanged_ids.append(resource_id)
+                    stats["unchanged"] += 1
+
+        if unchanged_ids and not self._is_lazy_sync():
+            self._touch(model_cls, id_field, unchanged_ids, synced_at)
+
+        keys = [key for key, (_, changes) in updates.items() if changes]
+        operations = [
+            UpdateOne(
+                {id_field: updates[key][0]},
+                {"$set": {**updates[key][1], "last_synced_at": synced_at}},
+            )
+            for key in keys
+        ]
+        failed_indexes = self._write(model_cls, operations)
+
+        for index, key in enumerate(keys):
+            resource_id, changes = updates[key]
+            resource_ids[key] = resource_id
+            if index in failed_indexes:
+                stats["failed"] += 1
+            else:
+                resource_map[key].update(changes)
+                stats["updated"] += 1
+
+        keys = list(creates.keys())
+        documents = [self._make_document(model_cls, creates[key]) for key in keys]
+        failed_indexes = self._write(model_cls, documents, insert=True)
+
+        for index, key in enumerate(keys):
+            if index in failed_indexes:
+                stats["failed"] += 1
+            else:
+                resource_map[key] = documents[index]
+                resource_ids[key] = documents[index][id_field]
+                stats["created"] += 1
+
+        synced_keys.update(resource_ids.keys())
+
+        _LOGGER.debug(f"[_bulk_upsert] {resource_type}: {stats}")
+        return resource_ids
+
+    def _load_resources(
+        self, trusted_account_vo: TrustedAccount, provider: str
+    ) -> None:
+        if self._resources is not None:
+            return
+
+        domain_id = trusted_account_vo.domain_id
+        conditions = {"domain_id": domain_id, "is_managed": True}
+        if trusted_account_vo.resource_group == "WORKSPACE":
+            conditions["workspace_id"] = trusted_account_vo.workspace_id
+
+        resources = {resource_type: {} for resource_type in RESOURCE_TYPES}
+
+        if trusted_account_vo.resource_group == "DOMAIN":
+            for workspace in (
+                self.workspace_model.filter(domain_id=domain_id)
+                .only(
+                    "workspace_id",
+                    "name",
+                    "references",
+                    "trusted_account_id",
+                    "is_managed",
+                )
+                .as_pymongo()
+            ):
+                resources["workspace"].setdefault(workspace["name"], workspace)
+
+        project_groups = list(self._filter_project_groups(**conditions))
+        workspace_ids = {
+            project_group["workspace_id"]
+            for project_group in project_groups
+            if project_group.get("ancestors") is None
+        }
+        if workspace_ids:
+            for workspace_id in workspace_ids:
+                self.project_group_mgr.rebuild_project_group_ancestors(
+                    domain_id, workspace_id
+                )
+            project_groups = list(self._filter_project_groups(**conditions))
+
+        for project_group in project_groups:
+            resources["project_group"].setdefault(
+                (project_group["workspace_id"], project_group.get("reference_id")),
+                project_group,
+            )
+
+        for project in (
+            self.project_model.filter(project_type="PRIVATE", **conditions)
+            .only(
+                "project_id",
+                "name",
+                "reference_id",
+                "trusted_account_id",
+                "sync_fingerprint",
+                "project_group_id",
+                "workspace_id",
+            )
+            .as_pymongo()
+        ):
+            resources["project"].setdefault(
+                (project["workspace_id"], project.get("reference_id")), project
+            )
+
+        for service_account in (
+            self.service_account_model.filter(provider=provider, **conditions)
+            .only(
+                "service_account_id",
+                "name",
+                "reference_id",
+                "trusted_account_id",
+                "sync_fingerprint",
+                "project_id",
+            )
+            .as_pymongo()
+        ):
+            resources["service_account"].setdefault(
+                (service_account["project_id"], service_account.get("reference_id")),
+                service_account,
+            )
+
+        self._resources = resources
+        self.preload_stats = {
+            resource_type: len(resource_map)
+            for resource_type, resource_map in resources.items()
+        }
+        self.preload_stats["memory_bytes"] = self._get_memory_size(resources)
+
+        _LOGGER.debug(f"[_load_resources] preloaded resources: {self.preload_stats}")
+
+    def _filter_project_groups(self, **conditions) -> QuerySet:
+        return (
+            self.project_group_model.filter(**conditions)
+            .only(
+                "project_group_id",
+                "name",
+                "reference_id",
+                "trusted_account_id",
+                "sync_fingerprint",
+                "parent_group_id",
+                "ancestors",
+                "workspace_id",
+            )
+            .as_pymongo()
+        )
+
+    def _reload_ancestors(self, domain_id: str, project_group_vo: ProjectGroup) -> None:
+        project_group_map = {
+            project_group["project_group_id"]: project_group
+            for project_group in self._resources["project_group"].values()
+        }
+
+        moved_project_groups = [
+            {
+                "project_group_id": project_group_vo.project_group_id,
+                "parent_group_id": project_group_vo.parent_group_id,
+                "ancestors": project_group_vo.ancestors,
+            }
+        ]
+        moved_project_groups.extend(
+            self._filter_project_groups(
+                domain_id=domain_id, ancestors=project_group_vo.project_group_id
+            )
+        )
+
+        for project_group in moved_project_groups:
+            if preloaded := project_group_map.get(project_group["project_group_id"]):
+                preloaded["parent_group_id"] = project_group.get("parent_group_id")
+                preloaded["ancestors"] = project_group.get("ancestors")
+
+    def _touch(
+        self,
+        model_cls: Type[MongoModel],
+        id_field: str,
+        resource_ids: List[str],
+        synced_at: datetime,
+    ) -> None:
+        operations = [
+            UpdateMany(
+                {id_field: {"$in": resource_ids[i : i + TOUCH_BATCH_SIZE]}},
+                {"$set": {"last_synced_at": synced_at}},
+            )
+            for i in range(0, len(resource_ids), TOUCH_BATCH_SIZE)
+        ]
+        self._write(model_cls, operations)
+
+    def _get_changes(self, resource: dict, data: dict, content: dict = None) -> dict:
+        # With content, fields are compared only if its fingerprint has changed
+        if content is not None:
+            fingerprint = self._make_fingerprint(content)
+            if resource.get("sync_fingerprint") == fingerprint:
+                return {}
+
+        changes = {
+            key: value for key, value in data.items() if resource.get(key) != value
+        }
+
+        if content is not None:
+            changes["sync_fingerprint"] = fingerprint
+
+        return changes
+
+    @classmethod
+    def make_secret_data_hash(cls, result: dict) -> str:
+        return cls._make_fingerprint(
+            {
+                "secret_data": result.get("secret_data", {}),
+                "secret_schema_id": result.get("secret_schema_id"),
+            }
+        )
+
+    @staticmethod
+    def _make_fingerprint(content: dict) -> str:
+        content_json = json.dumps(content, sort_keys=True, default=str)
+        return hashlib.sha256(content_json.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _is_lazy_sync() -> bool:
+        identity_conf = config.get_global("IDENTITY") or {}
+        return identity_conf.get("account_sync", {}).get("lazy_sync", False)
+
+    @classmethod
+    def _get_memory_size(cls, value) -> int:
+        size = sys.getsizeof(value)
+        if isinstance(value, dict):
+            size += sum(
+                cls._get_memory_size(k) + cls._get_memory_size(v)
+                for k, v in value.items()
+            )
+        elif isinstance(value, (list, tuple)):
+            size += sum(cls._get_memory_size(v) for v in value)
+
+        return size
+
+    @staticmethod
+    def _make_document(model_cls: Type[MongoModel], data: dict) -> dict:
+        # Same defaults as MongoModel.create, without its per-document unique checks
+        create_data = {}
+        now = datetime.utcnow()
+        for name, field in model_cls._fields.items():
+            if name in data:
+                create_data[name] = data[name]
+            elif generate_id := getattr(field, "generate_id", None):
+                create_data[name] = utils.generate_id(generate_id)
+            elif getattr(field, "auto_now", False) or getattr(
+                field, "auto_now_add", False
+            ):
+                create_data[name] = now
+
+        return model_cls(**create_data).to_mongo().to_dict()
+
+    @staticmethod
+    def _write(
+        model_cls: Type[MongoModel], requests: list, insert: bool = False
+    ) -> set:
+        # Returns the indexes of failed requests, e.g. duplicated unique names
+        if not requests:
+            return set()
+
+        collection = model_cls._get_collection()
+        try:
+            if insert:
+                collection.insert_many(requests, ordered=False)
+            else:
+                collection.bulk_write(requests, ordered=False)
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            if write_errors:
+                _LOGGER.error(
+                    f"[_write] Failed to write {model_cls.__name__}: "
+                    f"{len(write_errors)} ({write_errors[0].get('errmsg')})"
+                )
+            return {write_error["index"] for write_error in write_errors}
+
+        return set()
+
+    @staticmethod
+    def _invalidate_access_info(domain_id: str, items: List[dict]) -> None:
+        cache.delete_pattern(f"identity:project-group:{domain_id}:*")
+        cache.delete_pattern(f"identity:app-check:{domain_id}:*")
+        access_snapshot_mgr = AccessSnapshotManager()
+        access_snapshot_mgr.delete_access_snapshots(
+            domain_id=domain_id,
+            workspace_id=list({item["workspace_id"] for item in items}),
+        )
+
+    @staticmethod
+    def _get_location(
+        result: dict, resource_group: str, sync_options: dict
+    ) -> List[dict]:
+        location = result.get("location", [])
+        skip_project_group_option = sync_options.get("skip_project_group")
+
+        if skip_project_group_option:
+            if resource_group == "DOMAIN":
+                if location:
+                    location = [location[0]]
+            else:
+                location = []
+
+        else:
+            if resource_group == "DOMAIN" and not location:
+                _LOGGER.debug(
+                    f"[_get_location] location is empty: {result} {sync_options} => SKIP"
+                )
+
+        return location
+
+    @staticmethod
+    def _set_workspace_theme(tags: dict = None) -> dict:
+        theme = secrets.choice(WORKSPACE_COLORS_NAME)
+        if tags:
+            tags.update({"theme": theme})
+        else:
+            tags = {"theme": theme}
+
+        return tags
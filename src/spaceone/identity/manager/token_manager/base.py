@@ -1,7 +1,6 @@
 import logging
 import secrets
 from abc import abstractmethod, ABC
-from datetime import datetime
 from typing import Union
 
 from spaceone.core import config, cache
@@ -9,7 +8,9 @@ from spaceone.core.manager import BaseManager
 from spaceone.identity.error.error_authentication import *
 
 from spaceone.identity.error.error_token import *
+from spaceone.identity.lib.access_time_buffer import AccessTimeBuffer
 from spaceone.identity.lib.key_generator import KeyGenerator
+from spaceone.identity.model.user.database import User
 
 __all__ = ["TokenManager"]
 _LOGGER = logging.getLogger(__name__)
@@ -47,6 +48,7 @@ class TokenManager(BaseManager, ABC):
         timeout=None,
         permissions=None,
         projects=None,
+        public_projects=False,
         user_groups=None,
         app_id=None,
     ):
@@ -79,6 +81,7 @@ class TokenManager(BaseManager, ABC):
             workspace_id=workspace_id,
             permissions=permissions,
             projects=projects,
+            public_projects=public_projects,
             users_group=user_groups,
             identity_base_url=identity_base_url,
         )
@@ -88,7 +91,9 @@ class TokenManager(BaseManager, ABC):
         )
         if self.owner_type != "SYSTEM":
             # todo: remove
-            self.user.update({"last_accessed_at": datetime.utcnow()})
+            AccessTimeBuffer.record(
+                User, user_id=self.user.user_id, domain_id=self.user.domain_id
+            )
 
         return {"access_token": access_token, "refresh_token": refresh_token}
 
@@ -62,15 +62,17 @@ class GrantTokenManager(TokenManager):
         role_type = self.user.role_type
 
         if role_type in ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]:
-            rb_vos = self.rb_mgr.filter_role_bindings(
-                user_id=self.user.user_id,
-                domain_id=self.user.domain_id,
-                role_type=["WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
-                workspace_id=workspace_id,
+            rb_infos = self.rb_mgr.get_user_role_bindings(
+                self.user.user_id, self.user.domain_id
             )
 
-            if rb_vos.count() > 0:
-                role_type = rb_vos[0].role_type
+            for rb_info in rb_infos:
+                if (
+                    rb_info["role_type"] in ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]
+                    and rb_info["workspace_id"] == workspace_id
+                ):
+                    role_type = rb_info["role_type"]
+                    break
 
         return role_type
 
@@ -1,9 +1,10 @@
 import logging
-from typing import Tuple
+from typing import Dict, List, Tuple
 
 from mongoengine import QuerySet
 from spaceone.core.manager import BaseManager
 
+from spaceone.identity.manager.access_snapshot_manager import AccessSnapshotManager
 from spaceone.identity.model.user_group.database import UserGroup
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,6 +26,8 @@ class UserGroupManager(BaseManager):
 
         self.transaction.add_rollback(_rollback, user_group_vo)
 
+        self._delete_access_snapshots(user_group_vo)
+
         return user_group_vo
 
     def update_user_group_by_vo(
@@ -37,11 +40,59 @@ class UserGroupManager(BaseManager):
             user_group_vo.update(old_data)
 
         self.transaction.add_rollback(_rollback, user_group_vo.to_dict())
-        return user_group_vo.update(params)
+        user_group_vo = user_group_vo.update(params)
+        self._delete_access_snapshots(user_group_vo)
 
-    @staticmethod
-    def delete_user_group_by_vo(user_group_vo: UserGroup) -> None:
+        return user_group_vo
+
+    def delete_user_group_by_vo(self, user_group_vo: UserGroup) -> None:
         user_group_vo.delete()
+        self._delete_access_snapshots(user_group_vo)
+
+    def remove_users_from_user_groups(
+        self, user_ids: List[str], domain_id: str, workspace_id: str = None
+    ) -> None:
+        def _rollback(removed_users: Dict[str, List[str]]):
+            _LOGGER.info(
+                f"[remove_users_from_user_groups._rollback] Restore users to "
+                f"user_groups: {list(removed_users.keys())}"
+            )
+            for user_group_id, group_user_ids in removed_users.items():
+                self.filter_user_groups(
+                    user_group_id=user_group_id, domain_id=domain_id
+                ).update(add_to_set__users=group_user_ids)
+
+            self._delete_workspace_access_snapshots(domain_id, workspace_ids)
+
+        conditions = {"users": user_ids, "domain_id": domain_id}
+
+        if workspace_id:
+            conditions["workspace_id"] = workspace_id
+
+        user_group_vos = self.filter_user_groups(**conditions)
+
+        removed_users = {}
+        workspace_ids = set()
+        for user_group_vo in user_group_vos.only(
+            "user_group_id", "users", "workspace_id"
+        ):
+            removed_users[user_group_vo.user_group_id] = [
+                user_id for user_id in user_ids if user_id in user_group_vo.users
+            ]
+            workspace_ids.add(user_group_vo.workspace_id)
+
+        if not removed_users:
+            return
+
+        workspace_ids = list(workspace_ids)
+
+        self.filter_user_groups(
+            user_group_id=list(removed_users.keys()), domain_id=domain_id
+        ).update(pull_all__users=user_ids)
+
+        self.transaction.add_rollback(_rollback, removed_users)
+
+        self._delete_workspace_access_snapshots(domain_id, workspace_ids)
 
     def get_user_group(
         self, user_group_id: str, domain_id: str, workspace_id: str = None
@@ -61,3 +112,19 @@ class UserGroupManager(BaseManager):
 
     def stat_user_group(self, query: dict) -> dict:
         return self.user_group_model.stat(**query)
+
+    @staticmethod
+    def _delete_access_snapshots(user_group_vo: UserGroup) -> None:
+        access_snapshot_mgr = AccessSnapshotManager()
+        access_snapshot_mgr.delete_access_snapshots(
+            domain_id=user_group_vo.domain_id, workspace_id=user_group_vo.workspace_id
+        )
+
+    @staticmethod
+    def _delete_workspace_access_snapshots(
+        domain_id: str, workspace_ids: List[str]
+    ) -> None:
+        access_snapshot_mgr = AccessSnapshotManager()
+        access_snapshot_mgr.delete_access_snapshots(
+            domain_id=domain_id, workspace_id=workspace_ids
+        )
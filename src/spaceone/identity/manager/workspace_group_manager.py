@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime
 from typing import Dict, List, Tuple
 
 from mongoengine import QuerySet
@@ -48,6 +49,50 @@ class WorkspaceGroupManager(BaseManager):
 
         return workspace_group_vo.update(params)
 
+    def update_user_role_by_vo(
+        self,
+        user_id: str,
+        role_id: str,
+        role_type: str,
+        workspace_group_vo: WorkspaceGroup,
+    ) -> WorkspaceGroup:
+        old_user_info = next(
+            (
+                user_info
+                for user_info in workspace_group_vo.users or []
+                if user_info.user_id == user_id
+            ),
+            None,
+        )
+
+        if old_user_info is None:
+            return workspace_group_vo
+
+        def _set_user_role(_role_id: str, _role_type: str) -> WorkspaceGroup:
+            return self.workspace_group_model.objects(
+                workspace_group_id=workspace_group_vo.workspace_group_id,
+                domain_id=workspace_group_vo.domain_id,
+                users__user_id=user_id,
+            ).modify(
+                new=True,
+                set__users__S__role_id=_role_id,
+                set__users__S__role_type=_role_type,
+                set__updated_at=datetime.utcnow(),
+            )
+
+        def _rollback(old_role_id: str, old_role_type: str):
+            _LOGGER.info(
+                f"[update_user_role_by_vo._rollback] Revert role : {user_id} "
+                f"({workspace_group_vo.workspace_group_id})"
+            )
+            _set_user_role(old_role_id, old_role_type)
+
+        self.transaction.add_rollback(
+            _rollback, old_user_info.role_id, old_user_info.role_type
+        )
+
+        return _set_user_role(role_id, role_type) or workspace_group_vo
+
     def delete_workspace_group_by_vo(self, workspace_group_vo: WorkspaceGroup) -> None:
         workspace_vos = self.workspace_manager.filter_workspaces(
             workspace_group_id=workspace_group_vo.workspace_group_id,
@@ -2,9 +2,11 @@ import logging
 from typing import Dict, List, Tuple
 
 from mongoengine import QuerySet
+from pymongo import UpdateOne
 
 from spaceone.core import cache
 from spaceone.core.manager import BaseManager
+from spaceone.identity.manager.access_snapshot_manager import AccessSnapshotManager
 from spaceone.identity.model.workspace.database import Workspace
 
 _LOGGER = logging.getLogger(__name__)
@@ -53,12 +55,19 @@ class WorkspaceManager(BaseManager):
         cache.delete_pattern(
             f"identity:workspace-state:{workspace_vo.domain_id}:{workspace_vo.workspace_id}"
         )
+        cache.delete_pattern(f"identity:app-check:{workspace_vo.domain_id}:*")
+
+        access_snapshot_mgr = AccessSnapshotManager()
+        access_snapshot_mgr.delete_access_snapshots(
+            domain_id=workspace_vo.domain_id, workspace_id=workspace_vo.workspace_id
+        )
 
     def enable_workspace(self, workspace_vo: Workspace) -> Workspace:
         self.update_workspace_by_vo({"state": "ENABLED"}, workspace_vo)
         cache.delete_pattern(
             f"identity:workspace-state:{workspace_vo.domain_id}:{workspace_vo.workspace_id}"
         )
+        cache.delete_pattern(f"identity:app-check:{workspace_vo.domain_id}:*")
 
         return workspace_vo
 
@@ -67,9 +76,59 @@ class WorkspaceManager(BaseManager):
         cache.delete_pattern(
             f"identity:workspace-state:{workspace_vo.domain_id}:{workspace_vo.workspace_id}"
         )
+        cache.delete_pattern(f"identity:app-check:{workspace_vo.domain_id}:*")
 
         return workspace_vo
 
+    def increment_user_count(
+        self, workspace_id: str, domain_id: str, amount: int = 1
+    ) -> None:
+        # Workspaces without user_count are initialized by reconcile_user_counts.
+        self.workspace_model.objects(
+            workspace_id=workspace_id, domain_id=domain_id, user_count__ne=None
+        ).update_one(inc__user_count=amount)
+
+    def reconcile_user_counts(
+        self,
+        user_counts: Dict[Tuple[str, str], int],
+        domain_id: str = None,
+        workspace_ids: List[str] = None,
+    ) -> int:
+        conditions = {}
+
+        if domain_id:
+            conditions["domain_id"] = domain_id
+
+        if workspace_ids is not None:
+            conditions["workspace_id__in"] = workspace_ids
+
+        operations = []
+        workspace_vos = self.workspace_model.objects(**conditions).only(
+            "workspace_id", "domain_id", "user_count"
+        )
+        for workspace_vo in workspace_vos:
+            key = (workspace_vo.domain_id, workspace_vo.workspace_id)
+            user_count = user_counts.get(key, 0)
+            if workspace_vo.user_count != user_count:
+                # Skip the workspace if its count changed since it was read.
+                operations.append(
+                    UpdateOne(
+                        {
+                            "workspace_id": workspace_vo.workspace_id,
+                            "domain_id": workspace_vo.domain_id,
+                            "user_count": workspace_vo.user_count,
+                        },
+                        {"$set": {"user_count": user_count}},
+                    )
+                )
+
+        if operations:
+            self.workspace_model._get_collection().bulk_write(
+                operations, ordered=False
+            )
+
+        return len(operations)
+
     def get_workspace(self, workspace_id: str, domain_id: str) -> Workspace:
         return self.workspace_model.get(domain_id=domain_id, workspace_id=workspace_id)
 
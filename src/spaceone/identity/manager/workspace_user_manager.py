@@ -1,6 +1,7 @@
 import logging
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
+from mongoengine import QuerySet
 from spaceone.core.error import *
 from spaceone.core.manager import BaseManager
 
@@ -9,6 +10,7 @@ from spaceone.identity.error.error_workspace_user import (
 )
 from spaceone.identity.manager.role_binding_manager import RoleBindingManager
 from spaceone.identity.manager.user_manager import UserManager
+from spaceone.identity.model.role_binding.database import RoleBinding
 from spaceone.identity.model.user.database import User
 from spaceone.identity.service.role_binding_service import RoleBindingService
 from spaceone.identity.service.user_service import UserService
@@ -62,55 +64,249 @@ class WorkspaceUserManager(BaseManager):
     def get_workspace_user(
         self, user_id: str, workspace_id: str, domain_id: str
     ) -> dict:
-        user_ids, user_rb_map = self._get_role_binding_map_in_workspace(
-            workspace_id, domain_id
-        )
-        if user_id not in user_ids:
+        rb_vo = self._filter_workspace_role_bindings(
+            workspace_id, domain_id, user_id=user_id
+        ).first()
+
+        if rb_vo is None:
             raise ERROR_NOT_FOUND(key="user_id", value=user_id)
 
         user_vo = self.user_mgr.get_user(user_id, domain_id)
         user_info = user_vo.to_dict()
-        user_info["role_binding_info"] = user_rb_map[user_id]
+        user_info["role_binding_info"] = rb_vo.to_dict()
 
         return user_info
 
     def list_workspace_users(
         self, query: dict, domain_id: str, workspace_id: str, role_type: str = None
-    ) -> Tuple[list, int]:
-        user_ids, user_rb_map = self._get_role_binding_map_in_workspace(
-            workspace_id, domain_id, role_type
+    ) -> Tuple[Iterator[dict], int]:
+        pipeline = self._make_workspace_user_pipeline(
+            query, domain_id, workspace_id, role_type
         )
-        query["filter"] = query.get("filter", [])
-        query["filter"].append({"k": "user_id", "v": user_ids, "o": "in"})
 
-        user_vos, total_count = self.user_mgr.list_users(query)
+        sort = query.get("sort") or [{"key": key} for key in User._meta["ordering"]]
+        page_pipeline = [
+            {
+                "$sort": {
+                    **{
+                        option["key"]: -1 if option.get("desc", False) else 1
+                        for option in sort
+                    },
+                    "_id": 1,
+                }
+            }
+        ]
+
+        page = query.get("page") or {}
+        if page.get("limit", 0) > 0:
+            start = max(page.get("start", 1), 1)
+            page_pipeline.append({"$skip": start - 1})
+            page_pipeline.append({"$limit": page["limit"]})
+
+        if only := query.get("only"):
+            page_pipeline.append(
+                {"$project": {**{key: 1 for key in only}, "role_binding_info": 1}}
+            )
+
+        # Results are read from their own cursor, since a page without limit can
+        # exceed the document size limit of a $facet stage.
+        total_count = 0
+        for row in self._aggregate_workspace_users(
+            pipeline + [{"$count": "total_count"}]
+        ):
+            total_count = row["total_count"]
+
+        users_info = self._aggregate_workspace_users(pipeline + page_pipeline)
+
+        return (user_info for user_info in users_info), total_count
 
-        users_info = []
-        for user_vo in user_vos:
-            user_info = user_vo.to_dict()
+    def find_workspace_users(
+        self,
+        domain_id: str,
+        workspace_id: str,
+        keyword: str = None,
+        state: str = None,
+        page: dict = None,
+    ) -> Tuple[Iterator[dict], int]:
+        # Users are scanned in user_id order on COMPOUND_INDEX_FOR_FIND and members of
+        # the workspace are removed with an anti-join on role bindings, instead of a
+        # not_in filter over every member id.
+        user_filter = [{"k": "domain_id", "v": domain_id, "o": "eq"}]
+        user_filter_or = []
 
-            if user_rb_map:
-                user_info["role_binding_info"] = user_rb_map[user_vo.user_id]
+        if keyword:
+            user_filter_or = [
+                {"k": "user_id", "v": keyword, "o": "contain"},
+                {"k": "name", "v": keyword, "o": "contain"},
+            ]
 
-            users_info.append(user_info)
+        if state:
+            user_filter.append({"k": "state", "v": state, "o": "eq"})
 
-        return users_info, total_count
+        user_match = User.objects.filter(
+            User._make_filter(user_filter, user_filter_or, None)
+        )._query
+
+        page_pipeline = [{"$sort": {"user_id": 1}}]
+
+        page = page or {}
+        if page.get("limit", 0) > 0:
+            start = max(page.get("start", 1), 1)
+            page_pipeline.append({"$skip": start - 1})
+            page_pipeline.append({"$limit": page["limit"]})
+
+        pipeline = [
+            {"$match": user_match},
+            {"$project": {"_id": 0, "user_id": 1, "name": 1, "state": 1}},
+            {
+                "$lookup": {
+                    "from": RoleBinding._get_collection_name(),
+                    "let": {"user_id": "$user_id"},
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "domain_id": domain_id,
+                                "workspace_id": workspace_id,
+                            }
+                        },
+                        {"$match": {"$expr": {"$eq": ["$user_id", "$$user_id"]}}},
+                        {"$limit": 1},
+                        {"$project": {"_id": 1}},
+                    ],
+                    "as": "workspace_role_bindings",
+                }
+            },
+            {"$match": {"workspace_role_bindings": {"$size": 0}}},
+            {"$project": {"workspace_role_bindings": 0}},
+        ]
+
+        total_count = 0
+        for row in self._aggregate_users(pipeline + [{"$count": "total_count"}]):
+            total_count = row["total_count"]
+
+        users_info = self._aggregate_users(pipeline + page_pipeline)
+
+        return (user_info for user_info in users_info), total_count
 
     def stat_workspace_users(
         self, query: dict, domain_id: str, workspace_id: str
     ) -> dict:
-        user_ids, _ = self._get_role_binding_map_in_workspace(workspace_id, domain_id)
-        query["filter"] = query.get("filter", [])
-        query["filter"].append({"k": "user_id", "v": user_ids, "o": "in"})
+        pipeline = self._make_workspace_user_pipeline(query, domain_id, workspace_id)
+        page = query.get("page") or {}
+
+        if distinct := query.get("distinct"):
+            pipeline.append({"$group": {"_id": f"${distinct}"}})
+            values = [
+                row["_id"]
+                for row in self._aggregate_workspace_users(pipeline)
+                if row["_id"] is not None
+            ]
+
+            try:
+                values.sort()
+            except Exception as e:
+                _LOGGER.debug(f"[stat_workspace_users] Failed to sort values: {e}")
+
+            result = {}
+            if page.get("limit", 0) > 0:
+                start = max(page.get("start", 1), 1)
+                result["total_count"] = len(values)
+                values = values[start - 1 : start + page["limit"] - 1]
+
+            result["results"] = User._make_distinct_values(values)
+            return result
 
-        return self.user_mgr.stat_users(query)
+        elif aggregate := query.get("aggregate"):
+            pipeline.extend(User._make_aggregate_rules(aggregate))
 
-    def _get_role_binding_map_in_workspace(
-        self, workspace_id: str, domain_id: str, role_type: str = None
-    ) -> Tuple[list, dict]:
-        user_rb_map = {}
-        user_ids = []
+            result = {}
+            if page.get("limit", 0) > 0:
+                start = max(page.get("start", 1), 1)
+                result["total_count"] = 0
+                for row in self._aggregate_workspace_users(
+                    pipeline + [{"$count": "total_count"}]
+                ):
+                    result["total_count"] = row["total_count"]
 
+                if start > 1:
+                    pipeline.append({"$skip": start - 1})
+
+                pipeline.append({"$limit": page["limit"]})
+
+            result["results"] = User._make_aggregate_values(
+                self._aggregate_workspace_users(pipeline)
+            )
+            return result
+
+        else:
+            raise ERROR_REQUIRED_PARAMETER(key="aggregate")
+
+    def _make_workspace_user_pipeline(
+        self, query: dict, domain_id: str, workspace_id: str, role_type: str = None
+    ) -> List[dict]:
+        # Role bindings in the workspace are joined to users, so filters, sort and page
+        # on user fields are applied by the database instead of an $in over all members.
+        rb_query = self._filter_workspace_role_bindings(
+            workspace_id, domain_id, role_type
+        )._query
+
+        user_match = {"domain_id": domain_id}
+        user_filter = User._make_filter(
+            query.get("filter", []), query.get("filter_or", []), None
+        )
+        if user_filter:
+            user_match.update(User.objects.filter(user_filter)._query)
+
+        return [
+            {"$match": rb_query},
+            {"$group": {"_id": "$user_id", "role_binding_info": {"$last": "$$ROOT"}}},
+            {
+                "$lookup": {
+                    "from": User._get_collection_name(),
+                    "let": {"user_id": "$_id"},
+                    "pipeline": [
+                        {"$match": user_match},
+                        {"$match": {"$expr": {"$eq": ["$user_id", "$$user_id"]}}},
+                    ],
+                    "as": "user",
+                }
+            },
+            {"$unwind": "$user"},
+            {
+                "$replaceRoot": {
+                    "newRoot": {
+                        "$mergeObjects": [
+                            "$user",
+                            {"role_binding_info": "$role_binding_info"},
+                        ]
+                    }
+                }
+            },
+        ]
+
+    def _aggregate_users(self, pipeline: List[dict]):
+        try:
+            return self.user_mgr.user_model.objects.aggregate(
+                pipeline, allowDiskUse=True, hint="COMPOUND_INDEX_FOR_FIND"
+            )
+        except Exception as e:
+            raise ERROR_DB_QUERY(reason=e)
+
+    def _aggregate_workspace_users(self, pipeline: List[dict]):
+        try:
+            return self.rb_mgr.role_binding_model.objects.aggregate(
+                pipeline, allowDiskUse=True
+            )
+        except Exception as e:
+            raise ERROR_DB_QUERY(reason=e)
+
+    def _filter_workspace_role_bindings(
+        self,
+        workspace_id: str,
+        domain_id: str,
+        role_type: str = None,
+        user_id: str = None,
+    ) -> QuerySet:
         if role_type and role_type not in ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]:
             raise ERROR_INVALID_PARAMETER(
                 message="role_type must be one of [WORKSPACE_OWNER, WORKSPACE_MEMBER]"
@@ -119,14 +315,13 @@ class WorkspaceUserManager(BaseManager):
         if role_type is None:
             role_type = ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]
 
-        rb_vos = self.rb_mgr.filter_role_bindings(
-            domain_id=domain_id,
-            workspace_id=[workspace_id, "*"],
-            role_type=role_type,
-        )
+        conditions = {
+            "domain_id": domain_id,
+            "workspace_id": [workspace_id, "*"],
+            "role_type": role_type,
+        }
 
-        for rb_vo in rb_vos:
-            user_ids.append(rb_vo.user_id)
-            user_rb_map[rb_vo.user_id] = rb_vo.to_dict()
+        if user_id:
+            conditions["user_id"] = user_id
 
-        return user_ids, user_rb_map
+        return self.rb_mgr.filter_role_bindings(**conditions)
@@ -59,15 +59,32 @@ class Domain(MongoModel):
 
 class DomainSecret(MongoModel):
     domain_key = StringField()
+    algorithm = StringField(max_length=20, default="RS256")
     pub_jwk = DictField(required=True)
     prv_jwk = DictField(required=True)
     refresh_pub_jwk = DictField(required=True)
     refresh_prv_jwk = DictField(required=True)
+    previous_pub_jwk = DictField(default=None, null=True)
+    previous_refresh_pub_jwk = DictField(default=None, null=True)
+    previous_keys_expired_at = DateTimeField(default=None, null=True)
     domain_id = StringField(max_length=40, unique=True)
     domain = ReferenceField("Domain", reverse_delete_rule=CASCADE)
     created_at = DateTimeField(auto_now_add=True)
+    rotated_at = DateTimeField(default=None, null=True)
 
     meta = {
         "ordering": ["domain_id"],
         "indexes": ["domain"],
     }
+
+
+class DomainKey(MongoModel):
+    algorithm = StringField(max_length=20, default="RS256")
+    pub_jwk = DictField(required=True)
+    prv_jwk = DictField(required=True)
+    created_at = DateTimeField(auto_now_add=True)
+
+    meta = {
+        "ordering": ["created_at"],
+        "indexes": ["algorithm", "created_at"],
+    }
@@ -10,6 +10,7 @@ class Job(MongoModel):
     )
     options = DictField(default=None, null=True)
     error_message = StringField(default=None, null=True)
+    metrics = DictField(default=None, null=True)
     resource_group = StringField(max_length=40, choices=("DOMAIN", "WORKSPACE"))
     trusted_account_id = StringField(max_length=40)
     plugin_id = StringField(max_length=40, default=None, null=True)
@@ -24,6 +25,7 @@ class Job(MongoModel):
             "status",
             "options",
             "error_message",
+            "metrics",
             "updated_at",
             "finished_at",
         ],
@@ -19,6 +19,7 @@ class Project(MongoModel):
     domain_id = StringField(max_length=40)
     created_at = DateTimeField(auto_now_add=True)
     last_synced_at = DateTimeField(default=None, null=True)
+    sync_fingerprint = StringField(max_length=64, default=None, null=True)
 
     meta = {
         "updatable_fields": [
@@ -30,6 +31,7 @@ class Project(MongoModel):
             "trusted_account_id",
             "project_group_id",
             "last_synced_at",
+            "sync_fingerprint",
         ],
         "minimal_fields": [
             "project_id",
@@ -48,6 +50,14 @@ class Project(MongoModel):
             "users",
             "project_group_id",
             "workspace_id",
-            "domain_id",
+            {
+                "fields": ["domain_id", "workspace_id", "project_type"],
+                "name": "COMPOUND_INDEX_FOR_PROJECT_TYPE",
+            },
+            {
+                "fields": ["domain_id", "workspace_id", "reference_id", "is_managed"],
+                "name": "COMPOUND_INDEX_FOR_REFERENCE",
+            },
         ],
+        "superseded_indexes": ["domain_id_1"],
     }
@@ -11,10 +11,12 @@ class ProjectGroup(MongoModel):
     is_managed = BooleanField(default=False)
     trusted_account_id = StringField(max_length=40, default=None, null=True)
     parent_group_id = StringField(max_length=40, null=True, default=None)
+    ancestors = ListField(StringField(max_length=40), default=None)
     workspace_id = StringField(max_length=40)
     domain_id = StringField(max_length=40)
     created_at = DateTimeField(auto_now_add=True)
     last_synced_at = DateTimeField(default=None, null=True)
+    sync_fingerprint = StringField(max_length=64, default=None, null=True)
 
     meta = {
         "updatable_fields": [
@@ -24,7 +26,9 @@ class ProjectGroup(MongoModel):
             "is_managed",
             "trusted_account_id",
             "parent_group_id",
+            "ancestors",
             "last_synced_at",
+            "sync_fingerprint",
         ],
         "minimal_fields": [
             "project_group_id",
@@ -37,8 +41,19 @@ class ProjectGroup(MongoModel):
         },
         "ordering": ["name"],
         "indexes": [
-            "parent_group_id",
             "workspace_id",
-            "domain_id",
+            {
+                "fields": ["domain_id", "ancestors"],
+                "name": "COMPOUND_INDEX_FOR_DESCENDANTS",
+            },
+            {
+                "fields": ["domain_id", "parent_group_id"],
+                "name": "COMPOUND_INDEX_FOR_PARENT",
+            },
+            {
+                "fields": ["domain_id", "workspace_id", "reference_id", "is_managed"],
+                "name": "COMPOUND_INDEX_FOR_REFERENCE",
+            },
         ],
+        "superseded_indexes": ["parent_group_id_1", "domain_id_1"],
     }
@@ -42,10 +42,29 @@ class RoleBinding(MongoModel):
             },
             {
                 "fields": [
+                    "domain_id",
+                    "user_id",
+                    "role_type",
                     "workspace_id",
+                ],
+                "name": "COMPOUND_INDEX_FOR_USER_ROLE",
+            },
+            {
+                "fields": [
                     "domain_id",
+                    "workspace_id",
+                    "user_id",
+                ],
+                "name": "COMPOUND_INDEX_FOR_WORKSPACE_USER_COUNT",
+            },
+            {
+                "fields": [
+                    "domain_id",
+                    "workspace_group_id",
+                    "user_id",
                 ],
-                "name": "COMPOUND_INDEX_FOR_ROLE_BINDING_UPDATE",
+                "name": "COMPOUND_INDEX_FOR_WORKSPACE_GROUP_USER",
             },
         ],
+        "superseded_indexes": ["COMPOUND_INDEX_FOR_ROLE_BINDING_UPDATE"],
     }
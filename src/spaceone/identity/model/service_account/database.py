@@ -27,6 +27,9 @@ class ServiceAccount(MongoModel):
     domain_id = StringField(max_length=40)
     created_at = DateTimeField(auto_now_add=True)
     last_synced_at = DateTimeField(default=None, null=True)
+    sync_fingerprint = StringField(max_length=64, default=None, null=True)
+    secret_data_hash = StringField(max_length=64, default=None, null=True)
+    secret_data_hashed_at = DateTimeField(default=None, null=True)
     deleted_at = DateTimeField(default=None, null=True)
     inactivated_at = DateTimeField(default=None, null=True)
 
@@ -44,6 +47,9 @@ class ServiceAccount(MongoModel):
             "trusted_account_id",
             "project_id",
             "last_synced_at",
+            "sync_fingerprint",
+            "secret_data_hash",
+            "secret_data_hashed_at",
             "inactivated_at",
         ],
         "minimal_fields": [
@@ -68,6 +74,16 @@ class ServiceAccount(MongoModel):
             "trusted_account_id",
             "project_id",
             "workspace_id",
-            "domain_id",
+            {
+                "fields": [
+                    "domain_id",
+                    "workspace_id",
+                    "project_id",
+                    "provider",
+                    "reference_id",
+                ],
+                "name": "COMPOUND_INDEX_FOR_REFERENCE",
+            },
         ],
+        "superseded_indexes": ["domain_id_1"],
     }
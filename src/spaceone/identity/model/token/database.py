@@ -0,0 +1,56 @@
+from mongoengine import *
+from spaceone.core.model.mongo_model import MongoModel
+
+
+class AccessSnapshot(MongoModel):
+    user_id = StringField(max_length=255)
+    user_role_type = StringField(max_length=20)
+    role_type = StringField(max_length=20)
+    role_id = StringField(max_length=40, default=None, null=True)
+    permissions = ListField(StringField(), default=None, null=True)
+    projects = ListField(StringField(max_length=40), default=None, null=True)
+    public_projects = BooleanField(default=False)
+    user_groups = ListField(StringField(max_length=40), default=None, null=True)
+    workspace_id = StringField(max_length=40, default=None, null=True)
+    domain_id = StringField(max_length=40)
+    created_at = DateTimeField(auto_now_add=True)
+    expired_at = DateTimeField()
+
+    meta = {
+        "indexes": [
+            {
+                "fields": ["domain_id", "user_id", "workspace_id"],
+                "name": "COMPOUND_INDEX_FOR_GRANT",
+                "unique": True,
+            },
+            {
+                "fields": ["domain_id", "workspace_id"],
+                "name": "COMPOUND_INDEX_FOR_WORKSPACE_INVALIDATION",
+            },
+            {
+                "fields": ["domain_id", "role_id"],
+                "name": "COMPOUND_INDEX_FOR_ROLE_INVALIDATION",
+            },
+            {
+                "fields": ["expired_at"],
+                "expireAfterSeconds": 0,
+            },
+        ],
+    }
+
+
+class AccessSnapshotGeneration(MongoModel):
+    workspace_id = StringField(max_length=40)
+    domain_id = StringField(max_length=40)
+    generation = IntField(default=0)
+    updated_at = DateTimeField(auto_now=True)
+
+    meta = {
+        "indexes": [
+            {
+                "fields": ["domain_id", "workspace_id"],
+                "name": "COMPOUND_INDEX_FOR_GENERATION",
+                "unique": True,
+            },
+        ],
+    }
@@ -61,5 +61,15 @@ class User(MongoModel):
         ],
         "minimal_fields": ["user_id", "name", "state", "auth_type", "role_type"],
         "ordering": ["name", "user_id"],
-        "indexes": ["user_id", "state", "auth_type", "role_type", "domain_id"],
+        "indexes": [
+            "user_id",
+            "state",
+            "auth_type",
+            "role_type",
+            "domain_id",
+            {
+                "fields": ["domain_id", "user_id", "name", "state"],
+                "name": "COMPOUND_INDEX_FOR_FIND",
+            },
+        ],
     }
@@ -1,8 +1,12 @@
+# Accounts per response when sync_stream falls back to the sync method
+SYNC_STREAM_CHUNK_SIZE = 500
+
 LOG = {
     "filters": {
         "masking": {
             "rules": {
                 "AccountCollector.sync": ["secret_data"],
+                "AccountCollector.sync_stream": ["secret_data"],
             }
         }
     }
@@ -16,6 +16,6 @@ class AccountCollectorPluginServer(PluginServer):
     _plugin_methods = {
         "AccountCollector": {
             "service": AccountCollectorService,
-            "methods": ["init", "sync"],
+            "methods": ["init", "sync", "sync_stream"],
         }
     }
@@ -1,5 +1,6 @@
 import logging
-from typing import Union
+from typing import Generator, Union
+from spaceone.core import config
 from spaceone.core.service import BaseService, transaction
 from spaceone.core.service.utils import convert_model
 from spaceone.identity.plugin.account_collector.model.account_collect_request import *
@@ -58,3 +59,46 @@ class AccountCollectorService(BaseService):
         func = self.get_plugin_method("sync")
         response = func(params.dict())
         return AccountsResponse(**response)
+
+    @transaction
+    @convert_model
+    def sync_stream(
+        self, params: AccountCollectorSyncRequest
+    ) -> Generator[Union[AccountsResponse, dict], None, None]:
+        """Get external accounts in chunks
+
+        Args:
+            params (AccountCollectorSyncRequest): {
+                'options': 'dict',          # Required
+                'schema_id': 'str',
+                'secret_data': 'dict',       # Required
+                'domain_id': 'str'          # Required
+            }
+
+        Returns:
+            Generator[AccountsResponse, None, None]
+            {
+                'results': 'list[AccountResponse]'
+            }
+        """
+
+        response_iterator = None
+        if func := self.get_plugin_method("sync_stream"):
+            response_iterator = func(params.dict())
+
+        # Plugins that do not stream are served by splitting the sync result
+        if response_iterator is None:
+            response_iterator = self._split_sync_response(params)
+
+        for response in response_iterator:
+            yield AccountsResponse(**response)
+
+    def _split_sync_response(
+        self, params: AccountCollectorSyncRequest
+    ) -> Generator[dict, None, None]:
+        func = self.get_plugin_method("sync")
+        results = func(params.dict()).get("results") or []
+        chunk_size = config.get_global("SYNC_STREAM_CHUNK_SIZE", 500)
+
+        for i in range(0, len(results), chunk_size):
+            yield {"results": results[i : i + chunk_size]}
@@ -56,3 +56,41 @@ def account_collector_sync(params: dict) -> dict:
         }
     """
     pass
+
+
+# Optional: stream accounts in chunks. Without this route, AccountCollector.sync_stream
+# splits the result of AccountCollector.sync into SYNC_STREAM_CHUNK_SIZE chunks.
+#
+# @app.route("AccountCollector.sync_stream")
+# def account_collector_sync_stream(params: dict) -> Generator[dict, None, None]:
+#     """AccountCollector sync in chunks (optional)
+#
+#     Args:
+#         params (AccountCollectorInit): {
+#             'options': 'dict',          # Required
+#             'schema_id': 'str',
+#             'secret_data': 'dict',      # Required
+#             'domain_id': 'str'          # Required
+#         }
+#
+#     Returns:
+#         Generator[AccountsResponse, None, None]:
+#         {
+#             'results': [
+#                 {
+#                     name: 'str',
+#                     data: 'dict',
+#                     secret_schema_id: 'str',
+#                     secret_data: 'dict',
+#                     tags: 'dict',
+#                     location: [
+#                         {
+#                             'name': 'str',
+#                             'resource_id': 'str'
+#                         }
+#                     ]
+#                 }
+#             ]
+#         }
+#     """
+#     yield {"results": []}
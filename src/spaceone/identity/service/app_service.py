@@ -8,6 +8,8 @@ from spaceone.core.service import *
 from spaceone.core.service.utils import *
 
 from spaceone.identity.error.error_app import *
+from spaceone.identity.lib.access_time_buffer import AccessTimeBuffer
+from spaceone.identity.lib import single_flight
 from spaceone.identity.manager.app_manager import AppManager
 from spaceone.identity.manager.project_group_manager import ProjectGroupManager
 from spaceone.identity.manager.project_manager import ProjectManager
@@ -18,6 +20,7 @@ from spaceone.identity.manager.client_secret_manager import ClientSecretManager
 from spaceone.identity.manager.domain_manager import DomainManager
 from spaceone.identity.manager.user_manager import UserManager
 from spaceone.identity.manager.email_manager import EmailManager
+from spaceone.identity.model.app.database import App
 from spaceone.identity.model.app.request import *
 from spaceone.identity.model.app.response import *
 from spaceone.identity.error.error_role import ERROR_NOT_ALLOWED_ROLE_TYPE
@@ -319,9 +322,24 @@ class AppService(BaseService):
             None:
         """
 
+        app_check_info = self._get_app_check_info(params.client_id, params.domain_id)
+
+        AccessTimeBuffer.record(
+            App, app_id=app_check_info["app_id"], domain_id=params.domain_id
+        )
+
+        return CheckAppResponse(
+            permissions=app_check_info["permissions"],
+            projects=app_check_info["projects"],
+        )
+
+    @single_flight.cacheable(
+        key="identity:app-check:{domain_id}:{client_id}", expire=600, early_refresh=60
+    )
+    def _get_app_check_info(self, client_id: str, domain_id: str) -> dict:
         app_vos = self.app_mgr.filter_apps(
-            client_id=params.client_id,
-            domain_id=params.domain_id,
+            client_id=client_id,
+            domain_id=domain_id,
         )
         projects = []
 
@@ -364,9 +382,11 @@ class AppService(BaseService):
         role_mgr = RoleManager()
         role_vo = role_mgr.get_role(app_vo.role_id, app_vo.domain_id)
 
-        self.app_mgr.update_app_by_vo({"last_accessed_at": datetime.utcnow()}, app_vo)
-
-        return CheckAppResponse(permissions=role_vo.permissions, projects=projects)
+        return {
+            "app_id": app_vo.app_id,
+            "permissions": role_vo.permissions,
+            "projects": projects,
+        }
 
     @transaction(
         permission="identity:App.read",
@@ -2,7 +2,6 @@ import logging
 from typing import Union
 
 from spaceone.core import utils
-from spaceone.core.auth.jwt import JWTAuthenticator
 from spaceone.core.service import *
 from spaceone.core.service.utils import *
 from spaceone.identity.error.error_domain import *
@@ -229,17 +228,27 @@ class DomainService(BaseService):
             if token is None:
                 raise ERROR_UNKNOWN(message="Empty Token provided.")
             root_domain_id = SystemManager.get_root_domain_id()
-            root_pub_jwk = self.domain_secret_mgr.get_domain_public_key(root_domain_id)
-            JWTAuthenticator(root_pub_jwk).validate(token)
+            self.domain_secret_mgr.verify_token(token, root_domain_id)
         except Exception:
             raise ERROR_UNKNOWN(message="Invalid System Token")
 
         # Get Public Key from Domain
-        pub_jwk = self.domain_secret_mgr.get_domain_public_key(params.domain_id)
+        pub_jwk = self.domain_secret_mgr.get_domain_public_key_set(params.domain_id)
         return DomainSecretResponse(
             public_key=utils.dump_json(pub_jwk), domain_id=params.domain_id
         )
 
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def fill_domain_key_pool(self, params: dict) -> None:
+        """Fill the domain key pool for every configured signing algorithm
+        Args:
+            params (dict): {}
+        Returns:
+            None:
+        """
+
+        self.domain_secret_mgr.fill_domain_key_pool()
+
     @transaction(permission="identity:Domain.read", role_types=["SYSTEM_ADMIN"])
     @append_query_filter(["domain_id", "name", "state"])
     @append_keyword_filter(["domain_id", "name"])
@@ -281,32 +290,3 @@ class DomainService(BaseService):
 
         query = params.query or {}
         return self.domain_mgr.stat_domains(query)
-
-    def _get_workspace_user_count(self, workspace_id: str, domain_id: str) -> int:
-        user_rb_ids = self.rb_mgr.stat_role_bindings(
-            query={
-                "distinct": "user_id",
-                "filter": [
-                    {"k": "workspace_id", "v": workspace_id, "o": "eq"},
-                    {"k": "domain_id", "v": domain_id, "o": "eq"},
-                ],
-            }
-        ).get("results", [])
-        return len(user_rb_ids)
-
-    def _update_workspace_user_count(self, workspace_id: str, domain_id: str) -> None:
-        if not workspace_id and not domain_id:
-            return
-
-        if workspace_id == "*":
-            return
-
-        workspace_vo = self.workspace_mgr.get_workspace(workspace_id, domain_id)
-
-        if workspace_vo and workspace_vo.workspace_id != "*":
-            user_rb_total_count = self._get_workspace_user_count(
-                workspace_id, domain_id
-            )
-            self.workspace_mgr.update_workspace_by_vo(
-                {"user_count": user_rb_total_count}, workspace_vo
-            )
@@ -1,14 +1,19 @@
 import logging
-import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Union, List, Optional
+from typing import Union, List, Optional, Tuple
 
 from dateutil.relativedelta import relativedelta
 from spaceone.core.service import *
 from spaceone.core.service.utils import *
 from spaceone.core import config
+from spaceone.core.transaction import (
+    Transaction,
+    create_transaction,
+    delete_transaction,
+)
 
-from spaceone.identity.conf.global_conf import WORKSPACE_COLORS_NAME
 from spaceone.identity.error.error_job import *
 from spaceone.identity.manager.account_collector_plugin_manager import (
     AccountCollectorPluginManager,
@@ -17,16 +22,18 @@ from spaceone.identity.manager.job_manager import JobManager
 from spaceone.identity.manager.project_manager import ProjectManager
 from spaceone.identity.manager.project_group_manager import ProjectGroupManager
 from spaceone.identity.manager.provider_manager import ProviderManager
+from spaceone.identity.manager.role_binding_manager import RoleBindingManager
 from spaceone.identity.manager.schema_manager import SchemaManager
 from spaceone.identity.manager.service_account_manager import ServiceAccountManager
+from spaceone.identity.manager.service_account_sync_manager import (
+    ServiceAccountSyncManager,
+)
 from spaceone.identity.manager.secret_manager import SecretManager
 from spaceone.identity.manager.trusted_account_manager import TrustedAccountManager
 from spaceone.identity.manager.workspace_manager import WorkspaceManager
 from spaceone.identity.manager.domain_manager import DomainManager
 from spaceone.identity.manager.config_manager import ConfigManager
 from spaceone.identity.manager.cost_analysis_manager import CostAnalysisManager
-from spaceone.identity.model.project.database import Project
-from spaceone.identity.model.project_group.database import ProjectGroup
 from spaceone.identity.model.provider.database import Provider
 from spaceone.identity.model.service_account.database import ServiceAccount
 from spaceone.identity.model.trusted_account.database import TrustedAccount
@@ -286,6 +293,23 @@ class JobService(BaseService):
             update_params["dormant_updated_at"] = datetime.utcnow()
             self.workspace_mgr.update_workspace_by_vo(update_params, workspace_vo)
 
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def reconcile_workspace_user_count(self, params: dict) -> None:
+        """Recompute user_count of all workspaces from role bindings
+        Args:
+            params (dict): {}
+        Returns:
+            None:
+        """
+
+        rb_mgr = RoleBindingManager()
+        user_counts = rb_mgr.count_users_by_workspace()
+        updated_count = self.workspace_mgr.reconcile_user_counts(user_counts)
+
+        _LOGGER.debug(
+            f"[reconcile_workspace_user_count] fixed workspaces: {updated_count}"
+        )
+
     @staticmethod
     def _is_dormancy_updated(workspace_vo: Workspace) -> bool:
         if not workspace_vo.dormant_updated_at:
@@ -429,63 +453,28 @@ class JobService(BaseService):
 
                 is_canceled = False
 
-                response = self.account_collector_plugin_mgr.sync(
-                    endpoint, options, secret_data, domain_id, schema_id
-                )
-
-                for result in response.get("results", []):
-                    location: List[dict] = self._get_location(
-                        result, trusted_account_vo.resource_group, sync_options
-                    )
+                sync_mgr = ServiceAccountSyncManager()
+                secret_stats = {"pushed": 0, "skipped": 0, "failed": 0}
 
-                    if trusted_account_vo.resource_group == "DOMAIN":
-                        if sync_options.get("single_workspace_id"):
-                            workspace_vo = self.workspace_mgr.get_workspace(
-                                sync_options.get("single_workspace_id"), domain_id
-                            )
-                        elif location:
-                            location_info = location.pop(0)
-                            workspace_vo = self._create_workspace(
-                                domain_id, trusted_account_id, location_info
-                            )
-                        else:
-                            _LOGGER.debug(
-                                f"[sync_service_accounts] location is empty => SKIP"
-                            )
-                            continue
-
-                        sync_workspace_id = workspace_vo.workspace_id
-
-                    else:
-                        sync_workspace_id = workspace_id
-
-                    parent_group_id = None
-                    for location_info in location:
-                        project_group_vo = self._create_project_group(
-                            domain_id,
-                            sync_workspace_id,
-                            trusted_account_id,
-                            location_info,
-                            parent_group_id,
-                        )
-                        parent_group_id = project_group_vo.project_group_id
-
-                    project_vo = self._create_project(
-                        result,
-                        domain_id,
-                        sync_workspace_id,
-                        trusted_account_id,
-                        project_group_id=parent_group_id,
-                        sync_options=sync_options,
-                    )
-                    self._create_service_account(
-                        result,
-                        project_vo,
-                        trusted_account_id,
-                        trusted_secret_id,
+                # Accounts are reconciled chunk by chunk as the plugin streams them
+                for response in self.account_collector_plugin_mgr.sync_stream(
+                    endpoint, options, secret_data, domain_id, schema_id
+                ):
+                    synced_accounts = sync_mgr.sync_results(
+                        response.get("results", []),
+                        trusted_account_vo,
                         provider,
                         sync_options,
                     )
+                    chunk_secret_stats = self._sync_secret_data(
+                        synced_accounts, trusted_secret_id, domain_id
+                    )
+                    for key, value in chunk_secret_stats.items():
+                        secret_stats[key] += value
+
+                    self.job_mgr.update_metrics(
+                        job_vo, {**sync_mgr.get_metrics(), "secret": secret_stats}
+                    )
 
                 if self._is_job_failed(job_id, domain_id, job_vo.workspace_id):
                     self.job_mgr.change_canceled_status(job_vo)
@@ -663,309 +652,181 @@ class JobService(BaseService):
         elif job_vo.status == "FAILURE":
             self.job_mgr.update_job_by_vo({"finished_at": datetime.utcnow()}, job_vo)
 
-    def _create_workspace(
-        self, domain_id: str, trusted_account_id: str, location_info: dict
-    ) -> Workspace:
-        name = location_info.get("name")
-        reference_id = location_info.get("resource_id")
-
-        workspace_vos = self.workspace_mgr.filter_workspaces(
-            domain_id=domain_id, name=name
-        )
-
-        _LOGGER.debug(
-            f"[_create_workspace] 'name': '{name}', 'domain_id': '{domain_id}', count: {len(workspace_vos)}"
-        )
-
-        params = {"trusted_account_id": trusted_account_id, "is_managed": True}
-        if workspace_vos:
-            workspace_vo = workspace_vos[0]
-
-            if not workspace_vo.references:
-                params["references"] = [reference_id]
-            elif reference_id not in workspace_vo.references:
-                params["references"] = workspace_vo.references + [reference_id]
-
-            params["last_synced_at"] = datetime.utcnow()
-            _LOGGER.debug(f"[_create_workspace] update workspace: {params}")
-
-            workspace_vo = self.workspace_mgr.update_workspace_by_vo(
-                params, workspace_vo
-            )
+    def _sync_secret_data(
+        self,
+        synced_accounts: List[Tuple[dict, str]],
+        trusted_secret_id: str,
+        domain_id: str,
+    ) -> dict:
+        stats = {"pushed": 0, "skipped": 0, "failed": 0}
+        synced_accounts = [
+            (result, service_account_id)
+            for result, service_account_id in synced_accounts
+            if result.get("secret_data")
+        ]
 
-            self._remove_old_reference_id_from_workspace(
-                domain_id, workspace_vo.workspace_id, reference_id
+        if not synced_accounts:
+            return stats
+
+        # Secrets are pushed only if they differ from the last pushed secret_data.
+        # The hash is trusted for secret_data_hash_max_age seconds, after which the
+        # secret is pushed again to repair changes made in the secret service.
+        identity_conf = config.get_global("IDENTITY") or {}
+        account_sync_conf = identity_conf.get("account_sync", {})
+        hash_max_age = account_sync_conf.get("secret_data_hash_max_age", 86400)
+        min_hashed_at = datetime.utcnow() - timedelta(seconds=hash_max_age)
+
+        secret_data_info = {
+            service_account_vo.service_account_id: (
+                service_account_vo.secret_id,
+                service_account_vo.secret_data_hash
+                if service_account_vo.secret_data_hashed_at
+                and service_account_vo.secret_data_hashed_at > min_hashed_at
+                else None,
             )
-        else:
-            params.update(
-                {
-                    "name": name,
-                    "tags": self._set_workspace_theme(),
-                    "domain_id": domain_id,
-                    "last_synced_at": datetime.utcnow(),
-                    "references": [reference_id],
-                }
+            for service_account_vo in self.service_account_mgr.filter_service_accounts(
+                service_account_id=[
+                    service_account_id for _, service_account_id in synced_accounts
+                ],
+                domain_id=domain_id,
+            ).only(
+                "service_account_id",
+                "secret_id",
+                "secret_data_hash",
+                "secret_data_hashed_at",
             )
-            workspace_vo = self.workspace_mgr.create_workspace(params)
-        return workspace_vo
-
-    def _create_project_group(
-        self,
-        domain_id: str,
-        workspace_id: str,
-        trusted_account_id: str,
-        location_info: dict,
-        parent_group_id: str = None,
-    ) -> ProjectGroup:
-        name = location_info["name"]
-        reference_id = location_info["resource_id"]
-
-        filter_params = {
-            "is_managed": True,
-            "reference_id": reference_id,
-            "domain_id": domain_id,
-            "workspace_id": workspace_id,
         }
 
-        project_group_vos = self.project_group_mgr.filter_project_groups(
-            **filter_params
-        )
+        changed_accounts = {}
+        for result, service_account_id in synced_accounts:
+            secret_data_info_item = secret_data_info.get(service_account_id)
+            if secret_data_info_item is None:
+                # Deleted after it was synced
+                stats["failed"] += 1
+                continue
 
-        params = {
-            "trusted_account_id": trusted_account_id,
-        }
-        if parent_group_id:
-            params.update({"parent_group_id": parent_group_id})
+            secret_data_hash = ServiceAccountSyncManager.make_secret_data_hash(result)
+            secret_id, old_secret_data_hash = secret_data_info_item
+            if secret_id and old_secret_data_hash == secret_data_hash:
+                stats["skipped"] += 1
+            else:
+                changed_accounts[service_account_id] = (result, secret_data_hash)
 
-        if project_group_vos:
-            project_group_vo = project_group_vos[0]
-            if project_group_vo.name != name:
-                params.update({"name": name})
+        if not changed_accounts:
+            return stats
 
-            params.update({"last_synced_at": datetime.utcnow()})
-            project_group_vo = self.project_group_mgr.update_project_group_by_vo(
-                params, project_group_vo
-            )
+        service_account_vos = self.service_account_mgr.filter_service_accounts(
+            service_account_id=list(changed_accounts.keys()), domain_id=domain_id
+        )
 
-        else:
-            params.update(
-                {
-                    "name": name,
-                    "reference_id": reference_id,
-                    "is_managed": True,
-                    "domain_id": domain_id,
-                    "workspace_id": workspace_id,
-                    "last_synced_at": datetime.utcnow(),
-                }
-            )
-            if parent_group_id:
-                params["parent_group_id"] = parent_group_id
-            project_group_vo = self.project_group_mgr.create_project_group(params)
+        max_workers = account_sync_conf.get("secret_push_workers", 4)
+
+        secret_data_hashes = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="SecretPush"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._push_secret_data_in_transaction,
+                    self.transaction,
+                    changed_accounts[service_account_vo.service_account_id][0],
+                    service_account_vo,
+                    trusted_secret_id,
+                ): service_account_vo.service_account_id
+                for service_account_vo in service_account_vos
+            }
+            stats["failed"] += len(changed_accounts) - len(futures)
+
+            for future in as_completed(futures):
+                service_account_id = futures[future]
+                try:
+                    future.result()
+                    secret_data_hashes[service_account_id] = changed_accounts[
+                        service_account_id
+                    ][1]
+                    stats["pushed"] += 1
+                except Exception as e:
+                    stats["failed"] += 1
+                    _LOGGER.error(
+                        f"[_sync_secret_data] failed to push secret data "
+                        f"({service_account_id}): {e}",
+                        exc_info=True,
+                    )
+
+        self.service_account_mgr.update_secret_data_hashes(secret_data_hashes)
 
-        return project_group_vo
+        _LOGGER.debug(f"[_sync_secret_data] secret data sync: {stats}")
+        return stats
 
-    def _create_project(
+    def _push_secret_data_in_transaction(
         self,
+        parent_transaction: Transaction,
         result: dict,
-        domain_id: str,
-        workspace_id: str,
-        trusted_account_id: str,
-        project_group_id: str = None,
-        sync_options: dict = None,
-        project_type: str = "PRIVATE",
-    ) -> Project:
-        name = result["name"]
-        reference_id = result["resource_id"]
-
-        params = {
-            "domain_id": domain_id,
-            "workspace_id": workspace_id,
-            "project_type": project_type,
-            "reference_id": reference_id,
-            "is_managed": True,
-        }
-
-        project_vos = self.project_mgr.filter_projects(**params)
-        _LOGGER.debug(
-            f"[_create_service_account] project_vos: 'name': '{name}', 'params': '{params}' count: {len(project_vos)}"
+        service_account_vo: ServiceAccount,
+        trusted_secret_id: str,
+    ) -> ServiceAccount:
+        # Worker threads need their own transaction with the caller's token
+        create_transaction(
+            parent_transaction.service,
+            parent_transaction.resource,
+            parent_transaction.verb,
+            parent_transaction.id,
+            parent_transaction.meta,
+            thread_id=str(threading.current_thread().ident),
         )
 
-        if project_group_id:
-            params["project_group_id"] = project_group_id
-
-        if project_vos:
-            project_vo = project_vos[0]
-            if project_vo.name != name:
-                params.update({"name": name})
-
-            params.update(
-                {
-                    "trusted_account_id": trusted_account_id,
-                    "last_synced_at": datetime.utcnow(),
-                }
-            )
-            project_vo = self.project_mgr.update_project_by_vo(params, project_vo)
-        else:
-            params.update({"name": name, "last_synced_at": datetime.utcnow()})
-            project_vo = self.project_mgr.create_project(params)
-        return project_vo
+        try:
+            return self._push_secret_data(result, service_account_vo, trusted_secret_id)
+        finally:
+            delete_transaction()
 
-    def _create_service_account(
+    def _push_secret_data(
         self,
         result: dict,
-        project_vo: Project,
-        trusted_account_id: str,
+        service_account_vo: ServiceAccount,
         trusted_secret_id: str,
-        provider: str,
-        sync_options: dict = None,
-    ) -> Union[ServiceAccount, None]:
-        domain_id = project_vo.domain_id
-        workspace_id = project_vo.workspace_id
-        project_id = project_vo.project_id
-        name = result["name"]
-        reference_id = result["resource_id"]
+    ) -> ServiceAccount:
+        domain_id = service_account_vo.domain_id
+        workspace_id = service_account_vo.workspace_id
+        project_id = service_account_vo.project_id
         secret_data = result.get("secret_data", {})
-        data = result.get("data", {})
         secret_schema_id = result.get("secret_schema_id")
-        tags = result.get("tags", {})
 
-        params = {
-            "provider": provider,
-            "reference_id": reference_id,
-            "is_managed": True,
-            "domain_id": domain_id,
-            "workspace_id": workspace_id,
-            "project_id": project_id,
-        }
-
-        service_account_vos = self.service_account_mgr.filter_service_accounts(**params)
-        _LOGGER.debug(
-            f"[_create_service_account] service_account_vos: {name} {params} count: {len(service_account_vos)}"
-        )
-
-        if service_account_vos:
-            service_account_vo = service_account_vos[0]
-            update_params = {}
-            if service_account_vo.name != result["name"]:
-                update_params.update({"name": name})
-
-            update_params = {
-                "trusted_account_id": trusted_account_id,
-                "last_synced_at": datetime.utcnow(),
+        secret_mgr: SecretManager = self.locator.get_manager("SecretManager")
+        secret_id = service_account_vo.secret_id
+        secret_total_count = 0
+
+        if secret_id:
+            response = secret_mgr.list_secrets({"secret_id": secret_id}, domain_id)
+            secret_total_count = response.get("total_count", 0)
+
+        if secret_total_count > 0:
+            update_secret_params = {
+                "secret_id": service_account_vo.secret_id,
+                "data": secret_data,
+                "schema_id": secret_schema_id,
             }
-
-            service_account_vo = self.service_account_mgr.update_service_account_by_vo(
-                update_params, service_account_vo
-            )
+            secret_mgr.update_secret_data(update_secret_params, domain_id, workspace_id)
         else:
-            params.update(
-                {
-                    "name": name,
-                    "data": data,
-                    "trusted_account_id": trusted_account_id,
-                    "tags": tags,
-                    "last_synced_at": datetime.utcnow(),
-                }
+            # Check secret_data by schema
+            schema_mgr = SchemaManager()
+            schema_mgr.validate_secret_data_by_schema_id(
+                secret_schema_id, domain_id, secret_data, "TRUSTING_SECRET"
             )
-            if secret_schema_id:
-                params["schema_id"] = secret_schema_id
-
-            service_account_vo = self.service_account_mgr.create_service_account(params)
-
-        if secret_data:
-            secret_mgr: SecretManager = self.locator.get_manager("SecretManager")
-            secret_id = service_account_vo.secret_id
-            secret_total_count = 0
-
-            if secret_id:
-                response = secret_mgr.list_secrets({"secret_id": secret_id}, domain_id)
-                secret_total_count = response.get("total_count", 0)
-
-            if secret_total_count > 0:
-                update_secret_params = {
-                    "secret_id": service_account_vo.secret_id,
-                    "data": secret_data,
-                    "schema_id": secret_schema_id,
-                }
-                secret_mgr.update_secret_data(
-                    update_secret_params, domain_id, workspace_id
-                )
-            else:
 
-                # Check secret_data by schema
-                schema_mgr = SchemaManager()
-                schema_mgr.validate_secret_data_by_schema_id(
-                    secret_schema_id,
-                    service_account_vo.domain_id,
-                    secret_data,
-                    "TRUSTING_SECRET",
-                )
-
-                create_secret_params = {
-                    "name": f"{service_account_vo.service_account_id}-secret",
-                    "data": secret_data,
-                    "resource_group": "PROJECT",
-                    "workspace_id": workspace_id,
-                    "project_id": project_id,
-                    "service_account_id": service_account_vo.service_account_id,
-                    "trusted_secret_id": trusted_secret_id,
-                    "schema_id": secret_schema_id,
-                }
-                secret_info = secret_mgr.create_secret(create_secret_params, domain_id)
-                service_account_vo = (
-                    self.service_account_mgr.update_service_account_by_vo(
-                        {"secret_id": secret_info["secret_id"]}, service_account_vo
-                    )
-                )
-        return service_account_vo
-
-    def _remove_old_reference_id_from_workspace(
-        self, domain_id: str, workspace_id: str, reference_id: str
-    ) -> None:
-        query = {
-            "filter": [
-                {"k": "domain_id", "v": domain_id, "o": "eq"},
-                {"k": "workspace_id", "v": workspace_id, "o": "not"},
-                {"k": "references", "v": [reference_id], "o": "in"},
-            ],
-        }
-        workspace_vos, _ = self.workspace_mgr.list_workspaces(query)
-        for workspace_vo in workspace_vos:
-            references = workspace_vo.references
-            references.remove(reference_id)
-            self.workspace_mgr.update_workspace_by_vo(
-                {"references": references}, workspace_vo
+            create_secret_params = {
+                "name": f"{service_account_vo.service_account_id}-secret",
+                "data": secret_data,
+                "resource_group": "PROJECT",
+                "workspace_id": workspace_id,
+                "project_id": project_id,
+                "service_account_id": service_account_vo.service_account_id,
+                "trusted_secret_id": trusted_secret_id,
+                "schema_id": secret_schema_id,
+            }
+            secret_info = secret_mgr.create_secret(create_secret_params, domain_id)
+            service_account_vo = self.service_account_mgr.update_service_account_by_vo(
+                {"secret_id": secret_info["secret_id"]}, service_account_vo
             )
 
-    @staticmethod
-    def _get_location(result: dict, resource_group: str, sync_options: dict) -> list:
-        location = result.get("location", [])
-        skip_project_group_option = sync_options.get("skip_project_group")
-
-        if skip_project_group_option:
-            if resource_group == "DOMAIN":
-                if location:
-                    location = [location[0]]
-            else:
-                location = []
-
-        else:
-            if resource_group == "DOMAIN" and not location:
-                _LOGGER.debug(
-                    f"[_get_location] location is empty: {result} {sync_options} => SKIP"
-                )
-                # raise ERROR_REQUIRED_PARAMETER(
-                #     key="location", reason="location is required"
-                # )
-
-        return location
-
-    @staticmethod
-    def _set_workspace_theme(tags: dict = None) -> dict:
-        theme = secrets.choice(WORKSPACE_COLORS_NAME)
-        if tags:
-            tags.update({"theme": theme})
-        else:
-            tags = {"theme": theme}
-
-        return tags
+        return service_account_vo
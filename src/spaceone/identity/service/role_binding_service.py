@@ -1,6 +1,7 @@
 import logging
-from typing import Union
+from typing import Dict, List, Union
 
+from spaceone.core.error import ERROR_NOT_FOUND
 from spaceone.core.service import *
 from spaceone.core.service.utils import *
 from spaceone.identity.error import (
@@ -13,6 +14,7 @@ from spaceone.identity.manager.role_manager import RoleManager
 from spaceone.identity.manager.service_account_manager import ServiceAccountManager
 from spaceone.identity.manager.user_manager import UserManager
 from spaceone.identity.manager.workspace_manager import WorkspaceManager
+from spaceone.identity.model.role_binding.database import RoleBinding
 from spaceone.identity.model.role_binding.request import *
 from spaceone.identity.model.role_binding.response import *
 
@@ -115,10 +117,99 @@ class RoleBindingService(BaseService):
         # Create role binding
         rb_vo = self.role_binding_manager.create_role_binding(params)
 
-        self._update_workspace_user_count(rb_vo.workspace_id, rb_vo.domain_id)
-
         return rb_vo
 
+    def create_workspace_role_bindings(
+        self,
+        users: List[Dict[str, str]],
+        workspace_ids: List[str],
+        domain_id: str,
+        workspace_group_id: str = None,
+        update_user_count: bool = True,
+    ) -> List[RoleBinding]:
+        """Create role bindings of users for every workspace in bulk.
+        Roles, users and duplicates are checked once for all (workspace, user) pairs.
+        Args:
+            users: [{'user_id': 'str', 'role_id': 'str'}, ...]
+            workspace_ids: 'List[str]'
+            domain_id: 'str'
+            workspace_group_id: 'str'
+            update_user_count: 'bool'   # False if the caller refreshes user_count itself
+        Returns:
+            role_binding_vos: 'List[RoleBinding]'
+        """
+
+        if not (users and workspace_ids):
+            return []
+
+        user_role_map = {user["user_id"]: user["role_id"] for user in users}
+        user_ids = list(user_role_map.keys())
+
+        # A user listed twice would be bound twice in the same workspace
+        if len(user_ids) != len(users):
+            raise ERROR_DUPLICATED_WORKSPACE_ROLE_BINDING(
+                allowed_role_type=["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]
+            )
+
+        # Check roles
+        role_mgr = RoleManager()
+        role_ids = list(set(user_role_map.values()))
+        role_vos = role_mgr.filter_roles(role_id=role_ids, domain_id=domain_id)
+        role_type_map = {role_vo.role_id: role_vo.role_type for role_vo in role_vos}
+
+        for role_id in role_ids:
+            if role_id not in role_type_map:
+                raise ERROR_NOT_FOUND(key="role_id", value=role_id)
+
+            if role_type_map[role_id] not in ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]:
+                raise ERROR_NOT_ALLOWED_ROLE_TYPE(
+                    request_role_id=role_id,
+                    request_role_type=role_type_map[role_id],
+                    supported_role_type=["WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
+                )
+
+        # Check users
+        user_vos = self.user_mgr.filter_users(user_id=user_ids, domain_id=domain_id)
+        user_vo_map = {user_vo.user_id: user_vo for user_vo in user_vos}
+
+        for user_id in user_ids:
+            if user_id not in user_vo_map:
+                raise ERROR_NOT_FOUND(key="user_id", value=user_id)
+
+        self.check_duplicate_workspace_role(
+            domain_id, workspace_group_id, workspace_ids, user_ids
+        )
+
+        # Update user role type
+        for user_id, user_vo in user_vo_map.items():
+            latest_role_type = self._get_latest_role_type(
+                user_vo.role_type, role_type_map[user_role_map[user_id]]
+            )
+            if latest_role_type != user_vo.role_type:
+                self.user_mgr.update_user_by_vo(
+                    {"role_type": latest_role_type}, user_vo
+                )
+
+        # Create role bindings
+        params_list = []
+        for workspace_id in workspace_ids:
+            for user_id, role_id in user_role_map.items():
+                params_list.append(
+                    {
+                        "user_id": user_id,
+                        "role_id": role_id,
+                        "role_type": role_type_map[role_id],
+                        "resource_group": "WORKSPACE",
+                        "workspace_group_id": workspace_group_id,
+                        "workspace_id": workspace_id,
+                        "domain_id": domain_id,
+                    }
+                )
+
+        return self.role_binding_manager.create_role_bindings(
+            params_list, update_user_count=update_user_count
+        )
+
     @transaction(
         permission="identity:RoleBinding.write",
         role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER"],
@@ -273,7 +364,6 @@ class RoleBindingService(BaseService):
         self.user_mgr.update_user_by_vo(user_role_info, user_vo)
 
         self.role_binding_manager.delete_role_binding_by_vo(rb_vo)
-        self._update_workspace_user_count(rb_vo.workspace_id, rb_vo.domain_id)
 
     @transaction(
         permission="identity:RoleBinding.read",
@@ -381,7 +471,11 @@ class RoleBindingService(BaseService):
             raise ERROR_DUPLICATED_ROLE_BINDING(role_type=role_type)
 
     def check_duplicate_workspace_role(
-        self, domain_id: str, workspace_group_id: str, workspace_id: str, user_id: str
+        self,
+        domain_id: str,
+        workspace_group_id: str,
+        workspace_id: Union[str, List[str]],
+        user_id: Union[str, List[str]],
     ) -> None:
         conditions = {
             "domain_id": domain_id,
@@ -401,27 +495,12 @@ class RoleBindingService(BaseService):
     def check_last_domain_admin_role_binding(
         self, user_id: str, new_role_type: Union[str, None], domain_id: str
     ) -> None:
-        user_ids = self._get_enabled_user_ids(domain_id)
-        rb_vos = self.role_binding_manager.filter_role_bindings(
-            domain_id=domain_id,
-            role_type="DOMAIN_ADMIN",
-            user_id=user_ids,
-        )
-
-        if not rb_vos.filter(user_id=user_id):
+        if new_role_type == "DOMAIN_ADMIN":
             return None
 
-        if rb_vos.count() == 1 and new_role_type != "DOMAIN_ADMIN":
+        if self.role_binding_manager.is_last_domain_admin(user_id, domain_id):
             raise ERROR_LAST_DOMAIN_ADMIN_CANNOT_DELETE()
 
-    def _get_enabled_user_ids(self, domain_id: str) -> list:
-        user_vos = self.user_mgr.filter_users(
-            domain_id=domain_id,
-            state="ENABLED",
-        )
-
-        return [user_vo.user_id for user_vo in user_vos]
-
     @staticmethod
     def check_self_update_and_delete(requested_user_id: str, user_id: str) -> None:
         if user_id == requested_user_id:
@@ -451,32 +530,3 @@ class RoleBindingService(BaseService):
                 return "USER"
 
             return after
-
-    def _get_workspace_user_count(self, workspace_id: str, domain_id: str) -> int:
-        user_rb_ids = self.role_binding_manager.stat_role_bindings(
-            query={
-                "distinct": "user_id",
-                "filter": [
-                    {"k": "workspace_id", "v": workspace_id, "o": "eq"},
-                    {"k": "domain_id", "v": domain_id, "o": "eq"},
-                ],
-            }
-        ).get("results", [])
-        return len(user_rb_ids)
-
-    def _update_workspace_user_count(self, workspace_id: str, domain_id: str) -> None:
-        if not workspace_id and not domain_id:
-            return
-
-        if workspace_id == "*":
-            return
-
-        workspace_vo = self.workspace_mgr.get_workspace(workspace_id, domain_id)
-
-        if workspace_vo and workspace_vo.workspace_id != "*":
-            user_rb_total_count = self._get_workspace_user_count(
-                workspace_id, domain_id
-            )
-            self.workspace_mgr.update_workspace_by_vo(
-                {"user_count": user_rb_total_count}, workspace_vo
-            )
@@ -325,6 +325,7 @@ class ServiceAccountService(BaseService):
         params_data = params.dict(exclude_unset=True)
         params_data["secret_id"] = secret_info["secret_id"]
         params_data["secret_schema_id"] = params.secret_schema_id
+        params_data["secret_data_hash"] = None
 
         service_account_vo = self.service_account_mgr.update_service_account_by_vo(
             params_data, service_account_vo
@@ -365,7 +366,12 @@ class ServiceAccountService(BaseService):
         secret_mgr.delete_related_secrets(service_account_vo.service_account_id)
 
         service_account_vo = self.service_account_mgr.update_service_account_by_vo(
-            {"secret_id": None, "secret_schema_id": None, "trusted_account_id": None},
+            {
+                "secret_id": None,
+                "secret_schema_id": None,
+                "secret_data_hash": None,
+                "trusted_account_id": None,
+            },
             service_account_vo,
         )
 
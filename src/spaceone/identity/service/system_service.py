@@ -1,7 +1,6 @@
 import logging
 from typing import Union
 
-from spaceone.core.auth.jwt import JWTAuthenticator
 from spaceone.core.service import *
 from spaceone.core.service.utils import *
 from spaceone.identity.error.error_domain import *
@@ -75,10 +74,7 @@ class SystemService(BaseService):
             # Check System Token
             try:
                 token = self.transaction.get_meta("token")
-                root_pub_jwk = self.domain_secret_mgr.get_domain_public_key(
-                    root_domain_id
-                )
-                JWTAuthenticator(root_pub_jwk).validate(token)
+                self.domain_secret_mgr.verify_token(token, root_domain_id)
             except Exception:
                 raise ERROR_UNKNOWN(message="Invalid System Token")
 
@@ -148,20 +144,12 @@ class SystemService(BaseService):
         rb_vos = self.role_binding_manager.filter_role_bindings(
             user_id=user_vo.user_id, domain_id=user_vo.domain_id
         )
-        for rb_vo in rb_vos:
-            self.role_binding_manager.delete_role_binding_by_vo(rb_vo)
-            self._update_workspace_user_count(rb_vo.workspace_id, rb_vo.domain_id)
+        self.role_binding_manager.delete_role_bindings(rb_vos)
 
         # Delete user from user groups
-        user_group_vos = self.user_group_mgr.filter_user_groups(
-            users=user_vo.user_id, domain_id=user_vo.domain_id
+        self.user_group_mgr.remove_users_from_user_groups(
+            [user_vo.user_id], user_vo.domain_id
         )
-        for user_group_vo in user_group_vos:
-            users = user_group_vo.users
-            users.remove(user_vo.user_id)
-            self.user_group_mgr.update_user_group_by_vo(
-                {"users": users}, user_group_vo=user_group_vo
-            )
 
         # Delete projects
         project_vos = self.project_mgr.filter_projects(
@@ -194,32 +182,3 @@ class SystemService(BaseService):
                     )
 
         self.user_mgr.delete_user(user_vo)
-
-    def _get_workspace_user_count(self, workspace_id: str, domain_id: str) -> int:
-        user_rb_ids = self.role_binding_manager.stat_role_bindings(
-            query={
-                "distinct": "user_id",
-                "filter": [
-                    {"k": "workspace_id", "v": workspace_id, "o": "eq"},
-                    {"k": "domain_id", "v": domain_id, "o": "eq"},
-                ],
-            }
-        ).get("results", [])
-        return len(user_rb_ids)
-
-    def _update_workspace_user_count(self, workspace_id: str, domain_id: str) -> None:
-        if not workspace_id and not domain_id:
-            return
-
-        if workspace_id == "*":
-            return
-
-        workspace_vo = self.workspace_mgr.get_workspace(workspace_id, domain_id)
-
-        if workspace_vo and workspace_vo.workspace_id != "*":
-            user_rb_total_count = self._get_workspace_user_count(
-                workspace_id, domain_id
-            )
-            self.workspace_mgr.update_workspace_by_vo(
-                {"user_count": user_rb_total_count}, workspace_vo
-            )
@@ -3,14 +3,16 @@ from collections import OrderedDict
 from typing import List, Tuple
 
 from spaceone.core import cache, config, utils
-from spaceone.core.auth.jwt import JWTAuthenticator, JWTUtil
+from spaceone.core.auth.jwt import JWTUtil
 from spaceone.core.service import *
 from spaceone.core.service.utils import *
 from spaceone.identity.error.error_authentication import *
 from spaceone.identity.error.error_domain import ERROR_DOMAIN_STATE
 from spaceone.identity.error.error_mfa import *
 from spaceone.identity.error.error_workspace import ERROR_WORKSPACE_STATE
+from spaceone.identity.lib import single_flight
 from spaceone.identity.manager import SecretManager
+from spaceone.identity.manager.access_snapshot_manager import AccessSnapshotManager
 from spaceone.identity.manager.app_manager import AppManager
 from spaceone.identity.manager.domain_manager import DomainManager
 from spaceone.identity.manager.domain_secret_manager import DomainSecretManager
@@ -48,6 +50,7 @@ class TokenService(BaseService):
         self.project_mgr = ProjectManager()
         self.project_group_mgr = ProjectGroupManager()
         self.workspace_mgr = WorkspaceManager()
+        self.access_snapshot_mgr = AccessSnapshotManager()
         self._load_conf()
 
     @transaction()
@@ -168,19 +171,16 @@ class TokenService(BaseService):
             GrantTokenResponse:
         """
         domain_id = self._extract_domain_id(params.token)
+        token_domain_id = domain_id
         timeout = params.timeout
-        public_jwk = None  # todo: remove
-
-        refresh_public_jwk = self.domain_secret_mgr.get_domain_refresh_public_key(
-            domain_id=domain_id
-        )
+        is_root_workspace_grant = False  # todo: remove
 
         # todo: remove
         if (
             domain_id == SystemManager.get_root_domain_id()
             and params.scope == "WORKSPACE"
         ):
-            public_jwk = self.domain_secret_mgr.get_domain_public_key(domain_id)
+            is_root_workspace_grant = True
             domain_id = params.domain_id
 
         if domain_id == SystemManager.get_root_domain_id() and params.scope != "SYSTEM":
@@ -201,17 +201,18 @@ class TokenService(BaseService):
         # Check Domain state is ENABLED
         self._check_domain_state(domain_id)
 
-        if public_jwk:
+        if is_root_workspace_grant:
             # todo: remove
             decoded_token_info = self._verify_token(
-                params.grant_type, params.token, public_jwk
+                params.grant_type, params.token, token_domain_id
             )
             role_id = "managed-workspace-owner"
             role_type = "WORKSPACE_OWNER"
             user_vo = None
+            access_info = {}
         else:
             decoded_token_info = self._verify_token(
-                params.grant_type, params.token, refresh_public_jwk
+                params.grant_type, params.token, token_domain_id, refresh=True
             )
 
             if decoded_token_info["owner_type"] != "USER":
@@ -223,9 +224,11 @@ class TokenService(BaseService):
 
             self._check_user_required_actions(user_vo.required_actions, user_vo.user_id)
 
-            role_type, role_id = self._get_user_role_info(
+            access_info = self._get_user_access_info(
                 user_vo, workspace_id=params.workspace_id
             )
+            role_type = access_info["role_type"]
+            role_id = access_info["role_id"]
 
         decoded_token_info["scope"] = params.scope
         decoded_token_info["workspace_id"] = params.workspace_id
@@ -237,7 +240,7 @@ class TokenService(BaseService):
 
         token_mgr = TokenManager.get_token_manager_by_auth_type("GRANT")
         app_id = None
-        if public_jwk:
+        if is_root_workspace_grant:
             # todo : remove
             token_mgr.is_authenticated = True
             token_mgr.owner_type = decoded_token_info.get("owner_type")
@@ -254,25 +257,16 @@ class TokenService(BaseService):
         if params.grant_type == "SYSTEM_TOKEN" and params.scope == "WORKSPACE":
             # todo : remove
             permissions = params.permissions
+        elif user_vo:
+            permissions = access_info["permissions"]
         elif role_id:
             permissions = self._get_role_permissions(role_id, domain_id)
         else:
             permissions = []
 
-        if role_type == "WORKSPACE_MEMBER":
-            user_projects = self._get_user_projects_in_project_group(
-                domain_id, params.workspace_id, user_vo.user_id
-            )
-        else:
-            user_projects = None
-
-        # get user groups in workspace
-        if params.scope == "WORKSPACE" and user_vo:
-            user_groups = self._get_user_groups_in_workspace(
-                domain_id, params.workspace_id, user_vo.user_id
-            )
-        else:
-            user_groups = None
+        user_projects = access_info.get("projects")
+        public_projects = access_info.get("public_projects", False)
+        user_groups = access_info.get("user_groups")
 
         token_info = token_mgr.issue_token(
             private_jwk,
@@ -282,6 +276,7 @@ class TokenService(BaseService):
             workspace_id=params.workspace_id,
             permissions=permissions,
             projects=user_projects,
+            public_projects=public_projects,
             user_groups=user_groups,
             app_id=app_id,  # todo : remove
         )
@@ -296,8 +291,10 @@ class TokenService(BaseService):
 
         return GrantTokenResponse(**response)
 
-    @cache.cacheable(
-        key="identity:workspace-state:{domain_id}:{workspace_id}", expire=600
+    @single_flight.cacheable(
+        key="identity:workspace-state:{domain_id}:{workspace_id}",
+        expire=600,
+        early_refresh=60,
     )
     def _check_workspace_state(self, workspace_id: str, domain_id: str) -> None:
         workspace_vo = self.workspace_mgr.get_workspace(workspace_id, domain_id)
@@ -305,7 +302,9 @@ class TokenService(BaseService):
         if workspace_vo.state != "ENABLED":
             raise ERROR_WORKSPACE_STATE(workspace_id=workspace_id)
 
-    @cache.cacheable(key="identity:domain-state:{domain_id}", expire=600)
+    @single_flight.cacheable(
+        key="identity:domain-state:{domain_id}", expire=600, early_refresh=60
+    )
     def _check_domain_state(self, domain_id: str) -> None:
         domain_vo = self.domain_mgr.get_domain(domain_id)
 
@@ -341,10 +340,11 @@ class TokenService(BaseService):
 
         return domain_id
 
-    @staticmethod
-    def _verify_token(grant_type: str, token: str, public_jwk: dict) -> dict:
+    def _verify_token(
+        self, grant_type: str, token: str, domain_id: str, refresh: bool = False
+    ) -> dict:
         try:
-            decoded = JWTAuthenticator(public_jwk).validate(token)
+            decoded = self.domain_secret_mgr.verify_token(token, domain_id, refresh)
         except Exception as e:
             _LOGGER.error(f"[_verify_refresh_token] {e}")
             raise ERROR_AUTHENTICATE_FAILURE(message="Token validation failed.")
@@ -364,26 +364,109 @@ class TokenService(BaseService):
 
         return token_info
 
+    def _get_user_access_info(self, user_vo: User, workspace_id: str = None) -> dict:
+        access_snapshot_vo = self.access_snapshot_mgr.get_access_snapshot(
+            user_vo.user_id, user_vo.domain_id, workspace_id
+        )
+
+        compact_projects = self.COMPACT_PROJECTS
+
+        if (
+            access_snapshot_vo
+            and access_snapshot_vo.user_role_type == user_vo.role_type
+            and access_snapshot_vo.public_projects == self._is_public_projects(
+                access_snapshot_vo.role_type, compact_projects
+            )
+        ):
+            return {
+                "role_type": access_snapshot_vo.role_type,
+                "role_id": access_snapshot_vo.role_id,
+                "permissions": access_snapshot_vo.permissions or [],
+                "projects": access_snapshot_vo.projects,
+                "public_projects": access_snapshot_vo.public_projects,
+                "user_groups": access_snapshot_vo.user_groups,
+            }
+
+        # Read before the access info so that a concurrent invalidation is detected.
+        generation = self.access_snapshot_mgr.get_generation(
+            user_vo.domain_id, workspace_id
+        )
+
+        role_type, role_id = self._get_user_role_info(user_vo, workspace_id)
+
+        if role_id:
+            permissions = self._get_role_permissions(role_id, user_vo.domain_id)
+        else:
+            permissions = []
+
+        public_projects = self._is_public_projects(role_type, compact_projects)
+
+        if role_type == "WORKSPACE_MEMBER":
+            user_projects = self._get_user_projects_in_project_group(
+                user_vo.domain_id,
+                workspace_id,
+                user_vo.user_id,
+                include_public=not public_projects,
+            )
+        else:
+            user_projects = None
+
+        # get user groups in workspace
+        if workspace_id:
+            user_groups = self._get_user_groups_in_workspace(
+                user_vo.domain_id, workspace_id, user_vo.user_id
+            )
+        else:
+            user_groups = None
+
+        access_info = {
+            "role_type": role_type,
+            "role_id": role_id,
+            "permissions": permissions,
+            "projects": user_projects,
+            "public_projects": public_projects,
+            "user_groups": user_groups,
+        }
+
+        self.access_snapshot_mgr.save_access_snapshot(
+            {
+                "user_id": user_vo.user_id,
+                "user_role_type": user_vo.role_type,
+                "workspace_id": workspace_id,
+                "domain_id": user_vo.domain_id,
+                **access_info,
+            },
+            generation,
+        )
+
+        return access_info
+
     def _get_user_role_info(
         self, user_vo: User, workspace_id: str = None
     ) -> Tuple[str, Union[str, None]]:
+        # The result is saved in the access snapshot, so skip the per-process cache
+        # which may still hold bindings changed by another process.
+        rb_infos = self.rb_mgr.get_user_role_bindings(
+            user_vo.user_id, user_vo.domain_id, use_local_cache=False
+        )
+
         if user_vo.role_type == "DOMAIN_ADMIN":
-            rb_vos = self.rb_mgr.filter_role_bindings(
-                user_id=user_vo.user_id,
-                domain_id=user_vo.domain_id,
-                role_type=user_vo.role_type,
-            )
+            rb_infos = [
+                rb_info
+                for rb_info in rb_infos
+                if rb_info["role_type"] == user_vo.role_type
+            ]
 
         else:
-            rb_vos = self.rb_mgr.filter_role_bindings(
-                user_id=user_vo.user_id,
-                domain_id=user_vo.domain_id,
-                role_type=["WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
-                workspace_id=workspace_id,
-            )
+            rb_infos = [
+                rb_info
+                for rb_info in rb_infos
+                if rb_info["role_type"] in ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]
+                and rb_info["workspace_id"] == workspace_id
+            ]
 
-        if rb_vos.count() > 0:
-            return rb_vos[0].role_type, rb_vos[0].role_id
+        if rb_infos:
+            return rb_infos[0]["role_type"], rb_infos[0]["role_id"]
 
         return "USER", None
 
@@ -391,13 +474,25 @@ class TokenService(BaseService):
     def _get_app_role_info(app_vo: App) -> Tuple[str, str]:
         return app_vo.role_type, app_vo.role_id
 
-    @cache.cacheable(key="identity:role-permissions:{domain_id}:{role_id}", expire=600)
+    @single_flight.cacheable(
+        key="identity:role-permissions:{domain_id}:{role_id}",
+        expire=600,
+        early_refresh=60,
+    )
     def _get_role_permissions(self, role_id: str, domain_id: str) -> list:
         role_vo = self.role_mgr.get_role(role_id=role_id, domain_id=domain_id)
         return role_vo.permissions
 
+    @staticmethod
+    def _is_public_projects(role_type: str, compact_projects: bool) -> bool:
+        return compact_projects and role_type == "WORKSPACE_MEMBER"
+
     def _get_user_projects_in_project_group(
-        self, domain_id: str, workspace_id: str, user_id: str
+        self,
+        domain_id: str,
+        workspace_id: str,
+        user_id: str,
+        include_public: bool = True,
     ) -> List[str]:
         user_projects = []
         project_groups = self.project_group_mgr.filter_project_groups(
@@ -408,11 +503,13 @@ class TokenService(BaseService):
             project_group_id = project_group.project_group_id
             user_projects.extend(
                 self.project_group_mgr.get_projects_in_project_groups(
-                    domain_id, project_group_id
+                    domain_id, project_group_id, exclude_public=not include_public
                 )
             )
 
-        user_projects.extend(self._get_user_projects(user_id, workspace_id, domain_id))
+        user_projects.extend(
+            self._get_user_projects(user_id, workspace_id, domain_id, include_public)
+        )
 
         user_projects = list(set(user_projects))
         return user_projects
@@ -428,18 +525,23 @@ class TokenService(BaseService):
         return user_groups
 
     def _get_user_projects(
-        self, user_id: str, workspace_id: str, domain_id: str
+        self,
+        user_id: str,
+        workspace_id: str,
+        domain_id: str,
+        include_public: bool = True,
     ) -> List[str]:
         user_projects = []
 
-        public_project_vos = self.project_mgr.filter_projects(
-            project_type="PUBLIC",
-            domain_id=domain_id,
-            workspace_id=workspace_id,
-        )
-        user_projects.extend(
-            [project_vo.project_id for project_vo in public_project_vos]
-        )
+        if include_public:
+            public_project_vos = self.project_mgr.filter_projects(
+                project_type="PUBLIC",
+                domain_id=domain_id,
+                workspace_id=workspace_id,
+            )
+            user_projects.extend(
+                [project_vo.project_id for project_vo in public_project_vos]
+            )
 
         user_project_vos = self.project_mgr.filter_projects(
             project_type="PRIVATE",
@@ -475,6 +577,7 @@ class TokenService(BaseService):
 
         self.ISSUE_BLOCK_TIME = token_conf.get("issue_block_time", 300)
         self.MAX_ISSUE_ATTEMPTS = token_conf.get("max_issue_attempts", 10)
+        self.COMPACT_PROJECTS = token_conf.get("compact_projects", False)
 
     def _increment_issue_attempts(
         self, domain_id: str, credentials: dict, auth_type: str
@@ -438,16 +438,15 @@ class UserProfileService(BaseService):
         if user_vo.role_type == "DOMAIN_ADMIN":
             allow_all = True
 
-        conditions = {
-            "user_id": user_id,
-            "domain_id": domain_id,
-            "role_type": ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
-        }
-
-        if workspace_group_id:
-            conditions["workspace_group_id"] = workspace_group_id
-
-        rb_vos = rb_mgr.filter_role_bindings(**conditions)
+        rb_infos = [
+            rb_info
+            for rb_info in rb_mgr.get_user_role_bindings(user_id, domain_id)
+            if rb_info["role_type"] in ["WORKSPACE_OWNER", "WORKSPACE_MEMBER"]
+            and (
+                not workspace_group_id
+                or rb_info["workspace_group_id"] == workspace_group_id
+            )
+        ]
 
         workspace_filter_conditions = {"domain_id": domain_id, "state": "ENABLED"}
         if allow_all:
@@ -458,7 +457,7 @@ class UserProfileService(BaseService):
                 **workspace_filter_conditions
             )
         else:
-            workspace_ids = list(set([rb.workspace_id for rb in rb_vos]))
+            workspace_ids = list(set([rb["workspace_id"] for rb in rb_infos]))
             workspace_filter_conditions["workspace_id"] = workspace_ids
             workspace_vos = workspace_mgr.filter_workspaces(
                 **workspace_filter_conditions
@@ -470,7 +469,7 @@ class UserProfileService(BaseService):
         )
 
         role_name_map = {role_vo.role_id: role_vo.name for role_vo in role_vos}
-        role_bindings_info_map = {rb.workspace_id: rb.to_dict() for rb in rb_vos}
+        role_bindings_info_map = {rb["workspace_id"]: rb for rb in rb_infos}
 
         workspaces_info = [workspace_vo.to_dict() for workspace_vo in workspace_vos]
         my_workspaces_info = self._get_my_workspaces_info(
@@ -549,13 +548,9 @@ class UserProfileService(BaseService):
         return f"{console_domain}?sso_access_token={token}"
 
     def _check_last_admin(self, domain_id: str, user_vo: User) -> None:
-        user_vos = self.user_mgr.filter_users(
-            domain_id=domain_id, state="ENABLED", role_type=user_vo.role_type
-        )
-
-        if user_vos.count() == 1:
-            if user_vos.first().user_id == user_vo.user_id:
-                raise ERROR_LAST_ADMIN_CANNOT_DISABLED_DELETED(user_id=user_vo.user_id)
+        rb_mgr = RoleBindingManager()
+        if rb_mgr.is_last_domain_admin(user_vo.user_id, domain_id):
+            raise ERROR_LAST_ADMIN_CANNOT_DISABLED_DELETED(user_id=user_vo.user_id)
 
     def _get_console_url(self, domain_id):
         domain_name = self._get_domain_name(domain_id)
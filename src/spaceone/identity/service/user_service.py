@@ -585,11 +585,7 @@ class UserService(BaseService):
         return f"{console_domain}?sso_access_token={token}"
 
     def _check_last_admin_user(self, domain_id: str, user_vo: User) -> None:
-        user_vos = self.user_mgr.filter_users(
-            domain_id=domain_id, state="ENABLED", role_type="DOMAIN_ADMIN"
-        )
-
-        if user_vos.count() == 1:
+        if self.rb_mgr.is_last_domain_admin(user_vo.user_id, domain_id):
             raise ERROR_LAST_ADMIN_CANNOT_DISABLED_DELETED(user_id=user_vo.user_id)
 
     @staticmethod
@@ -936,20 +932,12 @@ class UserService(BaseService):
         rb_vos = self.rb_mgr.filter_role_bindings(
             user_id=user_vo.user_id, domain_id=user_vo.domain_id
         )
-        for rb_vo in rb_vos:
-            self.rb_mgr.delete_role_binding_by_vo(rb_vo)
-            self._update_workspace_user_count(rb_vo.workspace_id, rb_vo.domain_id)
+        self.rb_mgr.delete_role_bindings(rb_vos)
 
         # Delete user from user groups
-        user_group_vos = self.user_group_mgr.filter_user_groups(
-            users=user_vo.user_id, domain_id=user_vo.domain_id
+        self.user_group_mgr.remove_users_from_user_groups(
+            [user_vo.user_id], user_vo.domain_id
         )
-        for user_group_vo in user_group_vos:
-            users = user_group_vo.users
-            users.remove(user_vo.user_id)
-            self.user_group_mgr.update_user_group_by_vo(
-                {"users": users}, user_group_vo=user_group_vo
-            )
 
         # Delete projects
         project_vos = self.project_mgr.filter_projects(
@@ -982,32 +970,3 @@ class UserService(BaseService):
                     )
 
         self.user_mgr.delete_user(user_vo)
-
-    def _get_workspace_user_count(self, workspace_id: str, domain_id: str) -> int:
-        user_rb_ids = self.rb_mgr.stat_role_bindings(
-            query={
-                "distinct": "user_id",
-                "filter": [
-                    {"k": "workspace_id", "v": workspace_id, "o": "eq"},
-                    {"k": "domain_id", "v": domain_id, "o": "eq"},
-                ],
-            }
-        ).get("results", [])
-        return len(user_rb_ids)
-
-    def _update_workspace_user_count(self, workspace_id: str, domain_id: str) -> None:
-        if not workspace_id and not domain_id:
-            return
-
-        if workspace_id == "*":
-            return
-
-        workspace_vo = self.workspace_mgr.get_workspace(workspace_id, domain_id)
-
-        if workspace_vo and workspace_vo.workspace_id != "*":
-            user_rb_total_count = self._get_workspace_user_count(
-                workspace_id, domain_id
-            )
-            self.workspace_mgr.update_workspace_by_vo(
-                {"user_count": user_rb_total_count}, workspace_vo
-            )
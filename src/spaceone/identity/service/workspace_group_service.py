@@ -459,15 +459,8 @@ class WorkspaceGroupService(BaseService):
             role_id, role_type, target_user_id, workspace_group_id, domain_id
         )
 
-        update_workspace_group_params = {"users": workspace_group_vo.users or []}
-        for user_info in update_workspace_group_params.get("users", []):
-            if user_info["user_id"] == target_user_id:
-                user_info["role_id"] = role_id
-                user_info["role_type"] = role_type
-                break
-
-        workspace_group_vo = self.workspace_group_mgr.update_workspace_group_by_vo(
-            update_workspace_group_params, workspace_group_vo
+        workspace_group_vo = self.workspace_group_mgr.update_user_role_by_vo(
+            target_user_id, role_id, role_type, workspace_group_vo
         )
 
         return WorkspaceGroupResponse(**workspace_group_vo.to_dict())
@@ -518,9 +511,7 @@ class WorkspaceGroupService(BaseService):
             domain_id=domain_id,
         )
 
-        for rb_vo in rb_vos:
-            self.rb_mgr.delete_role_binding_by_vo(rb_vo)
-            self._update_workspace_user_count(rb_vo.workspace_id, rb_vo.domain_id)
+        self.rb_mgr.delete_role_bindings(rb_vos)
 
     def add_users_to_workspace_group(
         self,
@@ -533,35 +524,23 @@ class WorkspaceGroupService(BaseService):
         workspace_group_new_users_info_list = []
         unique_user_ids = set()
 
-        def add_user(user_info, workspace_group_workspace_id=None):
-            role_type = new_users_role_map[user_info["role_id"]]
-            user_data = {
-                "user_id": user_info["user_id"],
-                "role_id": user_info["role_id"],
-                "role_type": role_type,
-            }
-
-            if workspace_group_workspace_id:
-                role_binding_params = {
-                    **user_data,
-                    "resource_group": "WORKSPACE",
-                    "domain_id": domain_id,
-                    "workspace_group_id": workspace_group_id,
-                    "workspace_id": workspace_group_workspace_id,
-                }
-                self.rb_svc.create_role_binding(role_binding_params)
-
-            if user_info["user_id"] not in unique_user_ids:
-                workspace_group_new_users_info_list.append(user_data)
-                unique_user_ids.add(user_data["user_id"])
+        for new_user_info in new_users_info_list:
+            if new_user_info["user_id"] not in unique_user_ids:
+                workspace_group_new_users_info_list.append(
+                    {
+                        "user_id": new_user_info["user_id"],
+                        "role_id": new_user_info["role_id"],
+                        "role_type": new_users_role_map[new_user_info["role_id"]],
+                    }
+                )
+                unique_user_ids.add(new_user_info["user_id"])
 
-        if workspace_ids := workspace_group_workspace_ids:
-            for workspace_id in workspace_ids:
-                for new_user_info in new_users_info_list:
-                    add_user(new_user_info, workspace_id)
-        else:
-            for new_user_info in new_users_info_list:
-                add_user(new_user_info)
+        self.rb_svc.create_workspace_role_bindings(
+            workspace_group_new_users_info_list,
+            workspace_group_workspace_ids,
+            domain_id,
+            workspace_group_id=workspace_group_id,
+        )
 
         return workspace_group_new_users_info_list
 
@@ -664,37 +643,10 @@ class WorkspaceGroupService(BaseService):
             domain_id=domain_id,
         )
 
-        if rb_vos.count() > 0:
-            for rb_vo in rb_vos:
-                self.rb_mgr.delete_role_binding_by_vo(rb_vo)
-                self._update_workspace_user_count(rb_vo.workspace_id, rb_vo.domain_id)
+        self.rb_mgr.delete_role_bindings(rb_vos)
 
         updated_users = [user for user in old_users if user["user_id"] not in user_ids]
 
-        if not workspace_id:
-            workspace_vos = self.workspace_mgr.filter_workspaces(
-                workspace_group_id=workspace_group_id, domain_id=domain_id
-            )
-            for workspace_vo in workspace_vos:
-                user_rb_ids = self.rb_mgr.stat_role_bindings(
-                    query={
-                        "distinct": "user_id",
-                        "filter": [
-                            {
-                                "k": "workspace_id",
-                                "v": workspace_vo.workspace_id,
-                                "o": "eq",
-                            },
-                            {"k": "domain_id", "v": domain_id, "o": "eq"},
-                        ],
-                    }
-                ).get("results", [])
-                user_rb_total_count = len(user_rb_ids)
-
-                self.workspace_mgr.update_workspace_by_vo(
-                    {"user_count": user_rb_total_count}, workspace_vo
-                )
-
         return updated_users
 
     def get_workspace_groups_info(
@@ -738,40 +690,6 @@ class WorkspaceGroupService(BaseService):
         workspace_group_id: str,
         domain_id: str,
     ) -> None:
-        role_binding_vos = self.rb_mgr.filter_role_bindings(
-            user_id=user_id,
-            workspace_group_id=workspace_group_id,
-            domain_id=domain_id,
+        self.rb_mgr.update_workspace_group_user_role(
+            role_id, role_type, user_id, workspace_group_id, domain_id
         )
-
-        for role_binding_vo in role_binding_vos:
-            role_binding_vo.update({"role_id": role_id, "role_type": role_type})
-
-    def _get_workspace_user_count(self, workspace_id: str, domain_id: str) -> int:
-        user_rb_ids = self.rb_mgr.stat_role_bindings(
-            query={
-                "distinct": "user_id",
-                "filter": [
-                    {"k": "workspace_id", "v": workspace_id, "o": "eq"},
-                    {"k": "domain_id", "v": domain_id, "o": "eq"},
-                ],
-            }
-        ).get("results", [])
-        return len(user_rb_ids)
-
-    def _update_workspace_user_count(self, workspace_id: str, domain_id: str) -> None:
-        if not workspace_id and not domain_id:
-            return
-
-        if workspace_id == "*":
-            return
-
-        workspace_vo = self.workspace_mgr.get_workspace(workspace_id, domain_id)
-
-        if workspace_vo and workspace_vo.workspace_id != "*":
-            user_rb_total_count = self._get_workspace_user_count(
-                workspace_id, domain_id
-            )
-            self.workspace_mgr.update_workspace_by_vo(
-                {"user_count": user_rb_total_count}, workspace_vo
-            )
@@ -16,7 +16,7 @@ from spaceone.identity.manager.service_account_manager import ServiceAccountMana
 from spaceone.identity.manager.trusted_account_manager import TrustedAccountManager
 from spaceone.identity.manager.workspace_group_manager import WorkspaceGroupManager
 from spaceone.identity.manager.workspace_manager import WorkspaceManager
-from spaceone.identity.model import Workspace
+from spaceone.identity.model import Workspace, WorkspaceGroup
 from spaceone.identity.model.workspace.request import *
 from spaceone.identity.model.workspace.response import *
 from spaceone.identity.service.role_binding_service import RoleBindingService
@@ -108,7 +108,7 @@ class WorkspaceService(BaseService):
         domain_id = params.domain_id
 
         workspace_vo = self.workspace_mgr.get_workspace(
-            workspace_id=params.workspace_id, domain_id=domain_id
+            workspace_id=workspace_id, domain_id=domain_id
         )
 
         old_workspace_group_id = workspace_vo.workspace_group_id
@@ -119,7 +119,7 @@ class WorkspaceService(BaseService):
                 domain_id, new_workspace_group_id
             )
             is_updatable = self._add_workspace_to_group(
-                workspace_id, new_workspace_group_id, domain_id
+                workspace_vo, workspace_group_vo
             )
         elif old_workspace_group_id:
             workspace_group_vo = self.workspace_group_mgr.get_workspace_group(
@@ -140,7 +140,7 @@ class WorkspaceService(BaseService):
                 )
 
                 self.workspace_group_mgr.update_workspace_group_by_vo(
-                    {"workspace_count": len(workspace_vos)}, workspace_group_vo
+                    {"workspace_count": workspace_vos.count()}, workspace_group_vo
                 )
             if old_workspace_group_id:
                 workspace_vos = self.workspace_mgr.filter_workspaces(
@@ -152,7 +152,7 @@ class WorkspaceService(BaseService):
                 )
 
                 self.workspace_group_mgr.update_workspace_group_by_vo(
-                    {"workspace_count": len(workspace_vos)}, workspace_group_vo
+                    {"workspace_count": workspace_vos.count()}, workspace_group_vo
                 )
 
         return WorkspaceResponse(**workspace_vo.to_dict())
@@ -515,89 +515,58 @@ class WorkspaceService(BaseService):
             )
             trusted_account_mgr.delete_trusted_account_by_vo(trusted_account_vo)
 
-        for rb_vo in rb_vos:
-            rb_mgr.delete_role_binding_by_vo(rb_vo)
-            _LOGGER.debug(
-                f"[delete_workspace_by_vo] Delete role bindings count with {workspace_vo.workspace_id} : {rb_vos.count()}"
-            )
+        _LOGGER.debug(
+            f"[delete_workspace_by_vo] Delete role bindings count with {workspace_vo.workspace_id} : {rb_vos.count()}"
+        )
+        rb_mgr.delete_role_bindings(rb_vos)
 
     def _add_workspace_to_group(
-        self, workspace_id: str, workspace_group_id: str, domain_id: str
+        self, workspace_vo: Workspace, workspace_group_vo: WorkspaceGroup
     ) -> bool:
-        workspace_vo = self.workspace_mgr.get_workspace(
-            workspace_id=workspace_id, domain_id=domain_id
-        )
+        workspace_id = workspace_vo.workspace_id
+        workspace_group_id = workspace_group_vo.workspace_group_id
+        domain_id = workspace_vo.domain_id
         old_workspace_group_id = workspace_vo.workspace_group_id
-        is_updatable = True
 
-        workspace_group_vo = self.workspace_group_mgr.get_workspace_group(
-            domain_id, workspace_group_id
+        if old_workspace_group_id == workspace_group_id:
+            return False
+
+        # Role bindings are replaced in bulk without per-binding user_count updates,
+        # so user_count is recomputed once afterwards and again on rollback.
+        self.transaction.add_rollback(
+            self.rb_mgr.refresh_workspace_user_counts, [workspace_id], domain_id
         )
 
         if old_workspace_group_id:
-            if old_workspace_group_id != workspace_group_id:
-                self._delete_role_bindings(
-                    workspace_id, domain_id, old_workspace_group_id
-                )
-
-                self._create_role_bindings(
-                    workspace_group_vo.users,
-                    workspace_id,
-                    workspace_group_id,
-                    domain_id,
-                )
-
-                (
-                    workspaces_info,
-                    total_count,
-                ) = self.workspace_mgr.list_workspace_group_workspaces(
-                    old_workspace_group_id,
-                    domain_id,
-                )
-                for workspace_info in workspaces_info:
-                    workspace_vo = self.workspace_mgr.get_workspace(
-                        workspace_info["workspace_id"], domain_id
-                    )
-                    user_rb_ids = self.rb_mgr.stat_role_bindings(
-                        query={
-                            "distinct": "user_id",
-                            "filter": [
-                                {
-                                    "k": "workspace_id",
-                                    "v": workspace_info["workspace_id"],
-                                    "o": "eq",
-                                },
-                                {"k": "domain_id", "v": domain_id, "o": "eq"},
-                            ],
-                        }
-                    ).get("results", [])
-                    user_rb_total_count = len(user_rb_ids)
-
-                    workspace_vo = self.workspace_mgr.update_workspace_by_vo(
-                        {"user_count": user_rb_total_count}, workspace_vo
-                    )
-                    workspace_info.update({"user_count": workspace_vo.user_count})
-            else:
-                is_updatable = False
-        else:
-            workspace_group_dict = workspace_group_vo.to_dict()
-            users = workspace_group_dict.get("users", []) or []
-            user_ids = [user.get("user_id") for user in users]
-            self._delete_role_bindings(workspace_id, domain_id, user_ids=user_ids)
-            self._create_role_bindings(
-                workspace_group_vo.users,
+            self._delete_role_bindings(
                 workspace_id,
-                workspace_group_id,
                 domain_id,
+                old_workspace_group_id,
+                update_user_count=False,
             )
-
-        if is_updatable:
-            workspace_vo.changed_at = datetime.utcnow()
-            self.workspace_mgr.update_workspace_by_vo(
-                {"changed_at": workspace_vo.changed_at}, workspace_vo
+        else:
+            user_ids = [
+                user_info.user_id for user_info in workspace_group_vo.users or []
+            ]
+            self._delete_role_bindings(
+                workspace_id, domain_id, user_ids=user_ids, update_user_count=False
             )
 
-        return is_updatable
+        self._create_role_bindings(
+            workspace_group_vo.users,
+            workspace_id,
+            workspace_group_id,
+            domain_id,
+            update_user_count=False,
+        )
+        self.rb_mgr.refresh_workspace_user_counts([workspace_id], domain_id)
+
+        workspace_vo.changed_at = datetime.utcnow()
+        self.workspace_mgr.update_workspace_by_vo(
+            {"changed_at": workspace_vo.changed_at}, workspace_vo
+        )
+
+        return True
 
     def _remove_workspace_from_group_with_workspace_vo(
         self, workspace_vo: Workspace, old_workspace_group_id: str, domain_id: str
@@ -607,18 +576,7 @@ class WorkspaceService(BaseService):
         workspace_vo.changed_at = datetime.utcnow()
         workspace_vo.workspace_group_id = None
 
-        user_rb_ids = self.rb_mgr.stat_role_bindings(
-            query={
-                "distinct": "user_id",
-                "filter": [
-                    {"k": "workspace_id", "v": workspace_id, "o": "eq"},
-                    {"k": "domain_id", "v": domain_id, "o": "eq"},
-                ],
-            }
-        ).get("results", [])
-        self._delete_role_bindings(
-            workspace_id, domain_id, old_workspace_group_id, user_rb_ids
-        )
+        self._delete_role_bindings(workspace_id, domain_id, old_workspace_group_id)
 
         self.workspace_mgr.update_workspace_by_vo(
             {
@@ -634,16 +592,19 @@ class WorkspaceService(BaseService):
         domain_id: str,
         existing_workspace_group_id: str = None,
         user_ids: List[str] = None,
+        update_user_count: bool = True,
     ):
-        rb_vos = self.rb_mgr.filter_role_bindings(
-            workspace_id=workspace_id,
-            domain_id=domain_id,
-            workspace_group_id=existing_workspace_group_id,
-            user_id=user_ids,
-        )
-        for rb_vo in rb_vos:
-            self.rb_mgr.delete_role_binding_by_vo(rb_vo)
-            self._update_workspace_user_count(rb_vo.workspace_id, rb_vo.domain_id)
+        conditions = {
+            "workspace_id": workspace_id,
+            "domain_id": domain_id,
+            "workspace_group_id": existing_workspace_group_id,
+        }
+
+        if user_ids is not None:
+            conditions["user_id"] = user_ids
+
+        rb_vos = self.rb_mgr.filter_role_bindings(**conditions)
+        self.rb_mgr.delete_role_bindings(rb_vos, update_user_count=update_user_count)
 
     @staticmethod
     def _create_role_bindings(
@@ -651,45 +612,16 @@ class WorkspaceService(BaseService):
         workspace_id: str,
         workspace_group_id: str,
         domain_id: str,
+        update_user_count: bool = True,
     ):
         rb_svc = RoleBindingService()
-        for user_info in workspace_group_users or []:
-            rb_svc.create_role_binding(
-                {
-                    "user_id": user_info["user_id"],
-                    "role_id": user_info["role_id"],
-                    "resource_group": "WORKSPACE",
-                    "domain_id": domain_id,
-                    "workspace_group_id": workspace_group_id,
-                    "workspace_id": workspace_id,
-                }
-            )
-
-    def _get_workspace_user_count(self, workspace_id: str, domain_id: str) -> int:
-        user_rb_ids = self.rb_mgr.stat_role_bindings(
-            query={
-                "distinct": "user_id",
-                "filter": [
-                    {"k": "workspace_id", "v": workspace_id, "o": "eq"},
-                    {"k": "domain_id", "v": domain_id, "o": "eq"},
-                ],
-            }
-        ).get("results", [])
-        return len(user_rb_ids)
-
-    def _update_workspace_user_count(self, workspace_id: str, domain_id: str) -> None:
-        if not workspace_id and not domain_id:
-            return
-
-        if workspace_id == "*":
-            return
-
-        workspace_vo = self.workspace_mgr.get_workspace(workspace_id, domain_id)
-
-        if workspace_vo and workspace_vo.workspace_id != "*":
-            user_rb_total_count = self._get_workspace_user_count(
-                workspace_id, domain_id
-            )
-            self.workspace_mgr.update_workspace_by_vo(
-                {"user_count": user_rb_total_count}, workspace_vo
-            )
+        rb_svc.create_workspace_role_bindings(
+            [
+                {"user_id": user_info["user_id"], "role_id": user_info["role_id"]}
+                for user_info in workspace_group_users or []
+            ],
+            [workspace_id],
+            domain_id,
+            workspace_group_id=workspace_group_id,
+            update_user_count=update_user_count,
+        )
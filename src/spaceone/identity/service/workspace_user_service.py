@@ -4,8 +4,6 @@ from typing import Union
 from spaceone.core.service import *
 from spaceone.core.service.utils import *
 
-from spaceone.identity.manager.role_binding_manager import RoleBindingManager
-from spaceone.identity.manager.user_manager import UserManager
 from spaceone.identity.manager.workspace_user_manager import WorkspaceUserManager
 from spaceone.identity.model.workspace_user.request import *
 from spaceone.identity.model.workspace_user.response import *
@@ -75,38 +73,14 @@ class WorkspaceUserService(BaseService):
             UsersSummaryResponse:
         """
 
-        user_mgr = UserManager()
-        rb_mgr = RoleBindingManager()
-        rb_vos = rb_mgr.filter_role_bindings(
-            workspace_id=params.workspace_id, domain_id=params.domain_id
+        users_info, total_count = self.workspace_user_mgr.find_workspace_users(
+            params.domain_id,
+            params.workspace_id,
+            keyword=params.keyword,
+            state=params.state,
+            page=params.page,
         )
-        workspace_user_ids = list(set([rb.user_id for rb in rb_vos]))
-
-        # default query
-        query = {
-            "filter": [
-                {"k": "domain_id", "v": params.domain_id, "o": "eq"},
-                {"k": "user_id", "v": workspace_user_ids, "o": "not_in"},
-            ],
-            "sort": [{"key": "user_id"}],
-            "page": params.page,
-            "only": ["user_id", "name", "state"],
-        }
-
-        # append keyword filter
-        if params.keyword:
-            query["filter_or"] = [
-                {"k": "user_id", "v": params.keyword, "o": "contain"},
-                {"k": "name", "v": params.keyword, "o": "contain"},
-            ]
-
-        # append state filter
-        if params.state:
-            query["filter"].append({"k": "state", "v": params.state, "o": "eq"})
-
-        user_vos, total_count = user_mgr.list_users(query)
-
-        users_info = [user_vo.to_dict() for user_vo in user_vos]
+
         return UsersSummaryResponse(results=users_info, total_count=total_count)
 
     @transaction(